@@ -26,13 +26,19 @@ class AsyncBytesSource(ABC):
     контекстного менеджера.
 
     Методы:
-        read_byte() -> bytes: Асинхронное чтение одного байта.
+        read_byte() -> bytes:                 Асинхронное чтение одного байта.
+        read_chunk(max_bytes) -> bytes:       Асинхронное чтение до max_bytes байтов.
+        read_available() -> bytes:            Асинхронное чтение всех доступных байтов.
 
     Пример использования:
         async with AsyncComPort('COM3', 115200) as source:
             byte = await source.read_byte()
+            chunk = await source.read_available()
     """
 
+    # Размер порции по умолчанию для read_available() (байт)
+    _READ_CHUNK_SIZE: int = 4096
+
     @abstractmethod
     async def read_byte(self) -> bytes:
         """Асинхронно читает один байт из источника.
@@ -47,6 +53,45 @@ class AsyncBytesSource(ABC):
         """
         pass
 
+    async def read_chunk(self, max_bytes: int) -> bytes:
+        """Асинхронно читает из источника от 1 до max_bytes байтов.
+
+        Ожидает появления хотя бы одного байта и возвращает всё, что уже
+        доступно в источнике (но не больше max_bytes). Позволяет обработать
+        за одно пробуждение event loop целую порцию данных вместо одного байта.
+
+        Реализация по умолчанию сводится к read_byte() и возвращает ровно
+        один байт — наследники переопределяют метод для настоящего пакетного
+        чтения.
+
+        Args:
+            max_bytes (int): Максимальное количество байтов для чтения.
+
+        Returns:
+            bytes: Прочитанные байты (длина от 1 до max_bytes).
+
+        Raises:
+            ValueError: Если max_bytes меньше 1.
+            ReadError: Если произошла ошибка чтения.
+        """
+        if max_bytes < 1:
+            raise ValueError(f'max_bytes должен быть положительным, получено {max_bytes}')
+        return await self.read_byte()
+
+    async def read_available(self) -> bytes:
+        """Асинхронно читает все байты, накопленные в источнике.
+
+        Эквивалентно read_chunk() с размером порции по умолчанию
+        `_READ_CHUNK_SIZE`.
+
+        Returns:
+            bytes: Прочитанные байты (не менее одного).
+
+        Raises:
+            ReadError: Если произошла ошибка чтения.
+        """
+        return await self.read_chunk(self._READ_CHUNK_SIZE)
+
     @abstractmethod
     async def __aenter__(self) -> 'AsyncBytesSource':
         """Вход в асинхронный контекстный менеджер."""
@@ -8,6 +8,7 @@ __author__ = 'Roman Romanovskiy'
 # --------------------------------------------------------
 
 from async_mc_controller.byte_source.com_port.utils import get_ComPorts
+from async_mc_controller.byte_source.com_port.serial_protocol import ComPortTransport, SerialReaderProtocol
 from async_mc_controller.byte_source.com_port.com_port import AsyncComPort
 from async_mc_controller.byte_source.com_port.com_port_device import AsyncComPortDevice
 from async_mc_controller.byte_source.com_port.com_port_error import ComPortReadError
@@ -23,6 +24,8 @@ from telega_session.packet_builders import (
 
 __all__ = [
     'get_ComPorts',
+    'ComPortTransport',
+    'SerialReaderProtocol',
     'AsyncComPort',
     'AsyncComPortDevice',
     'ComPortReadError',
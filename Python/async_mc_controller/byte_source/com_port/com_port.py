@@ -12,6 +12,7 @@ from serial import SerialException
 from async_mc_controller.logger import LoggerProtocol, FooLogger
 from async_mc_controller.byte_source.bytes_source import AsyncBytesSource
 from async_mc_controller.byte_source.com_port.com_port_error import ComPortReadError
+from async_mc_controller.byte_source.com_port.serial_protocol import ComPortTransport, SerialReaderProtocol
 
 #########################
 
@@ -22,27 +23,38 @@ class AsyncComPort(AsyncBytesSource):
     """Асинхронный класс для работы с COM-портом.
 
     Использует pyserial-asyncio для нативного асинхронного чтения байтов.
+    Транспорт выбирается параметром transport:
+        STREAM   — open_serial_connection, чтение через StreamReader.read;
+        PROTOCOL — create_serial_connection с SerialReaderProtocol: порции
+                   от драйвера попадают в цикл чтения без промежуточного
+                   буфера StreamReader, а при отставании декодера чтение
+                   из порта приостанавливается (pause_reading/resume_reading).
 
     Attributes:
-        _port_name (str):                   Имя используемого COM-порта.
-        _baudrate (int):                    Скорость работы порта.
-        _port_reader (StreamReader | None): Поток чтения из порта.
-        _port_writer (StreamWriter | None): Поток записи в порт.
+        _port_name (str):                           Имя используемого COM-порта.
+        _baudrate (int):                            Скорость работы порта.
+        _transport_type (ComPortTransport):         Выбранный транспорт.
+        _port_reader (StreamReader | None):         Поток чтения из порта (STREAM).
+        _port_writer (StreamWriter | None):         Поток записи в порт (STREAM).
+        _protocol (SerialReaderProtocol | None):    Протокол порта (PROTOCOL).
 
     Пример использования:
         async with AsyncComPort('COM3', 115200) as port:
             await port.reading_loop()
     """
 
-    def __init__(self, port_name: str, baudrate: int):
+    def __init__(self, port_name: str, baudrate: int,
+                 transport: ComPortTransport = ComPortTransport.STREAM):
         # Зададим логгер модуля
         self._com_port_logger: LoggerProtocol = FooLogger()
 
         self._port_name: str = port_name    # Имя используемого COM-порта
         self._baudrate: int = baudrate      # Скорость работы порта
+        self._transport_type: ComPortTransport = transport
 
         self._port_reader: Optional[asyncio.StreamReader] = None    # Поток чтения
         self._port_writer: Optional[asyncio.StreamWriter] = None    # Поток записи
+        self._protocol: Optional[SerialReaderProtocol] = None       # Протокол порта
 
         self._reading_task: Optional[asyncio.Task] = None           # Задача цикла чтения
 
@@ -62,16 +74,28 @@ class AsyncComPort(AsyncBytesSource):
                 секунд (зависание драйвера) или при ошибке последовательного
                 порта (неверное имя, занят другим процессом и т.п.).
         """
-        self._com_port_logger.info(f'Подключение порта {self._port_name} ({self._baudrate} бод)')
+        self._com_port_logger.info(f'Подключение порта {self._port_name} ({self._baudrate} бод, '
+                                   f'транспорт {self._transport_type.name})')
 
         try:
-            self._port_reader, self._port_writer = await asyncio.wait_for(
-                serial_asyncio.open_serial_connection(
-                    url=self._port_name,
-                    baudrate=self._baudrate
-                ),
-                timeout=_SETUP_TIMEOUT
-            )
+            if self._transport_type == ComPortTransport.PROTOCOL:
+                _, self._protocol = await asyncio.wait_for(
+                    serial_asyncio.create_serial_connection(
+                        asyncio.get_running_loop(),
+                        SerialReaderProtocol,
+                        url=self._port_name,
+                        baudrate=self._baudrate
+                    ),
+                    timeout=_SETUP_TIMEOUT
+                )
+            else:
+                self._port_reader, self._port_writer = await asyncio.wait_for(
+                    serial_asyncio.open_serial_connection(
+                        url=self._port_name,
+                        baudrate=self._baudrate
+                    ),
+                    timeout=_SETUP_TIMEOUT
+                )
             self._com_port_logger.info(f'Успешное подключение к порту {self._port_name}')
 
             # Запуск цикла чтения данных
@@ -100,6 +124,14 @@ class AsyncComPort(AsyncBytesSource):
                 await self._port_writer.wait_closed()
                 self._com_port_logger.info(f'Порт {self._port_name} закрыт')
 
+            if self._protocol is not None:
+                self._protocol.close()
+                await self._protocol.wait_closed()
+                self._com_port_logger.info(
+                    f'Порт {self._port_name} закрыт (приостановок чтения: {self._protocol.num_pauses}, '
+                    f'максимум в буфере: {self._protocol.max_buffered} байт)'
+                )
+
             # Завершение чтения данных
             if self._reading_task is not None and not self._reading_task.done():
                 self._com_port_logger.debug(f'Остановка чтения из порта {self._port_name}')
@@ -129,23 +161,69 @@ class AsyncComPort(AsyncBytesSource):
         Returns:
             bytes: Один прочитанный байт.
 
+        Raises:
+            ComPortReadError: При ошибке чтения или потере соединения.
+        """
+        return await self._read(1)
+
+    async def read_chunk(self, max_bytes: int) -> bytes:
+        """Асинхронное чтение порции байтов из COM-порта.
+
+        StreamReader.read(n) и SerialReaderProtocol.read(n) возвращают
+        управление, как только появляется хотя бы один байт, и отдают всё
+        накопленное (не больше n). Поэтому за одно пробуждение event loop
+        забирается всё содержимое буфера ОС, а не один байт.
+
+        Args:
+            max_bytes (int): Максимальное количество байтов для чтения.
+
+        Returns:
+            bytes: Прочитанные байты (длина от 1 до max_bytes).
+
+        Raises:
+            ValueError: Если max_bytes меньше 1.
+            ComPortReadError: При ошибке чтения или потере соединения.
+        """
+        if max_bytes < 1:
+            raise ValueError(f'max_bytes должен быть положительным, получено {max_bytes}')
+        return await self._read(max_bytes)
+
+    async def _read(self, max_bytes: int) -> bytes:
+        """Чтение до max_bytes байтов через выбранный транспорт.
+
         Raises:
             ComPortReadError: При ошибке чтения или потере соединения.
         """
         try:
-            data = await self._port_reader.read(1)
-            if not data:
-                raise ComPortReadError('Соединение с COM-портом разорвано')
+            if self._protocol is not None:
+                data = await self._protocol.read(max_bytes)
+                if not data:
+                    raise ComPortReadError('Соединение с COM-портом разорвано',
+                                           original_exception=self._protocol.close_exception)
+            else:
+                data = await self._port_reader.read(max_bytes)
+                if not data:
+                    raise ComPortReadError('Соединение с COM-портом разорвано')
             return data
         except SerialException as err:
             self._com_port_logger.error(f'Ошибка чтения из порта {self._port_name}: {err}')
             raise ComPortReadError(f'Ошибка последовательного порта: {err}', original_exception=err)
 
+    async def _write(self, data: bytes) -> None:
+        """Запись байтов в порт через выбранный транспорт с ожиданием drain."""
+        if self._protocol is not None:
+            self._protocol.write(data)
+            await self._protocol.drain()
+        else:
+            self._port_writer.write(data)
+            await self._port_writer.drain()
+
     async def _reading_loop(self) -> None:
         """Основной цикл чтения байтов из COM-порта.
 
-        Читает байты в бесконечном цикле и эмиттит сигнал NEW_BYTE в шину
-        для каждого полученного байта. При перехвате ComPortReadError
+        Читает порции байтов в бесконечном цикле (всё, что накопилось
+        в буфере порта к моменту пробуждения) и передаёт каждую порцию
+        в new_bytes_callback. При перехвате ComPortReadError
         (физический обрыв соединения, ошибка последовательного порта)
         эмиттит READ_ERROR с исключением в качестве аргумента и завершается
         штатно — без проброса исключения наружу. Реакцию на ошибку
@@ -155,14 +233,25 @@ class AsyncComPort(AsyncBytesSource):
         self._com_port_logger.debug(f'Запуск цикла чтения из порта {self._port_name}')
         try:
             while True:
-                bt = await self.read_byte()
-                await self.new_byte_callback(bt)
+                chunk = await self.read_available()
+                await self.new_bytes_callback(chunk)
         except ComPortReadError as err:
             self._com_port_logger.error(
                 f'Прерывание цикла чтения из порта {self._port_name}: {err}'
             )
             await self.read_error_callback(err)
 
+    async def new_bytes_callback(self, chunk: bytes) -> None:
+        """Отработка получения порции байтов из порта.
+
+        По умолчанию вызывает new_byte_callback для каждого байта порции.
+        Наследники могут переопределить метод для обработки порции целиком.
+
+        Args:
+            chunk (bytes): Прочитанные байты.
+        """
+        for i in range(len(chunk)):
+            await self.new_byte_callback(chunk[i:i + 1])
 
     @abstractmethod
     async def new_byte_callback(self, bt: bytes) -> None:
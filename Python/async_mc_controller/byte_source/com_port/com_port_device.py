@@ -10,6 +10,7 @@ from async_mc_controller.signal_bus import McBus
 from async_mc_controller.logger import McLogger
 from async_mc_controller.byte_source.com_port.com_port import AsyncComPort
 from async_mc_controller.byte_source.com_port.com_port_error import ComPortReadError
+from async_mc_controller.byte_source.com_port.serial_protocol import ComPortTransport
 
 #########################
 
@@ -42,8 +43,9 @@ class AsyncComPortDevice(AsyncComPort):
     _heartbeat_req_command: Optional[bytes] = None
 
     def __init__(self, port_name: str, baudrate: int,
-                 bus: McBus, mc_logger: McLogger):
-        super().__init__(port_name, baudrate)
+                 bus: McBus, mc_logger: McLogger,
+                 transport: ComPortTransport = ComPortTransport.STREAM):
+        super().__init__(port_name, baudrate, transport)
 
         self._bus = bus
 
@@ -273,8 +275,7 @@ class AsyncComPortDevice(AsyncComPort):
             command (bytes): Команда для отправки на плату МК.
         """
         self._device_logger.debug(f'Отправка команды {command}')
-        self._port_writer.write(command)
-        await self._port_writer.drain()
+        await self._write(command)
 
     async def _send_command_with_ack(self, command: bytes) -> None:
         """Отправка команды с ожиданием подтверждения от МК.
@@ -310,8 +311,7 @@ class AsyncComPortDevice(AsyncComPort):
             await self._bus.command_sent.emit()
 
             self._device_logger.debug(f'Отправка команды с подтверждением {command}')
-            self._port_writer.write(command)
-            await self._port_writer.drain()
+            await self._write(command)
 
             try:
                 await asyncio.wait_for(
@@ -326,6 +326,13 @@ class AsyncComPortDevice(AsyncComPort):
                 self._stop_flag = True
                 await self._bus.command_ack_timeout.emit()
 
+    async def new_bytes_callback(self, chunk: bytes) -> None:
+        """Отработка получения порции байтов из порта.
+
+        Эмитирование сигнала new_bytes для всей порции сразу.
+        """
+        await self._bus.new_bytes.emit(memoryview(chunk))
+
     async def new_byte_callback(self, bt: bytes) -> None:
         """Отработка получения нового байта из порта.
 
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""Транспорт COM-порта на asyncio.Protocol.
+
+Альтернатива паре StreamReader/StreamWriter из open_serial_connection:
+serial_asyncio.create_serial_connection передаёт прочитанные драйвером
+порции прямо в data_received, а они без копирования складываются в очередь
+порций. Чтение забирает все накопленные порции за одно пробуждение; если
+порция одна — она отдаётся как есть, без склейки.
+
+Обратное давление: когда в очереди накопилось больше high_water байтов
+(декодер не успевает), чтение из порта приостанавливается через
+transport.pause_reading() и возобновляется, когда очередь опустеет до
+low_water. Данные при этом копятся в буфере драйвера ОС, а не в памяти
+процесса.
+
+Классы:
+    ComPortTransport:     Перечисление транспортов AsyncComPort.
+    SerialReaderProtocol: Протокол приёма и отправки данных COM-порта.
+"""
+
+# System imports
+import asyncio
+from collections import deque
+from enum import Enum
+from typing import Optional
+
+# External imports
+
+# User imports
+
+#########################
+
+_HIGH_WATER: int = 256 * 1024   # Порог приостановки чтения из порта (байт)
+_LOW_WATER: int = 64 * 1024     # Порог возобновления чтения (байт)
+
+
+class ComPortTransport(Enum):
+    """Способ получения данных из COM-порта."""
+    STREAM = 1      # open_serial_connection + StreamReader/StreamWriter
+    PROTOCOL = 2    # create_serial_connection + SerialReaderProtocol
+
+# ------------------------------------------
+
+class SerialReaderProtocol(asyncio.Protocol):
+    """Протокол COM-порта с очередью порций и управлением потоком.
+
+    Attributes:
+        num_pauses (int):    Сколько раз чтение приостанавливалось по high_water.
+        max_buffered (int):  Максимальный объём непрочитанных данных (байт).
+    """
+
+    def __init__(self, high_water: int = _HIGH_WATER, low_water: int = _LOW_WATER):
+        if not 0 <= low_water < high_water:
+            raise ValueError(f'Ожидается 0 <= low_water < high_water, получено {low_water}, {high_water}')
+
+        self._high_water: int = high_water
+        self._low_water: int = low_water
+
+        self._transport: Optional[asyncio.Transport] = None
+        self._chunks: deque[bytes] = deque()    # Непрочитанные порции
+        self._buffered: int = 0                 # Объём непрочитанных порций (байт)
+        self._data_event: asyncio.Event = asyncio.Event()
+
+        self._reading_paused: bool = False
+        self._writing_paused: bool = False
+        self._drain_waiter: Optional[asyncio.Future] = None
+
+        self._closed_event: asyncio.Event = asyncio.Event()
+        self._close_exc: Optional[Exception] = None
+
+        self.num_pauses: int = 0
+        self.max_buffered: int = 0
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed_event.is_set()
+
+    @property
+    def close_exception(self) -> Optional[Exception]:
+        """Исключение, с которым было потеряно соединение (None при штатном закрытии)."""
+        return self._close_exc
+
+    # =============================================================
+    # ================= Методы asyncio.Protocol ===================
+    # =============================================================
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self._transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        """Порция от драйвера сохраняется без копирования."""
+        self._chunks.append(data)
+        self._buffered += len(data)
+        if self._buffered > self.max_buffered:
+            self.max_buffered = self._buffered
+        self._data_event.set()
+
+        if not self._reading_paused and self._buffered >= self._high_water:
+            self._reading_paused = True
+            self.num_pauses += 1
+            self._transport.pause_reading()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._close_exc = exc
+        self._closed_event.set()
+        self._data_event.set()
+        self._wake_drain_waiter(exc)
+
+    def pause_writing(self) -> None:
+        self._writing_paused = True
+
+    def resume_writing(self) -> None:
+        self._writing_paused = False
+        self._wake_drain_waiter(None)
+
+    # =============================================================
+    # ===================== Публичные методы ======================
+    # =============================================================
+
+    async def read(self, max_bytes: int) -> bytes:
+        """Ожидает данные и возвращает до max_bytes накопленных байтов.
+
+        Returns:
+            bytes: Прочитанные байты; пустая строка — соединение закрыто.
+        """
+        while not self._chunks:
+            if self.is_closed:
+                return b''
+            self._data_event.clear()
+            await self._data_event.wait()
+
+        chunks = self._chunks
+        if len(chunks[0]) >= max_bytes:
+            # Первая порция покрывает запрос целиком
+            first = chunks.popleft()
+            data = first[:max_bytes]
+            if len(first) > max_bytes:
+                chunks.appendleft(first[max_bytes:])
+        elif len(chunks) == 1:
+            data = chunks.popleft()
+        else:
+            parts = []
+            size = 0
+            while chunks and size + len(chunks[0]) <= max_bytes:
+                part = chunks.popleft()
+                parts.append(part)
+                size += len(part)
+            data = b''.join(parts)
+
+        self._buffered -= len(data)
+        if self._reading_paused and self._buffered <= self._low_water and not self.is_closed:
+            self._reading_paused = False
+            self._transport.resume_reading()
+        return data
+
+    def write(self, data: bytes) -> None:
+        self._transport.write(data)
+
+    async def drain(self) -> None:
+        """Ожидание освобождения буфера записи транспорта."""
+        if self.is_closed:
+            raise ConnectionResetError('Соединение с COM-портом закрыто')
+        if not self._writing_paused:
+            return
+        self._drain_waiter = asyncio.get_running_loop().create_future()
+        await self._drain_waiter
+
+    def close(self) -> None:
+        if self._transport is not None and not self.is_closed:
+            self._transport.close()
+
+    async def wait_closed(self) -> None:
+        await self._closed_event.wait()
+
+    # =============================================================
+    # =================== Внутренняя логика =======================
+    # =============================================================
+
+    def _wake_drain_waiter(self, exc: Optional[Exception]) -> None:
+        waiter = self._drain_waiter
+        self._drain_waiter = None
+        if waiter is None or waiter.done():
+            return
+        if exc is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(exc)
@@ -0,0 +1,24 @@
+"""
+Пакет для воспроизведения записанных бинарных файлов как источника байтов
+"""
+
+__version__ = '1.0.0'
+__author__ = 'Roman Romanovskiy'
+
+# --------------------------------------------------------
+
+from async_mc_controller.byte_source.file.file_error import FileReadError, EndOfFileError
+from async_mc_controller.byte_source.file.file_source import AsyncFileBytesSource, ReplayMode
+from async_mc_controller.byte_source.file.file_setting import AsyncFileBytesSourceSetting
+
+# --------------------------------------------------------
+
+__all__ = [
+    'FileReadError',
+    'EndOfFileError',
+    'AsyncFileBytesSource',
+    'ReplayMode',
+    'AsyncFileBytesSourceSetting',
+]
+
+# --------------------------------------------------------
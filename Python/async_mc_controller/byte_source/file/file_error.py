@@ -0,0 +1,23 @@
+# System imports
+
+# External imports
+
+# User imports
+from async_mc_controller.byte_source.read_error import ReadError
+
+#########################
+
+
+class FileReadError(ReadError):
+    """Ошибка чтения из файла-источника."""
+    pass
+
+
+class EndOfFileError(FileReadError):
+    """Достигнут конец воспроизводимого файла.
+
+    Штатное завершение воспроизведения: эмиттится через READ_ERROR,
+    чтобы Controller остановил сессию тем же путём, что и при обрыве связи.
+    Контроллер отличает его от ошибки по типу и завершает сессию успешно.
+    """
+    pass
@@ -0,0 +1,83 @@
+# System imports
+from pathlib import Path
+from typing import Awaitable, Callable, Optional, Union
+
+# External imports
+
+# User imports
+from async_mc_controller.signal_bus import McBus
+from async_mc_controller.logger import McLogger, LoggerProtocol, FooLogger
+from async_mc_controller.byte_source.bytes_source import AsyncBytesSourceFactory
+from async_mc_controller.byte_source.file.file_source import AsyncFileBytesSource, ReplayMode
+
+#########################
+
+class AsyncFileBytesSourceSetting(AsyncBytesSourceFactory):
+    """Фабрика для воспроизведения записанного бинарного файла.
+
+    В `configure_source()` проверяет, что файл существует, а параметры
+    режима воспроизведения согласованы. `get_bytes_source()` создаёт
+    AsyncFileBytesSource, при необходимости сначала вызывая
+    `configure_source()`.
+    """
+
+    def __init__(self, path: Union[Path, str], bus: McBus, mc_logger: McLogger,
+                 mode: ReplayMode = ReplayMode.FAST,
+                 speed: float = 1.0,
+                 sample_period: Optional[float] = None,
+                 sample_size: int = 1,
+                 stop_at_eof: bool = True,
+                 drain_callback: Optional[Callable[[], Awaitable[None]]] = None,
+                 logger: LoggerProtocol = FooLogger()):
+
+        self._path: Path = Path(path)
+        self._bus: McBus = bus
+        self._mc_logger: McLogger = mc_logger
+        self._logger = logger
+
+        self._mode: ReplayMode = mode
+        self._speed: float = speed
+        self._sample_period: Optional[float] = sample_period
+        self._sample_size: int = sample_size
+        self._stop_at_eof: bool = stop_at_eof
+        self._drain_callback: Optional[Callable[[], Awaitable[None]]] = drain_callback
+
+        self._configured: bool = False
+
+    def configure_source(self) -> None:
+        """Проверка параметров воспроизведения.
+
+        Raises:
+            FileNotFoundError: Если файл не существует.
+            ValueError: Если для режима с паузами не задан период отсчётов
+                или задан неположительный множитель скорости.
+        """
+        if not self._path.is_file():
+            raise FileNotFoundError(f'Файл для воспроизведения {self._path} не найден')
+
+        if self._mode != ReplayMode.FAST and (self._sample_period is None or self._sample_period <= 0):
+            raise ValueError(f'Для режима {self._mode.name} нужен положительный sample_period')
+
+        if self._mode == ReplayMode.SCALED and self._speed <= 0:
+            raise ValueError(f'speed должен быть положительным, получено {self._speed}')
+
+        self._configured = True
+
+    def get_bytes_source(self) -> AsyncFileBytesSource:
+        """Создание AsyncFileBytesSource с выбранными настройками.
+
+        Returns:
+            AsyncFileBytesSource: Готовый к использованию источник.
+        """
+        if not self._configured:
+            self._logger.debug('Источник не настроен — ленивый вызов configure_source()')
+            self.configure_source()
+
+        self._logger.debug(f'Создан AsyncFileBytesSource: {self._path} (режим {self._mode.name})')
+        return AsyncFileBytesSource(self._path, self._bus, self._mc_logger,
+                                    mode=self._mode,
+                                    speed=self._speed,
+                                    sample_period=self._sample_period,
+                                    sample_size=self._sample_size,
+                                    stop_at_eof=self._stop_at_eof,
+                                    drain_callback=self._drain_callback)
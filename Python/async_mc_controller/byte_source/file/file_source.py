@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""Источник байтов, воспроизводящий записанный бинарный файл.
+
+AsyncFileBytesSource подменяет COM-порт в McSession(decoder, byte_source, controller):
+читает сырой поток, записанный DecoderTelega.setup_bin_file, порциями и
+эмиттит их сигналом NEW_BYTES. Позволяет повторяемо прогонять цепочку
+декодер → шина → контроллер → IPC без подключённого МК.
+
+Режимы воспроизведения (ReplayMode):
+    FAST     — максимально быстро, без пауз.
+    REALTIME — с исходной скоростью потока (sample_size байт за sample_period сек).
+    SCALED   — в speed раз быстрее (или медленнее) исходной скорости.
+"""
+
+# System imports
+import asyncio
+import logging
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Awaitable, BinaryIO, Callable, Optional, Union
+
+# External imports
+
+# User imports
+from async_mc_controller.signal_bus import McBus
+from async_mc_controller.logger import McLogger
+from async_mc_controller.byte_source.bytes_source import AsyncBytesSource
+from async_mc_controller.byte_source.file.file_error import FileReadError, EndOfFileError
+
+#########################
+
+_PACING_INTERVAL: float = 0.01      # Шаг выдачи порций в режимах с паузами (сек)
+
+
+class ReplayMode(Enum):
+    FAST = 1        # Без пауз
+    REALTIME = 2    # С исходной скоростью потока
+    SCALED = 3      # С исходной скоростью, умноженной на speed
+
+# ------------------------------------------
+
+class AsyncFileBytesSource(AsyncBytesSource):
+    """Асинхронный источник байтов, воспроизводящий бинарный файл.
+
+    Цикл чтения запускается в __aenter__ и эмиттит каждую порцию
+    сигналом NEW_BYTES — так же, как AsyncComPortDevice. В режимах
+    REALTIME и SCALED порция выдаётся в момент, когда её последний байт
+    пришёл бы от МК; время отсчитывается по time.monotonic() от начала
+    воспроизведения, поэтому погрешность пауз не накапливается.
+
+    По достижении конца файла при stop_at_eof=True эмиттится READ_ERROR
+    с EndOfFileError, и Controller завершает сессию тем же путём, что и
+    при ошибке чтения, но по типу исключения отличает штатный конец
+    воспроизведения от сбоя. Перед этим ожидается drain_callback
+    (например, BaseDecoder.wait_idle), чтобы сессия не завершилась
+    раньше, чем будут обработаны уже переданные байты. При
+    stop_at_eof=False цикл просто завершается — дождаться его можно
+    через wait_finished().
+
+    Чтение файла синхронное: порции малы, а локальный диск отвечает
+    быстрее, чем стоит передача задачи в поток.
+
+    Attributes:
+        _path (Path):               Воспроизводимый файл.
+        _mode (ReplayMode):         Режим воспроизведения.
+        _byte_rate (float | None):  Скорость выдачи байтов (байт/сек), None для FAST.
+        _chunk_size (int):          Максимальный размер одной порции.
+
+    Пример использования:
+        source = AsyncFileBytesSource(path, bus, mc_logger, ReplayMode.REALTIME,
+                                      sample_period=0.01, sample_size=41)
+        async with McSession(decoder, source, controller):
+            await controller.running()
+    """
+
+    def __init__(self, path: Union[Path, str], bus: McBus, mc_logger: McLogger,
+                 mode: ReplayMode = ReplayMode.FAST,
+                 speed: float = 1.0,
+                 sample_period: Optional[float] = None,
+                 sample_size: int = 1,
+                 chunk_size: int = AsyncBytesSource._READ_CHUNK_SIZE,
+                 stop_at_eof: bool = True,
+                 drain_callback: Optional[Callable[[], Awaitable[None]]] = None):
+        """
+        Args:
+            path:           Путь к бинарному файлу.
+            bus:            Шина сигналов.
+            mc_logger:      Логгер пакета.
+            mode:           Режим воспроизведения.
+            speed:          Множитель скорости для ReplayMode.SCALED.
+            sample_period:  Период следования отсчётов в исходном потоке (сек).
+                            Обязателен для REALTIME и SCALED.
+            sample_size:    Количество байтов потока на один отсчёт.
+            chunk_size:     Максимальный размер порции (байт).
+            stop_at_eof:    Эмиттить ли READ_ERROR(EndOfFileError) в конце файла.
+            drain_callback: Ожидается в конце файла перед эмиссией READ_ERROR.
+
+        Raises:
+            ValueError: При некорректных параметрах воспроизведения.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size должен быть положительным, получено {chunk_size}')
+        if sample_size < 1:
+            raise ValueError(f'sample_size должен быть положительным, получено {sample_size}')
+        if mode == ReplayMode.SCALED and speed <= 0:
+            raise ValueError(f'speed должен быть положительным, получено {speed}')
+        if mode != ReplayMode.FAST and (sample_period is None or sample_period <= 0):
+            raise ValueError(f'Для режима {mode.name} нужен положительный sample_period')
+
+        self._path: Path = Path(path)
+        self._bus: McBus = bus
+        self._file_logger: logging.Logger = mc_logger.get_child_logger("FileSource")
+
+        self._mode: ReplayMode = mode
+        self._byte_rate: Optional[float] = None
+        if mode != ReplayMode.FAST:
+            scale = speed if mode == ReplayMode.SCALED else 1.0
+            self._byte_rate = sample_size / sample_period * scale
+
+        # В режимах с паузами порция — байты за _PACING_INTERVAL, чтобы поток не шёл рывками
+        self._chunk_size: int = chunk_size
+        if self._byte_rate is not None:
+            self._chunk_size = max(1, min(chunk_size, int(self._byte_rate * _PACING_INTERVAL)))
+
+        self._stop_at_eof: bool = stop_at_eof
+        self._drain_callback: Optional[Callable[[], Awaitable[None]]] = drain_callback
+
+        self._file: Optional[BinaryIO] = None
+        self._reading_task: Optional[asyncio.Task] = None
+        self._finished_event: asyncio.Event = asyncio.Event()
+
+        # Статистика воспроизведения
+        self._bytes_emitted: int = 0
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def __str__(self) -> str:
+        elapsed = self.elapsed
+        rate = self._bytes_emitted / elapsed if elapsed > 0 else 0.0
+        return (
+            f'🔍 Информация о {self.__class__.__name__}:\n'
+            f'| Файл:                                {self._path}\n'
+            f'| Режим воспроизведения:               {self._mode.name}\n'
+            f'| Передано байтов:                     {self._bytes_emitted}\n'
+            f'| Время воспроизведения, с:            {elapsed:.3f}\n'
+            f'| Скорость, байт/с:                    {rate:.0f}\n'
+            f'| -----------------------------------------------\n'
+        )
+
+    @property
+    def bytes_emitted(self) -> int:
+        """Количество байтов, переданных в шину."""
+        return self._bytes_emitted
+
+    @property
+    def elapsed(self) -> float:
+        """Длительность воспроизведения (сек): до конца файла или до текущего момента."""
+        if self._started_at is None:
+            return 0.0
+        finished_at = self._finished_at if self._finished_at is not None else time.monotonic()
+        return finished_at - self._started_at
+
+    # =============================================================
+    # ======= Методы для работы в контекстном менеджере ===========
+    # =============================================================
+
+    async def __aenter__(self) -> 'AsyncFileBytesSource':
+        """Открытие файла, подписка на сигналы остановки и запуск цикла воспроизведения.
+
+        Raises:
+            FileReadError: Если файл не удалось открыть.
+        """
+        self._file_logger.info(f'Открытие файла {self._path} (режим {self._mode.name})')
+        try:
+            self._file = open(self._path, 'rb')
+        except OSError as err:
+            self._file_logger.error(f'Ошибка открытия файла {self._path}: {err}')
+            raise FileReadError(f'Ошибка открытия файла: {err}', original_exception=err)
+
+        self._bus.stop_executing.subscribe(self)
+        self._bus.interrupt_measuring.subscribe(self)
+
+        self._finished_event.clear()
+        if self._reading_task is None or self._reading_task.done():
+            self._reading_task = asyncio.create_task(self._reading_loop())
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Остановка цикла воспроизведения и закрытие файла."""
+        self._bus.stop_executing.unsubscribe(self)
+        self._bus.interrupt_measuring.unsubscribe(self)
+
+        await self._cancel_reading()
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_logger.info(f'Файл {self._path} закрыт')
+
+        self._file_logger.debug(str(self))
+        return False
+
+    # =============================================================
+    # =================== Обработчики сигналов ====================
+    # =============================================================
+
+    async def on_stop_executing(self) -> None:
+        """Обработчик сигнала STOP_EXECUTING — остановка воспроизведения."""
+        await self._cancel_reading()
+
+    async def on_interrupt_measuring(self) -> None:
+        """Обработчик сигнала INTERRUPT_MEASURING — остановка воспроизведения."""
+        await self._cancel_reading()
+
+    # =============================================================
+    # ===================== Публичные методы ======================
+    # =============================================================
+
+    async def read_byte(self) -> bytes:
+        """Асинхронное чтение одного байта из файла.
+
+        Raises:
+            EndOfFileError: Если достигнут конец файла.
+            FileReadError: При ошибке чтения.
+        """
+        return await self.read_chunk(1)
+
+    async def read_chunk(self, max_bytes: int) -> bytes:
+        """Асинхронное чтение до max_bytes байтов из файла.
+
+        Args:
+            max_bytes (int): Максимальное количество байтов для чтения.
+
+        Returns:
+            bytes: Прочитанные байты (длина от 1 до max_bytes).
+
+        Raises:
+            ValueError: Если max_bytes меньше 1.
+            EndOfFileError: Если достигнут конец файла.
+            FileReadError: Если файл не открыт или произошла ошибка чтения.
+        """
+        if max_bytes < 1:
+            raise ValueError(f'max_bytes должен быть положительным, получено {max_bytes}')
+        if self._file is None:
+            raise FileReadError(f'Файл {self._path} не открыт')
+        try:
+            data = self._file.read(max_bytes)
+        except OSError as err:
+            self._file_logger.error(f'Ошибка чтения файла {self._path}: {err}')
+            raise FileReadError(f'Ошибка чтения файла: {err}', original_exception=err)
+        if not data:
+            raise EndOfFileError(f'Достигнут конец файла {self._path}')
+        return data
+
+    async def read_available(self) -> bytes:
+        """Чтение очередной порции воспроизведения (размер зависит от режима)."""
+        return await self.read_chunk(self._chunk_size)
+
+    async def wait_finished(self) -> None:
+        """Ожидание завершения воспроизведения (конец файла, ошибка или остановка)."""
+        await self._finished_event.wait()
+
+    # =============================================================
+    # =================== Внутренняя логика =======================
+    # =============================================================
+
+    async def _reading_loop(self) -> None:
+        """Цикл воспроизведения файла.
+
+        Читает порции, выдерживает паузы согласно режиму и эмиттит
+        NEW_BYTES. В режиме FAST после каждой порции управление отдаётся
+        event loop, чтобы декодер и контроллер успевали обрабатывать данные.
+        """
+        self._file_logger.debug(f'Запуск воспроизведения файла {self._path}')
+        self._started_at = time.monotonic()
+        self._finished_at = None
+        try:
+            while True:
+                chunk = await self.read_available()
+
+                if self._byte_rate is None:
+                    await asyncio.sleep(0)
+                else:
+                    deadline = self._started_at + (self._bytes_emitted + len(chunk)) / self._byte_rate
+                    delay = deadline - time.monotonic()
+                    await asyncio.sleep(delay if delay > 0 else 0)
+
+                await self._bus.new_bytes.emit(memoryview(chunk))
+                self._bytes_emitted += len(chunk)
+
+        except EndOfFileError as err:
+            self._finished_at = time.monotonic()
+            self._file_logger.info(f'Воспроизведение файла {self._path} завершено: '
+                                   f'{self._bytes_emitted} байт за {self.elapsed:.3f} с')
+            if self._stop_at_eof:
+                if self._drain_callback is not None:
+                    await self._drain_callback()
+                await self._bus.read_error.emit(err)
+
+        except FileReadError as err:
+            self._finished_at = time.monotonic()
+            self._file_logger.error(f'Прерывание воспроизведения файла {self._path}: {err}')
+            await self._bus.read_error.emit(err)
+
+        finally:
+            if self._finished_at is None:
+                self._finished_at = time.monotonic()
+            self._finished_event.set()
+
+    async def _cancel_reading(self) -> None:
+        """Отмена цикла воспроизведения, если он ещё идёт."""
+        task = self._reading_task
+        self._reading_task = None
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -33,6 +33,7 @@ class Controller(ABC):
         запуск отслеживания флага _force_stop
         """
         self._bus.package_ready.subscribe(self)
+        self._bus.packages_ready.subscribe(self)
         self._bus.read_error.subscribe(self)
         self._bus.handshake_failed.subscribe(self)
         self._bus.device_lost.subscribe(self)
@@ -48,6 +49,7 @@ class Controller(ABC):
         остановка отслеживания флага _force_stop
         """
         self._bus.package_ready.unsubscribe(self)
+        self._bus.packages_ready.unsubscribe(self)
         self._bus.read_error.unsubscribe(self)
         self._bus.handshake_failed.unsubscribe(self)
         self._bus.device_lost.unsubscribe(self)
@@ -101,6 +103,18 @@ class Controller(ABC):
         """
         ...
 
+    async def on_packages_ready(self, batch: list[Any]) -> None:
+        """Обработчик сигнала PACKAGES_READY.
+
+        По умолчанию передаёт пакеты пачки по одному в on_package_ready.
+        Наследники могут переопределить метод для обработки пачки целиком.
+
+        Args:
+            batch (list): Пакеты, собранные декодером из одной порции байтов.
+        """
+        for data in batch:
+            await self.on_package_ready(data)
+
     async def on_read_error(self, err: ReadError) -> None:
         """Обработчик сигнала READ_ERROR — выставляет _force_stop.
 
@@ -8,6 +8,16 @@
 Доступные модули и классы:
     - decoder_protocol.DecoderProtocol: Протокол декодера.
     - base_decoder.BaseDecoder:         Базовый класс декодера.
+    - base_decoder.DecoderEngine:       Движки разбора потока (FSM / BUFFER).
+    - base_decoder.DecoderPipeline:     Схемы прохождения данных (QUEUED / DIRECT).
+    - base_decoder.OverflowPolicy:      Политики переполнения очередей декодера.
+    - base_decoder.QueueLimit:          Размер очереди декодера и политика переполнения.
+    - sequence_tracker.SequenceTracker: Счётчик разрывов в номерах пакетов.
+    - sequence_tracker.SequenceStats:   Статистика непрерывности номеров пакетов.
+    - columnar_store.ColumnarStore:     Блочное колоночное хранилище декодированных пакетов.
+    - frame_layout.FrameLayout:         Раскладка полей посылки, скомпилированная в struct.Struct.
+    - checksum.ChecksumKind:            Виды контрольных сумм посылок.
+    - protocol_schema.ProtocolSchema:   Декларативная схема протокола (раскладки, dtype, команды).
     - imu_decoder.ImuDecoder:           Основной класс-декодер с конечным автоматом.
     - imu_data_description.ImuData:     Класс для хранения распакованных данных датчика.
 """
@@ -17,15 +27,35 @@ __author__ = 'Roman Romanovskiy'
 
 # --------------------------------------------------------
 
-from async_mc_controller.decoding.base_decoder import BaseDecoder
+from async_mc_controller.decoding.base_decoder import (
+    BaseDecoder,
+    DecoderEngine,
+    DecoderPipeline,
+    Frame,
+    OverflowPolicy,
+    QueueLimit,
+    DEFAULT_BYTE_QUEUE_LIMIT,
+    DEFAULT_PACKAGE_QUEUE_LIMIT,
+)
+from async_mc_controller.decoding.sequence_tracker import SequenceTracker, SequenceStats
+from async_mc_controller.decoding.columnar_store import ColumnarStore, DEFAULT_STORE_LIMIT
 from async_mc_controller.decoding.device_decoder import DeviceDecoder
 from async_mc_controller.decoding.common_data_description import TriaxialData
+from async_mc_controller.decoding.frame_layout import FrameLayout, LayoutField
+from async_mc_controller.decoding.checksum import ChecksumKind, compute_checksum, compute_checksums, verify_frames
+from async_mc_controller.decoding.protocol_schema import ProtocolSchema, PacketSchema, SchemaField
 from async_mc_controller.decoding.utils import (
     bytes_to_uint32,
     bytes_to_int32,
     bytes_to_uint8,
     bytes_to_triaxial,
     bytes_to_float,
+    frame_to_bytes,
+    buffer_to_uint32,
+    buffer_to_int32,
+    buffer_to_uint8,
+    buffer_to_triaxial,
+    buffer_to_float,
 )
 
 
@@ -33,13 +63,39 @@ from async_mc_controller.decoding.utils import (
 
 __all__ = [
     'BaseDecoder',
+    'DecoderEngine',
+    'DecoderPipeline',
+    'Frame',
+    'OverflowPolicy',
+    'QueueLimit',
+    'DEFAULT_BYTE_QUEUE_LIMIT',
+    'DEFAULT_PACKAGE_QUEUE_LIMIT',
+    'SequenceTracker',
+    'SequenceStats',
+    'ColumnarStore',
+    'DEFAULT_STORE_LIMIT',
     'DeviceDecoder',
     'TriaxialData',
+    'FrameLayout',
+    'LayoutField',
+    'ChecksumKind',
+    'compute_checksum',
+    'compute_checksums',
+    'verify_frames',
+    'ProtocolSchema',
+    'PacketSchema',
+    'SchemaField',
     'bytes_to_uint32',
     'bytes_to_int32',
     'bytes_to_uint8',
     'bytes_to_triaxial',
     'bytes_to_float',
+    'frame_to_bytes',
+    'buffer_to_uint32',
+    'buffer_to_int32',
+    'buffer_to_uint8',
+    'buffer_to_triaxial',
+    'buffer_to_float',
 ]
 
 # --------------------------------------------------------
\ No newline at end of file
@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 """Модуль базового асинхронного декодера байтового потока.
 
-Содержит универсальный конечный автомат для разбора байтового потока,
-проверки контрольной суммы и инфраструктуру из двух очередей и двух
-фоновых задач. Не привязан к конкретному протоколу или типу данных.
+Содержит два движка разбора байтового потока (побайтовый конечный автомат
+и буферный движок поиска заголовков), проверку контрольной суммы и
+инфраструктуру из двух ограниченных очередей и двух фоновых задач.
+Не привязан к конкретному протоколу или типу данных.
 
 Классы:
-    Stage:       Перечисление состояний конечного автомата.
-    BaseDecoder: Базовый класс декодера.
+    Stage:          Перечисление состояний конечного автомата.
+    DecoderEngine:  Перечисление движков разбора байтового потока.
+    DecoderPipeline: Перечисление схем передачи байтов и пакетов через декодер.
+    OverflowPolicy: Поведение при переполнении очереди декодера.
+    QueueLimit:     Размер очереди и политика её переполнения.
+    BaseDecoder:    Базовый класс декодера.
 """
 
 # System imports
@@ -15,17 +20,33 @@ import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Coroutine
 from enum import Enum
-from typing import Any, Callable, Generic, Optional, TypeVar
+from typing import Any, Callable, Generic, Iterable, NamedTuple, Optional, TypeAlias, TypeVar, Union
 
 # External imports
+import numpy as np
 
 # User imports
 from async_mc_controller.logger import LoggerProtocol, FooLogger
+from async_mc_controller.decoding.checksum import ChecksumKind, compute_checksum, verify_frames
 
 #############################################
 
 T = TypeVar('T')   # Тип декодированного пакета данных
 
+# Посылка, передаваемая в функцию декодирования: список однобайтовых
+# объектов (движок FSM) или memoryview на непрерывный буфер (движок BUFFER)
+Frame: TypeAlias = Union[list[bytes], memoryview]
+
+# Однобайтовые объекты bytes для всех значений байта — чтобы не создавать их заново
+_SINGLE_BYTES: tuple[bytes, ...] = tuple(bytes([value]) for value in range(256))
+
+# Количество посылок, начиная с которого их CRC проверяется пакетно через NumPy
+# (на меньшем числе накладные расходы NumPy больше выигрыша)
+_CRC_BATCH_MIN: int = 8
+
+# Наибольшее время разбора очереди порций без передачи управления event loop (сек)
+_PROCESSING_SLICE: float = 0.005
+
 # ------------------------------------------
 
 class Stage(Enum):
@@ -38,6 +59,44 @@ class Stage(Enum):
 
 # ------------------------------------------
 
+class DecoderEngine(Enum):
+    """Движки разбора байтового потока."""
+    FSM = 1         # Побайтовый конечный автомат (_byte_processing)
+    BUFFER = 2      # Поиск заголовков в непрерывном буфере с разбором по формату (_buffer_processing)
+
+# ------------------------------------------
+
+class DecoderPipeline(Enum):
+    """Схемы прохождения данных через декодер."""
+    QUEUED = 1      # Порции и пакеты идут через очереди и фоновые задачи
+    DIRECT = 2      # Порция разбирается в обработчике сигнала, пакеты эмиттятся пачкой
+
+# ------------------------------------------
+
+class OverflowPolicy(Enum):
+    """Поведение при попытке положить элемент в заполненную очередь."""
+    BLOCK = 1           # Ждать освобождения места (давление на источник)
+    DROP_OLDEST = 2     # Выбросить самый старый элемент очереди
+    DROP_NEWEST = 3     # Выбросить новый элемент
+
+# ------------------------------------------
+
+class QueueLimit(NamedTuple):
+    """Ограничение очереди декодера.
+
+    Attributes:
+        maxsize (int):           Максимальное число элементов (0 — без ограничения).
+        policy (OverflowPolicy): Поведение при заполненной очереди.
+    """
+    maxsize: int
+    policy: OverflowPolicy = OverflowPolicy.BLOCK
+
+
+DEFAULT_BYTE_QUEUE_LIMIT: QueueLimit = QueueLimit(1024)        # Очередь входящих порций по умолчанию
+DEFAULT_PACKAGE_QUEUE_LIMIT: QueueLimit = QueueLimit(65536)    # Очередь готовых пакетов по умолчанию
+
+# ------------------------------------------
+
 class BaseDecoder(ABC, Generic[T]):
     """Базовый асинхронный декодер байтового потока.
 
@@ -48,10 +107,43 @@ class BaseDecoder(ABC, Generic[T]):
 
     Параметр T задаёт тип декодированного пакета данных, хранящегося в _package_queue.
 
+    Движок разбора выбирается параметром engine:
+        DecoderEngine.FSM:    побайтовый конечный автомат, функции декодирования
+                              получают посылку как list[bytes];
+        DecoderEngine.BUFFER: порции накапливаются в bytearray, заголовок ищется
+                              через bytes.find, формат и длина читаются по
+                              фиксированным смещениям, функции декодирования
+                              получают посылку как memoryview.
+
     Инфраструктура:
-        _byte_queue:    входящие байты → _processing_loop
+        _byte_queue:    входящие порции байтов → _processing_loop
         _package_queue: декодированные пакеты типа T → _package_sending
 
+    Схема прохождения данных выбирается параметром pipeline:
+        DecoderPipeline.QUEUED: порция кладётся в _byte_queue, разбирается
+                                в _processing_loop, каждый пакет проходит
+                                через _package_queue и _package_emitting_loop;
+        DecoderPipeline.DIRECT: порция разбирается прямо в _accept_chunk
+                                (в обработчике сигнала), собранные из неё пакеты
+                                передаются одной пачкой в _packages_sending.
+                                Очереди и фоновые задачи не используются.
+
+    Обе очереди ограничены (byte_queue_limit, package_queue_limit), элементы
+    кладутся в них только через _put_chunk и _put_package. При политике
+    BLOCK заполненная очередь приостанавливает производителя: очередь пакетов
+    тормозит разбор байтов, очередь байтов — источник. При DROP_OLDEST и
+    DROP_NEWEST элемент выбрасывается, а потеря учитывается в счётчиках.
+    Максимальная заполненность очередей и количество выброшенных элементов
+    выводятся в __str__ вместе со статистикой пакетов.
+
+    Приоритетный разбор (_enable_priority_lane): в схеме QUEUED посылки
+    заданных форматов (управляющие — ACK, подтверждения команд) ищутся в
+    каждой порции ещё при приёме, до постановки её в _byte_queue, и сразу
+    передаются в _priority_frame_processing. Так ответ МК обрабатывается,
+    даже если перед ним в очереди скопились тысячи порций данных. Сама
+    порция разбирается затем в обычном порядке, поэтому наследник должен
+    распознать уже обработанную управляющую посылку и не обрабатывать её дважды.
+
     Пример наследования:
         class MyDecoder(BaseDecoder[MyData]):
             _header = [b'\\xAA', b'\\xBB']
@@ -67,19 +159,34 @@ class BaseDecoder(ABC, Generic[T]):
 
     # Заголовок посылки — определяется в наследнике
     _header: Optional[list[bytes]] = None
+    # Вид контрольной суммы посылки
+    _checksum_kind: ChecksumKind = ChecksumKind.SUM8
 
-    def __init__(self, logger: LoggerProtocol = FooLogger):
+    def __init__(self, logger: LoggerProtocol = FooLogger, engine: DecoderEngine = DecoderEngine.FSM,
+                 byte_queue_limit: QueueLimit = DEFAULT_BYTE_QUEUE_LIMIT,
+                 package_queue_limit: QueueLimit = DEFAULT_PACKAGE_QUEUE_LIMIT,
+                 pipeline: DecoderPipeline = DecoderPipeline.QUEUED):
 
         if self._header is None:
             raise RuntimeError('Определите заголовок посылки в наследнике BaseDecoder!')
 
         self._base_decoder_logger: LoggerProtocol = logger  # Сохраним логгер
+        self._engine: DecoderEngine = engine                # Движок разбора потока
+        self._pipeline: DecoderPipeline = pipeline          # Схема прохождения данных
+        self._header_bytes: bytes = b''.join(self._header)  # Заголовок одной строкой для bytes.find
 
-        self._byte_queue: asyncio.Queue[bytes] = asyncio.Queue()    # Очередь входящих байтов
-        self._package_queue: asyncio.Queue[T] = asyncio.Queue()     # Очередь готовых пакетов
+        self._byte_queue_limit: QueueLimit = byte_queue_limit           # Ограничение очереди байтов
+        self._package_queue_limit: QueueLimit = package_queue_limit     # Ограничение очереди пакетов
+
+        # Очередь входящих порций байтов
+        self._byte_queue: asyncio.Queue[bytes] = asyncio.Queue(byte_queue_limit.maxsize)
+        # Очередь готовых пакетов
+        self._package_queue: asyncio.Queue[T] = asyncio.Queue(package_queue_limit.maxsize)
+        # Пакеты, собранные из текущей порции (DecoderPipeline.DIRECT)
+        self._pending_packages: list[T] = []
 
         # Функция декодирования текущего пакета (переключается в Stage.WantFormat)
-        self._decode_func: Callable[[list[bytes]], Coroutine[Any, Any, None]] = self._default_decode_func
+        self._decode_func: Callable[[Frame], Coroutine[Any, Any, None]] = self._default_decode_func
 
         self._stage: Stage = Stage.WantHeader   # Текущая стадия декодера
         self._received_bytes: list[bytes] = []  # Буфер полученных байтов
@@ -87,9 +194,28 @@ class BaseDecoder(ABC, Generic[T]):
         self._data_bt_index: int = 0   # Индекс байта данных в посылке
         self._package_size:  int = 0   # Количество байт данных в посылке
 
+        self._buffer: bytearray = bytearray()   # Буфер необработанных байтов движка BUFFER
+
         self._num_correct_packages: int = 0   # Количество пакетов, полученных без ошибок
         self._num_wrong_packages:   int = 0   # Количество пакетов, полученных с ошибками
         self._num_unknown_packages: int = 0   # Количество пакетов с неизвестным форматом
+        self._num_recovered_packages: int = 0 # Пакеты, найденные внутри посылки с ошибкой CRC
+
+        # Пересинхронизация после ошибки CRC
+        self._resync_depth: int = 0             # Вложенность повторного разбора (движок FSM)
+        self._frame_from_resync: bool = False   # Текущая посылка найдена при повторном разборе
+        self._resync_tail: bool = False         # В буфере автомата хвост посылки с ошибкой CRC
+        self._resync_until: int = 0             # Граница посылки с ошибкой CRC в _buffer (движок BUFFER)
+
+        self._byte_queue_high_water:    int = 0   # Максимальная заполненность очереди байтов
+        self._package_queue_high_water: int = 0   # Максимальная заполненность очереди пакетов
+        self._num_dropped_chunks:   int = 0       # Количество выброшенных порций байтов
+        self._num_dropped_packages: int = 0       # Количество выброшенных пакетов
+
+        # Приоритетный разбор управляющих посылок (см. _enable_priority_lane)
+        self._priority_patterns: tuple[bytes, ...] = ()   # Заголовок с байтом формата управляющих посылок
+        self._priority_tail: bytes = b''                  # Хвост порции, в котором может начинаться посылка
+        self._num_priority_frames: int = 0                # Посылки, разобранные в обход очереди байтов
 
         self._processing_task: Optional[asyncio.Task] = None        # Задача обработки байтов
         self._package_emitting_task: Optional[asyncio.Task] = None  # Задача эмиссии пакетов
@@ -101,6 +227,14 @@ class BaseDecoder(ABC, Generic[T]):
             f'| Количество корректно принятых пакетов данных:     {self._num_correct_packages} из {total}\n'
             f'| Количество пакетов данных, полученных с ошибкой:  {self._num_wrong_packages} из {total}\n'
             f'| Количество пакетов с неизвестным форматом:        {self._num_unknown_packages} из {total}\n'
+            f'| Восстановлено пакетов после ошибки CRC:           {self._num_recovered_packages}\n'
+            f'| Максимум в очереди порций байтов:                 '
+            f'{self._byte_queue_high_water} из {self._limit_str(self._byte_queue_limit)}\n'
+            f'| Максимум в очереди пакетов:                       '
+            f'{self._package_queue_high_water} из {self._limit_str(self._package_queue_limit)}\n'
+            f'| Выброшено порций байтов при переполнении:         {self._num_dropped_chunks}\n'
+            f'| Выброшено пакетов при переполнении:               {self._num_dropped_packages}\n'
+            f'| Управляющих посылок разобрано вне очереди:        {self._num_priority_frames}\n'
             f'| -----------------------------------------------\n'
         )
 
@@ -109,8 +243,15 @@ class BaseDecoder(ABC, Generic[T]):
     # =============================================================
 
     async def __aenter__(self) -> 'BaseDecoder':
-        """Сбрасывает состояние и запускает две фоновые задачи декодера."""
+        """Сбрасывает состояние и запускает две фоновые задачи декодера.
+
+        В схеме DecoderPipeline.DIRECT фоновые задачи не нужны.
+        """
         self._reset()
+        if self._pipeline is DecoderPipeline.DIRECT:
+            self._base_decoder_logger.debug('Декодер работает без фоновых задач (DIRECT)')
+            return self
+
         self._base_decoder_logger.debug('Запуск задач декодера')
         self._processing_task = asyncio.create_task(self._processing_loop())
         self._package_emitting_task = asyncio.create_task(self._package_emitting_loop())
@@ -128,16 +269,56 @@ class BaseDecoder(ABC, Generic[T]):
                     pass
         return False
 
+    # =============================================================
+    # ===================== Публичные методы ======================
+    # =============================================================
+
+    async def wait_idle(self) -> None:
+        """Ожидает, пока декодер обработает все поступившие байты
+        и отправит все готовые пакеты.
+
+        Используется источниками с конечным потоком (воспроизведение файла),
+        чтобы не завершать сессию, пока в очередях остаются данные.
+        """
+        await self._byte_queue.join()
+        await self._package_queue.join()
+
+    @property
+    def num_wrong_packages(self) -> int:
+        """Количество посылок с ошибкой контрольной суммы."""
+        return self._num_wrong_packages
+
+    @property
+    def num_unknown_packages(self) -> int:
+        """Количество посылок с неизвестным форматом."""
+        return self._num_unknown_packages
+
+    @property
+    def num_recovered_packages(self) -> int:
+        """Количество пакетов, найденных внутри посылок с ошибкой контрольной суммы."""
+        return self._num_recovered_packages
+
+    @property
+    def num_dropped_chunks(self) -> int:
+        """Количество порций байтов, выброшенных при переполнении очереди."""
+        return self._num_dropped_chunks
+
+    @property
+    def num_dropped_packages(self) -> int:
+        """Количество пакетов, выброшенных при переполнении очереди."""
+        return self._num_dropped_packages
+
     # =============================================================
     # ================= Абстрактные методы ========================
     # =============================================================
 
     @abstractmethod
-    def _get_decode_func(self, fmt: bytes) -> Optional[Callable[[list[bytes]], Coroutine[Any, Any, None]]]:
+    def _get_decode_func(self, fmt: bytes) -> Optional[Callable[[Frame], Coroutine[Any, Any, None]]]:
         """Возвращает функцию декодирования по байту формата пакета.
 
         Синхронный — сам по себе ничего не ждёт; возвращаемая функция асинхронная.
-        Вызывается в Stage.WantFormat. Если формат неизвестен — вернуть None.
+        Вызывается в Stage.WantFormat (движок FSM) или после нахождения заголовка
+        (движок BUFFER). Если формат неизвестен — вернуть None.
 
         Args:
             fmt (bytes): Байт формата из пакета.
@@ -157,11 +338,40 @@ class BaseDecoder(ABC, Generic[T]):
         """
         ...
 
+    async def _packages_sending(self, batch: list[T]) -> None:
+        """Отправка пачки пакетов, собранных из одной порции (DecoderPipeline.DIRECT).
+
+        По умолчанию отправляет пакеты по одному через _package_sending.
+        Наследники могут переопределить метод для отправки пачки целиком.
+
+        Args:
+            batch (list[T]): Декодированные пакеты в порядке поступления.
+        """
+        for data in batch:
+            await self._package_sending(data)
+
     # =============================================================
     # ========= Реализация конечного автомата для разбора =========
     # ========= бинарного потока данных ===========================
     # =============================================================
     
+    async def _chunk_processing(self, chunk: bytes) -> None:
+        """Обработка порции байтов выбранным движком.
+
+        Для DecoderEngine.FSM прогоняет каждый байт порции через
+        _byte_processing, для DecoderEngine.BUFFER передаёт порцию
+        целиком в _buffer_processing.
+
+        Args:
+            chunk (bytes | memoryview): Порция байтов произвольной длины.
+        """
+        if self._engine is DecoderEngine.BUFFER:
+            await self._buffer_processing(chunk)
+            return
+
+        for value in chunk:
+            await self._byte_processing(_SINGLE_BYTES[value])
+
     async def _byte_processing(self, bt: bytes) -> None:
         """Обработка одного байта конечным автоматом.
 
@@ -175,8 +385,14 @@ class BaseDecoder(ABC, Generic[T]):
             case Stage.WantHeader:
                 if self._received_bytes[-len(self._header):] == self._header:
                     self._stage = Stage.WantFormat
-                    self._received_bytes = self._header.copy()
                     self._data_bt_index = 0
+                    # Заголовок начался внутри посылки с ошибкой CRC: при повторном
+                    # разборе или в сохранённом после неё хвосте
+                    self._frame_from_resync = (self._resync_depth > 0 or
+                                               (self._resync_tail and
+                                                len(self._received_bytes) == len(self._header)))
+                    self._resync_tail = False
+                    self._received_bytes = self._header.copy()
 
             case Stage.WantFormat:
                 decode_func = self._get_decode_func(bt)
@@ -202,17 +418,138 @@ class BaseDecoder(ABC, Generic[T]):
                 if bt == self._count_control_sum(self._received_bytes):
                     await self._decode_func(self._received_bytes)
                     self._num_correct_packages += 1
+                    if self._frame_from_resync:
+                        self._num_recovered_packages += 1
+
+                    self._stage = Stage.WantHeader
+                    self._received_bytes = []
+                    self._data_bt_index = 0
                 else:
                     self._num_wrong_packages += 1
                     self._base_decoder_logger.warning(
                         f'Ошибка контрольной суммы пакета '
                         f'#{self._num_correct_packages + self._num_wrong_packages}'
                     )
+                    await self._resync()
+
+    async def _resync(self) -> None:
+        """Пересинхронизация конечного автомата после ошибки контрольной суммы.
+
+        Настоящий заголовок мог начаться внутри отброшенной посылки
+        (например, если сбой пришёлся на байт длины). Поэтому байты
+        посылки, начиная со второго, ищутся на вхождение заголовка, и с
+        найденного места прогоняются через автомат повторно. Пакеты,
+        собранные при повторном разборе, учитываются в
+        _num_recovered_packages. Если заголовка нет, сохраняется только
+        хвост, в котором может начинаться следующий заголовок.
+        """
+        frame = b''.join(self._received_bytes)
+
+        self._stage = Stage.WantHeader
+        self._received_bytes = []
+        self._data_bt_index = 0
 
-                self._stage = Stage.WantHeader
-                self._received_bytes = []
-                self._data_bt_index = 0
+        start = frame.find(self._header_bytes, 1)
+        if start < 0:
+            tail = frame[len(frame) - len(self._header) + 1:]
+            self._received_bytes = [_SINGLE_BYTES[value] for value in tail]
+            self._resync_tail = bool(tail)
+            return
+
+        self._resync_depth += 1
+        try:
+            for value in frame[start:]:
+                await self._byte_processing(_SINGLE_BYTES[value])
+        finally:
+            self._resync_depth -= 1
             
+    # =============================================================
+    # ========= Буферный движок разбора бинарного потока ==========
+    # =============================================================
+
+    async def _buffer_processing(self, chunk: bytes) -> None:
+        """Обработка порции байтов буферным движком.
+
+        Порция дописывается в _buffer, после чего в буфере последовательно
+        ищутся заголовки посылок через bytes.find. Для каждого найденного
+        заголовка байт формата и байт длины читаются по фиксированным
+        смещениям, а полная посылка передаётся в функцию декодирования как
+        memoryview. Незавершённый хвост остаётся в буфере до следующей порции.
+
+        Посылки нарезаются из неизменяемого снимка буфера, поэтому функции
+        декодирования могут сохранять полученный memoryview.
+
+        Контрольные суммы проверяются не по одной, а пакетами
+        (_check_frames_control_sums): все посылки, размеченные от текущей
+        позиции до конца снимка, проверяются за один вызов, результат
+        запоминается по смещению начала посылки.
+
+        После ошибки контрольной суммы поиск заголовка продолжается со
+        следующего байта за началом отброшенной посылки, а не с её конца:
+        пакеты, найденные внутри неё, учитываются в _num_recovered_packages.
+
+        Args:
+            chunk (bytes): Порция байтов произвольной длины.
+        """
+        self._buffer += chunk
+        data = bytes(self._buffer)
+        view = memoryview(data)
+
+        header = self._header_bytes
+        header_len = len(header)
+        data_len = len(data)
+        pos = 0
+        crc_ok: dict[int, bool] = {}    # Результат проверки CRC по смещению начала посылки
+
+        while True:
+            start = data.find(header, pos)
+            if start < 0:
+                # Сохраним хвост, в котором может начинаться следующий заголовок
+                pos = max(pos, data_len - header_len + 1)
+                break
+
+            # Ждём байты формата и длины
+            if data_len - start < header_len + 2:
+                pos = start
+                break
+
+            fmt = _SINGLE_BYTES[data[start + header_len]]
+            decode_func = self._get_decode_func(fmt)
+            if decode_func is None:
+                self._num_unknown_packages += 1
+                self._base_decoder_logger.warning(f'Неизвестный формат пакета: {fmt}')
+                pos = start + header_len
+                continue
+
+            package_size = self._get_package_size(_SINGLE_BYTES[data[start + header_len + 1]])
+            end = start + header_len + 2 + package_size + 1     # Индекс за байтом контрольной суммы
+            if end > data_len:
+                pos = start
+                break
+
+            frame_ok = crc_ok.get(start)
+            if frame_ok is None:
+                self._check_frames_control_sums(data, start, crc_ok)
+                frame_ok = crc_ok[start]
+
+            if frame_ok:
+                await decode_func(view[start:end])
+                self._num_correct_packages += 1
+                if start < self._resync_until:
+                    self._num_recovered_packages += 1
+                pos = end
+            else:
+                self._num_wrong_packages += 1
+                self._base_decoder_logger.warning(
+                    f'Ошибка контрольной суммы пакета '
+                    f'#{self._num_correct_packages + self._num_wrong_packages}'
+                )
+                self._resync_until = max(self._resync_until, end)
+                pos = start + 1
+
+        del self._buffer[:pos]
+        self._resync_until = max(0, self._resync_until - pos)
+
     @staticmethod
     def _get_package_size(bt: bytes) -> int:
         """ Метод для вычисления размера данных внутри полученного пакета.
@@ -229,12 +566,12 @@ class BaseDecoder(ABC, Generic[T]):
         """
         return int.from_bytes(bt, 'big')
 
-    @staticmethod
-    def _count_control_sum(data_bytes: list[bytes]) -> bytes:
+    @classmethod
+    def _count_control_sum(cls, data_bytes: list[bytes]) -> bytes:
         """Вычисляет контрольную сумму пакета.
         
-        По умолчанию используется обыкновенная сумма всех байтов посылки,
-        приведённая к байту.
+        Вид контрольной суммы задаётся _checksum_kind (по умолчанию сумма
+        всех байтов посылки, приведённая к байту).
         
         Метод может быть переопределён в наследнике под конкретный протокол. 
         
@@ -244,26 +581,294 @@ class BaseDecoder(ABC, Generic[T]):
         Returns:
             bytes: Один байт — вычисленная контрольная сумма.
         """
-        total = 0
-        for b in data_bytes[:-1]:
-            total += int.from_bytes(b, 'big')
-        return bytes([total & 0xFF])
+        return _SINGLE_BYTES[compute_checksum(b''.join(data_bytes[:-1]), cls._checksum_kind)]
+
+    @classmethod
+    def _count_frame_control_sum(cls, frame: memoryview) -> int:
+        """Вычисляет контрольную сумму посылки, лежащей в непрерывном буфере.
+
+        Аналог _count_control_sum для движка BUFFER: контрольная сумма вида
+        _checksum_kind всех байтов посылки, кроме последнего — самой CRC.
+
+        Метод может быть переопределён в наследнике под конкретный протокол.
+
+        Args:
+            frame (memoryview): Вся посылка (включая CRC).
+
+        Returns:
+            int: Вычисленная контрольная сумма (0–255).
+        """
+        return compute_checksum(frame[:-1], cls._checksum_kind)
+
+    def _check_frames_control_sums(self, data: bytes, start: int, crc_ok: dict[int, bool]) -> None:
+        """Пакетная проверка контрольных сумм посылок снимка буфера (движок BUFFER).
+
+        От смещения start посылки размечаются так же, как в _buffer_processing
+        (заголовок, известный формат, байт длины), но без декодирования и
+        счётчиков: каждая следующая ищется за концом предыдущей. Все полные
+        посылки проверяются одним вызовом verify_frames, а при их малом
+        количестве — по одной через _count_frame_control_sum.
+
+        Корректность CRC зависит только от байтов посылки, поэтому результат
+        верен и для посылок, до которых разбор дойдёт иным путём. После ошибки
+        CRC разметка начинается внутри отброшенной посылки и останавливается,
+        как только попадает на уже проверенное начало: дальше цепочка совпадает.
+
+        Наследник, переопределивший _count_frame_control_sum под вид суммы
+        вне ChecksumKind, должен переопределить и этот метод.
+
+        Args:
+            data (bytes):  Снимок буфера.
+            start (int):   Начало первой посылки (заголовок, формат и длина уже проверены).
+            crc_ok (dict): Корректность CRC по смещению начала посылки, дополняется на месте.
+        """
+        header = self._header_bytes
+        header_len = len(header)
+        data_len = len(data)
+        starts: list[int] = []
+        ends: list[int] = []
+        pos = start
+
+        while True:
+            frame_start = data.find(header, pos)
+            if frame_start < 0 or data_len - frame_start < header_len + 2 or frame_start in crc_ok:
+                break
+            if self._get_decode_func(_SINGLE_BYTES[data[frame_start + header_len]]) is None:
+                pos = frame_start + header_len
+                continue
+            package_size = self._get_package_size(_SINGLE_BYTES[data[frame_start + header_len + 1]])
+            frame_end = frame_start + header_len + 2 + package_size + 1
+            if frame_end > data_len:
+                break
+            starts.append(frame_start)
+            ends.append(frame_end)
+            pos = frame_end
+
+        if len(starts) < _CRC_BATCH_MIN:
+            view = memoryview(data)
+            for frame_start, frame_end in zip(starts, ends):
+                frame = view[frame_start:frame_end]
+                crc_ok[frame_start] = frame[-1] == self._count_frame_control_sum(frame)
+            return
+
+        frames_ok = verify_frames(np.frombuffer(data, dtype=np.uint8),
+                                  np.array(starts), np.array(ends), self._checksum_kind)
+        crc_ok.update(zip(starts, frames_ok.tolist()))
+
+    # =============================================================
+    # ========= Приоритетный разбор управляющих посылок ===========
+    # =============================================================
+
+    def _enable_priority_lane(self, formats: Iterable[bytes]) -> None:
+        """Включает приоритетный разбор посылок форматов formats.
+
+        Действует только в схеме DecoderPipeline.QUEUED: в схеме DIRECT
+        порция разбирается сразу при приёме, и очереди, которую нужно
+        обгонять, нет.
+
+        Args:
+            formats (Iterable[bytes]): Байты форматов управляющих посылок.
+        """
+        if self._pipeline is not DecoderPipeline.QUEUED:
+            return
+        formats = tuple(formats)
+        self._priority_patterns = tuple(self._header_bytes + fmt for fmt in formats)
+        self._base_decoder_logger.debug(f'Приоритетный разбор посылок форматов {list(formats)}')
+
+    async def _priority_frame_processing(self, frame: memoryview) -> None:
+        """Обработка управляющей посылки, найденной при приёме порции.
+
+        По умолчанию ничего не делает. Переопределяется наследником,
+        включившим приоритетный разбор.
+
+        Args:
+            frame (memoryview): Вся посылка с верной контрольной суммой.
+        """
+        ...
+
+    async def _priority_scan(self, chunk: bytes) -> None:
+        """Поиск управляющих посылок в порции до постановки её в очередь байтов.
+
+        Ищется сразу заголовок с байтом управляющего формата (bytes.find),
+        поэтому пакеты данных при поиске не перебираются. Найденные полные
+        посылки с верной контрольной суммой передаются в
+        _priority_frame_processing в порядке следования в потоке. Хвост,
+        в котором может начинаться посылка, дописывается к следующей порции.
+
+        Args:
+            chunk (bytes): Порция полученных байтов.
+        """
+        data = self._priority_tail + chunk if self._priority_tail else chunk
+        data_len = len(data)
+        prefix_len = len(self._header_bytes) + 2
+
+        starts: list[int] = []
+        for pattern in self._priority_patterns:
+            start = data.find(pattern)
+            while start >= 0:
+                starts.append(start)
+                start = data.find(pattern, start + 1)
+        if len(self._priority_patterns) > 1:
+            starts.sort()
+
+        view = memoryview(data)
+        pos = 0                                         # Конец последней обработанной посылки
+        keep = data_len - len(self._header_bytes)       # Здесь может начинаться неполный заголовок с форматом
+        for start in starts:
+            if start < pos:
+                continue
+            if data_len - start < prefix_len:
+                keep = start
+                break
+            end = start + prefix_len + self._get_package_size(_SINGLE_BYTES[data[start + prefix_len - 1]]) + 1
+            if end > data_len:
+                keep = start
+                break
+            frame = view[start:end]
+            if frame[-1] != self._count_frame_control_sum(frame):
+                continue
+            self._num_priority_frames += 1
+            await self._priority_frame_processing(frame)
+            pos = end
+
+        self._priority_tail = data[max(keep, pos, 0):]
 
     # =============================================================
     # ================= Внутренняя логика =========================
     # =============================================================
 
-    async def _default_decode_func(self, byte_list: list[bytes]) -> None:
+    async def _accept_chunk(self, chunk: Union[bytes, memoryview]) -> None:
+        """Приём порции байтов от источника согласно схеме pipeline.
+
+        QUEUED: копия порции кладётся в _byte_queue, а управляющие посылки
+        из неё разбираются сразу (если включён приоритетный разбор).
+        DIRECT: порция разбирается сразу, без копирования, а собранные
+        из неё пакеты отправляются одной пачкой. Порция должна быть
+        валидна только на время вызова.
+
+        Args:
+            chunk (bytes | memoryview): Порция полученных байтов.
+        """
+        if self._pipeline is DecoderPipeline.QUEUED:
+            chunk = bytes(chunk)
+            if self._priority_patterns:
+                await self._priority_scan(chunk)
+            await self._put_chunk(chunk)
+            return
+
+        await self._chunk_processing(chunk)
+        await self._flush_packages()
+
+    async def _flush_packages(self) -> None:
+        """Отправка накопленных в DecoderPipeline.DIRECT пакетов одной пачкой."""
+        if not self._pending_packages:
+            return
+        batch = self._pending_packages
+        self._pending_packages = []
+        await self._packages_sending(batch)
+
+    async def _put_chunk(self, chunk: bytes) -> None:
+        """Кладёт порцию байтов в _byte_queue согласно политике переполнения.
+
+        Args:
+            chunk (bytes): Порция байтов для разбора.
+        """
+        if await self._put_with_policy(self._byte_queue, chunk, self._byte_queue_limit.policy):
+            self._num_dropped_chunks += 1
+            if self._num_dropped_chunks == 1:
+                self._base_decoder_logger.warning(
+                    f'Очередь порций байтов переполнена ({self._byte_queue.maxsize}), '
+                    f'порции выбрасываются по политике {self._byte_queue_limit.policy.name}'
+                )
+        if self._byte_queue.qsize() > self._byte_queue_high_water:
+            self._byte_queue_high_water = self._byte_queue.qsize()
+
+    async def _put_package(self, package: T) -> None:
+        """Кладёт декодированный пакет в _package_queue согласно политике переполнения.
+
+        В схеме DecoderPipeline.DIRECT пакет откладывается до конца
+        разбора текущей порции (см. _flush_packages).
+
+        Args:
+            package (T): Декодированный пакет данных.
+        """
+        if self._pipeline is DecoderPipeline.DIRECT:
+            self._pending_packages.append(package)
+            return
+
+        if await self._put_with_policy(self._package_queue, package, self._package_queue_limit.policy):
+            self._num_dropped_packages += 1
+            if self._num_dropped_packages == 1:
+                self._base_decoder_logger.warning(
+                    f'Очередь пакетов переполнена ({self._package_queue.maxsize}), '
+                    f'пакеты выбрасываются по политике {self._package_queue_limit.policy.name}'
+                )
+        if self._package_queue.qsize() > self._package_queue_high_water:
+            self._package_queue_high_water = self._package_queue.qsize()
+
+    @staticmethod
+    async def _put_with_policy(queue: asyncio.Queue, item: Any, policy: OverflowPolicy) -> bool:
+        """Кладёт элемент в очередь с учётом политики переполнения.
+
+        Выброшенный из очереди элемент считается обработанным (task_done),
+        чтобы wait_idle() не ждал его вечно.
+
+        Args:
+            queue (asyncio.Queue):   Очередь декодера.
+            item (Any):              Элемент очереди.
+            policy (OverflowPolicy): Поведение при заполненной очереди.
+
+        Returns:
+            bool: True, если какой-то элемент (старый или новый) был выброшен.
+        """
+        if not queue.full():
+            queue.put_nowait(item)
+            return False
+
+        if policy is OverflowPolicy.BLOCK:
+            await queue.put(item)
+            return False
+
+        if policy is OverflowPolicy.DROP_OLDEST:
+            queue.get_nowait()
+            queue.task_done()
+            queue.put_nowait(item)
+        return True
+
+    @staticmethod
+    def _limit_str(limit: QueueLimit) -> str:
+        """Размер очереди для вывода в статистике."""
+        return str(limit.maxsize) if limit.maxsize > 0 else '∞'
+
+    async def _default_decode_func(self, byte_list: Frame) -> None:
         """Заглушка по умолчанию для _decode_func до первого WantFormat."""
         self._base_decoder_logger.warning(f'_decode_func не установлена, пакет проигнорирован: {byte_list}')
     
     async def _processing_loop(self) -> None:
-        """Фоновый цикл чтения байтов и обработки конечным автоматом."""
+        """Фоновый цикл чтения порций байтов и обработки конечным автоматом.
+
+        Get из непустой очереди не отдаёт управление event loop, поэтому при
+        накопленной очереди цикл уступает его не реже чем раз в
+        _PROCESSING_SLICE: иначе источник не прочитает следующую порцию
+        (и ответ МК в ней), пока очередь не опустеет.
+        """
         self._base_decoder_logger.debug('Запуск цикла обработки байтов')
+        loop = asyncio.get_running_loop()
+        slice_end = loop.time() + _PROCESSING_SLICE
         try:
             while True:
-                bt = await self._byte_queue.get()
-                await self._byte_processing(bt)
+                if self._byte_queue.empty():
+                    chunk = await self._byte_queue.get()
+                    slice_end = loop.time() + _PROCESSING_SLICE
+                else:
+                    chunk = self._byte_queue.get_nowait()
+                try:
+                    await self._chunk_processing(chunk)
+                finally:
+                    self._byte_queue.task_done()
+                if loop.time() > slice_end:
+                    await asyncio.sleep(0)
+                    slice_end = loop.time() + _PROCESSING_SLICE
         except asyncio.CancelledError:
             self._base_decoder_logger.debug('Цикл обработки байтов остановлен')
             # raise   # TODO: разобраться, зачем тут raise
@@ -274,7 +879,10 @@ class BaseDecoder(ABC, Generic[T]):
         try:
             while True:
                 data = await self._package_queue.get()
-                await self._package_sending(data)
+                try:
+                    await self._package_sending(data)
+                finally:
+                    self._package_queue.task_done()
         except asyncio.CancelledError:
             self._base_decoder_logger.debug('Цикл эмиссии пакетов остановлен')
             raise
@@ -296,11 +904,24 @@ class BaseDecoder(ABC, Generic[T]):
         self._data_bt_index = 0
         self._package_size = 0
         self._decode_func = self._default_decode_func
+        self._buffer = bytearray()
+        self._pending_packages = []
 
         # Счётчики
         self._num_correct_packages = 0
         self._num_wrong_packages   = 0
         self._num_unknown_packages = 0
+        self._num_recovered_packages = 0
+        self._resync_depth = 0
+        self._frame_from_resync = False
+        self._resync_tail = False
+        self._resync_until = 0
+
+        self._byte_queue_high_water    = 0
+        self._package_queue_high_water = 0
+        self._num_dropped_chunks   = 0
+        self._num_dropped_packages = 0
+        self._num_priority_frames  = 0
 
         self._base_decoder_logger.debug('FSM и счётчики BaseDecoder сброшены')
 
@@ -312,7 +933,8 @@ class BaseDecoder(ABC, Generic[T]):
         self._clear()
 
         # Пересоздадим очереди
-        self._byte_queue = asyncio.Queue()
-        self._package_queue = asyncio.Queue()
+        self._byte_queue = asyncio.Queue(self._byte_queue_limit.maxsize)
+        self._package_queue = asyncio.Queue(self._package_queue_limit.maxsize)
+        self._priority_tail = b''
 
         self._base_decoder_logger.debug('Состояние BaseDecoder сброшено')
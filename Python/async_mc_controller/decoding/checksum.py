@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Модуль контрольных сумм посылок.
+
+Единое место вычисления контрольной суммы для декодеров (проверка входящих
+посылок) и построителей пакетов (формирование исходящих).
+
+Одиночная посылка суммируется встроенной sum() прямо по буферу. Пакетная
+проверка многих посылок одного буфера выполняется NumPy одним вызовом
+np.add.reduceat в uint8: переполнение байта и есть сумма по модулю 256.
+
+Классы:
+    ChecksumKind: Виды контрольных сумм протоколов.
+
+Функции:
+    compute_checksum:  Контрольная сумма байтов посылки без самой суммы.
+    compute_checksums: Контрольные суммы многих участков одного буфера.
+    verify_frames:     Пакетная проверка контрольных сумм посылок буфера.
+"""
+
+# System imports
+from enum import Enum
+from typing import Union
+
+# External imports
+import numpy as np
+
+# User imports
+
+#############################################
+
+class ChecksumKind(Enum):
+    """Вид контрольной суммы посылки."""
+    SUM8 = 1    # Сумма всех байтов посылки (заголовок, формат, длина, тело) по модулю 256
+
+# ------------------------------------------
+
+def compute_checksum(data: Union[bytes, bytearray, memoryview],
+                     kind: ChecksumKind = ChecksumKind.SUM8) -> int:
+    """Вычисляет контрольную сумму байтов посылки.
+
+    Args:
+        data: Байты посылки без контрольной суммы (непрерывный буфер).
+        kind (ChecksumKind): Вид контрольной суммы.
+
+    Returns:
+        int: Значение контрольной суммы (0–255 для SUM8).
+
+    Raises:
+        ValueError: Если вид контрольной суммы не поддерживается.
+    """
+    if kind is ChecksumKind.SUM8:
+        return sum(data) & 0xFF
+    raise ValueError(f'Неподдерживаемый вид контрольной суммы: {kind}')
+
+
+def compute_checksums(buffer: np.ndarray, starts: np.ndarray, stops: np.ndarray,
+                      kind: ChecksumKind = ChecksumKind.SUM8) -> np.ndarray:
+    """Вычисляет контрольные суммы участков buffer[start:stop) одним вызовом NumPy.
+
+    Участки могут пересекаться и идти в любом порядке.
+
+    Args:
+        buffer (np.ndarray): Одномерный массив байтов (uint8).
+        starts (np.ndarray): Начала участков.
+        stops (np.ndarray):  Концы участков (не включительно), stop <= buffer.size.
+
+    Returns:
+        np.ndarray: Контрольные суммы участков (uint8 для SUM8).
+
+    Raises:
+        ValueError: Если вид контрольной суммы не поддерживается.
+    """
+    if kind is not ChecksumKind.SUM8:
+        raise ValueError(f'Неподдерживаемый вид контрольной суммы: {kind}')
+
+    starts = np.asarray(starts, dtype=np.intp)
+    stops = np.asarray(stops, dtype=np.intp)
+    sums = np.zeros(starts.size, dtype=np.uint8)
+    nonempty = stops > starts
+    if not nonempty.any():
+        return sums
+    if not nonempty.all():
+        starts, stops = starts[nonempty], stops[nonempty]
+
+    # Последний отрезок reduceat идёт до конца массива, а индекс, равный длине
+    # массива, недопустим: суммируется окно вокруг участков с байтом за последним из них
+    first = int(starts.min())
+    last = int(stops.max())
+    window = buffer[first:last + 1]
+    if window.size == last - first:
+        window = np.append(window, np.uint8(0))
+
+    # Чётные отрезки [start, stop) — участки, нечётные [stop, следующий start) отбрасываются
+    indices = np.empty(2 * starts.size, dtype=np.intp)
+    indices[0::2] = starts - first
+    indices[1::2] = stops - first
+    sums[nonempty] = np.add.reduceat(window, indices, dtype=np.uint8)[0::2]
+    return sums
+
+def verify_frames(buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                  kind: ChecksumKind = ChecksumKind.SUM8) -> np.ndarray:
+    """Проверяет контрольные суммы посылок buffer[start:end) пакетно.
+
+    Последний байт каждой посылки — её контрольная сумма.
+
+    Args:
+        buffer (np.ndarray): Одномерный массив байтов (uint8).
+        starts (np.ndarray): Начала посылок.
+        ends (np.ndarray):   Концы посылок (индекс за байтом контрольной суммы).
+
+    Returns:
+        np.ndarray: Булева маска посылок с верной контрольной суммой.
+    """
+    ends = np.asarray(ends, dtype=np.intp)
+    if ends.size == 0:
+        return np.zeros(0, dtype=bool)
+    return compute_checksums(buffer, starts, ends - 1, kind) == buffer[ends - 1]
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""Модуль колоночного хранилища декодированных пакетов.
+
+Пакеты данных хранятся не списком Python-объектов, а строками структурированных
+массивов NumPy, выделяемых блоками фиксированного размера. Одна строка
+занимает dtype.itemsize байт вместо сотен байт на NamedTuple с вложенными
+объектами, а сохранение на диск выполняется целыми блоками.
+
+Строка записывается в блок одним вызовом struct.pack_into по формату,
+скомпилированному из dtype, — это в несколько раз быстрее присваивания
+кортежа элементу структурированного массива.
+Если строка уже есть в виде байтов (полезная нагрузка посылки совпадает
+с dtype побайтно), она копируется в блок без распаковки — append_raw.
+
+Хранилище может быть ограничено по числу строк (QueueLimit):
+    OverflowPolicy.DROP_OLDEST — кольцевой буфер: хранятся последние maxsize строк;
+    OverflowPolicy.DROP_NEWEST — после заполнения новые строки отбрасываются.
+
+Классы:
+    ColumnarStore: Растущее блочное хранилище строк структурированного dtype.
+"""
+
+# System imports
+import struct
+from collections import deque
+from typing import Iterator, Union
+
+# External imports
+import numpy as np
+
+# User imports
+from async_mc_controller.decoding.base_decoder import OverflowPolicy, QueueLimit
+
+#############################################
+
+DEFAULT_STORE_LIMIT: QueueLimit = QueueLimit(0, OverflowPolicy.DROP_OLDEST)    # Хранилище без ограничения
+
+_DEFAULT_CHUNK_ROWS: int = 65536       # Количество строк в одном блоке хранилища
+
+# Коды struct для чисел по (kind, itemsize) типа NumPy
+_STRUCT_CODES: dict[tuple[str, int], str] = {
+    ('b', 1): '?',
+    ('i', 1): 'b', ('i', 2): 'h', ('i', 4): 'i', ('i', 8): 'q',
+    ('u', 1): 'B', ('u', 2): 'H', ('u', 4): 'I', ('u', 8): 'Q',
+    ('f', 2): 'e', ('f', 4): 'f', ('f', 8): 'd',
+}
+
+# ------------------------------------------
+
+class ColumnarStore:
+    """Блочное хранилище строк структурированного массива NumPy.
+
+    Первый блок выделяется сразу при создании, следующие — по мере заполнения
+    предыдущего, поэтому добавление строки никогда не копирует уже накопленные
+    данные. В кольцевом режиме (DROP_OLDEST) полностью вытесненные блоки
+    освобождаются, и память ограничена maxsize + chunk_rows строками.
+
+    Пример использования:
+        store = ColumnarStore(np.dtype([('num', '<u4'), ('acc', '<f4', (3,))]))
+        store.append((1, 0.5, 0.0, -0.5))
+        array = store.to_array()
+    """
+
+    def __init__(self, dtype: np.dtype, limit: QueueLimit = DEFAULT_STORE_LIMIT,
+                 chunk_rows: int = _DEFAULT_CHUNK_ROWS):
+        if limit.maxsize > 0 and limit.policy is OverflowPolicy.BLOCK:
+            raise ValueError('Хранилище не может ожидать освобождения места: '
+                             'используйте OverflowPolicy.DROP_OLDEST или DROP_NEWEST')
+        if chunk_rows <= 0:
+            raise ValueError(f'Размер блока должен быть положительным: chunk_rows = {chunk_rows}')
+
+        self._dtype: np.dtype = np.dtype(dtype)
+        self._row_struct: struct.Struct = self._compile_row_struct(self._dtype)
+        self._limit: QueueLimit = limit
+        self._chunk_rows: int = chunk_rows
+
+        self._chunks: deque[np.ndarray] = deque()   # Заполненные и текущий блоки
+        self._tail: np.ndarray = self._new_chunk()  # Текущий (последний) блок
+        self._tail_view: memoryview = memoryview(self._tail).cast('B')
+        self._tail_pos: int = 0                     # Заполненных строк в текущем блоке
+        self._head_pos: int = 0                     # Вытесненных строк в первом блоке
+        self._len: int = 0                          # Количество хранимых строк
+        self._num_dropped: int = 0                  # Вытеснено или отброшено строк
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __str__(self) -> str:
+        maxsize = self._limit.maxsize
+        return (
+            f'🔍 Хранилище пакетов:\n'
+            f'| Строк:                               {self._len} из {maxsize if maxsize > 0 else "∞"}\n'
+            f'| Занято памяти, МБ:                   {self.nbytes / 2 ** 20:.1f}\n'
+            f'| Выброшено строк:                     {self._num_dropped}\n'
+            f'| -----------------------------------------------\n'
+        )
+
+    # =============================================================
+    # =================== Публичные методы ========================
+    # =============================================================
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Тип строки хранилища."""
+        return self._dtype
+
+    @property
+    def num_dropped(self) -> int:
+        """Количество строк, вытесненных или отброшенных из-за ограничения размера."""
+        return self._num_dropped
+
+    @property
+    def nbytes(self) -> int:
+        """Объём памяти, выделенной под блоки хранилища."""
+        return len(self._chunks) * self._chunk_rows * self._dtype.itemsize
+
+    def append(self, row: tuple) -> None:
+        """Добавляет одну строку.
+
+        Args:
+            row (tuple): Плоский кортеж значений полей в порядке dtype
+                         (поле-подмассив разворачивается в отдельные значения).
+        """
+        if not self._reserve_row():
+            return
+
+        row_struct = self._row_struct
+        row_struct.pack_into(self._tail_view, self._tail_pos * row_struct.size, *row)
+        self._commit_row()
+
+    def append_raw(self, row: Union[bytes, bytearray, memoryview]) -> None:
+        """Добавляет одну строку, уже упакованную в байты dtype, без распаковки.
+
+        Args:
+            row: Ровно dtype.itemsize байт строки (например, полезная
+                 нагрузка посылки, совпадающая с dtype побайтно).
+
+        Raises:
+            ValueError: Если размер row не равен dtype.itemsize.
+        """
+        size = self._dtype.itemsize
+        if len(row) != size:
+            raise ValueError(f'Строка хранилища занимает {size} байт, получено {len(row)}')
+        if not self._reserve_row():
+            return
+
+        offset = self._tail_pos * size
+        self._tail_view[offset:offset + size] = row
+        self._commit_row()
+
+    def chunks(self) -> Iterator[np.ndarray]:
+        """Последовательно возвращает хранимые строки блоками (view без копирования).
+
+        Хранилище нельзя изменять, пока не закончен обход.
+        """
+        last = len(self._chunks) - 1
+        for index, chunk in enumerate(self._chunks):
+            start = self._head_pos if index == 0 else 0
+            stop = self._tail_pos if index == last else self._chunk_rows
+            if stop > start:
+                yield chunk[start:stop]
+
+    def to_array(self) -> np.ndarray:
+        """Возвращает все хранимые строки одним непрерывным массивом (копия)."""
+        result = np.empty(self._len, dtype=self._dtype)
+        pos = 0
+        for block in self.chunks():
+            result[pos:pos + block.size] = block
+            pos += block.size
+        return result
+
+    def clear(self) -> None:
+        """Удаляет все строки, оставляя один выделенный блок."""
+        self._chunks.clear()
+        self._tail = self._new_chunk()
+        self._tail_view = memoryview(self._tail).cast('B')
+        self._tail_pos = 0
+        self._head_pos = 0
+        self._len = 0
+        self._num_dropped = 0
+
+    # =============================================================
+    # ================= Внутренняя логика =========================
+    # =============================================================
+
+    @staticmethod
+    def _compile_row_struct(dtype: np.dtype) -> struct.Struct:
+        """Компилирует формат struct для записи одной строки dtype.
+
+        Поддерживаются плотно упакованные (без выравнивания) поля из чисел
+        little-endian, в том числе поля-подмассивы.
+
+        Raises:
+            ValueError: Если dtype не описывается плоским форматом struct.
+        """
+        if dtype.names is None:
+            raise ValueError(f'Хранилищу нужен структурированный dtype: {dtype}')
+
+        fmt = '<'
+        for name in dtype.names:
+            field_dtype = dtype.fields[name][0]
+            base, shape = field_dtype.base, field_dtype.shape
+            code = _STRUCT_CODES.get((base.kind, base.itemsize))
+            if code is None or base.byteorder == '>':
+                raise ValueError(f'Поле {name} с типом {base} не поддерживается хранилищем')
+            fmt += f'{int(np.prod(shape, dtype=int))}{code}'
+
+        row_struct = struct.Struct(fmt)
+        if row_struct.size != dtype.itemsize:
+            raise ValueError(f'Поля dtype должны идти без выравнивания: {dtype}')
+        return row_struct
+
+    def _reserve_row(self) -> bool:
+        """Освобождает место под новую строку с учётом ограничения размера.
+
+        Returns:
+            bool: False, если строка должна быть отброшена (DROP_NEWEST).
+        """
+        maxsize = self._limit.maxsize
+        if maxsize > 0 and self._len >= maxsize:
+            self._num_dropped += 1
+            if self._limit.policy is OverflowPolicy.DROP_NEWEST:
+                return False
+            self._drop_oldest()
+        return True
+
+    def _commit_row(self) -> None:
+        """Учитывает записанную строку и выделяет новый блок по заполнении текущего."""
+        self._tail_pos += 1
+        self._len += 1
+        if self._tail_pos == self._chunk_rows:
+            self._tail = self._new_chunk()
+            self._tail_view = memoryview(self._tail).cast('B')
+            self._tail_pos = 0
+
+    def _new_chunk(self) -> np.ndarray:
+        """Выделяет новый блок и добавляет его в конец списка блоков."""
+        chunk = np.empty(self._chunk_rows, dtype=self._dtype)
+        self._chunks.append(chunk)
+        return chunk
+
+    def _drop_oldest(self) -> None:
+        """Вытесняет самую старую строку, освобождая первый блок целиком по его исчерпании."""
+        self._head_pos += 1
+        self._len -= 1
+        if self._head_pos == self._chunk_rows:
+            self._chunks.popleft()
+            self._head_pos = 0
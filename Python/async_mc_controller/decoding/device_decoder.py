@@ -12,15 +12,23 @@
 
 # System imports
 from abc import abstractmethod
+from collections import deque
 from collections.abc import Coroutine
-from typing import Any, Callable, Optional, TypeAlias, Awaitable
+from typing import Any, Callable, Optional, TypeAlias, Awaitable, Union
 
 # External imports
+import numpy as np
 
 # User imports
 from async_mc_controller.logger import McLogger
 from async_mc_controller.signal_bus import McBus
-from async_mc_controller.decoding.base_decoder import BaseDecoder, Stage, T
+from async_mc_controller.decoding.base_decoder import (
+    BaseDecoder, DecoderEngine, DecoderPipeline, Frame, QueueLimit, Stage, T,
+    DEFAULT_BYTE_QUEUE_LIMIT, DEFAULT_PACKAGE_QUEUE_LIMIT,
+)
+from async_mc_controller.decoding.sequence_tracker import SequenceTracker, SequenceStats
+from async_mc_controller.decoding.columnar_store import ColumnarStore, DEFAULT_STORE_LIMIT
+from async_mc_controller.decoding.utils import frame_to_bytes
 
 #############################################
 
@@ -30,9 +38,12 @@ SavedState: TypeAlias = tuple[
     list[bytes],
     int,
     int,
-    Callable[[list[bytes]], Coroutine[Any, Any, None]],
+    Callable[[Frame], Coroutine[Any, Any, None]],
 ]
 
+_SEQUENCE_STATS_PERIOD: int = 1000     # Период эмиссии SEQUENCE_STATS (пакетов данных)
+_PRIORITY_FRAMES_LIMIT: int = 64       # Ответы МК, обработанные вне очереди и ещё не дошедшие до разбора
+
 # ------------------------------------------
 
 class DeviceDecoder(BaseDecoder[T]):
@@ -43,6 +54,31 @@ class DeviceDecoder(BaseDecoder[T]):
     сообщений (ACK рукопожатия, heartbeat, подтверждения команды),
     а также механизм сохранения и восстановления состояния автомата
     на время обработки короткого ACK-пакета.
+
+    Сохранение состояния нужно только движку DecoderEngine.FSM. Движок
+    DecoderEngine.BUFFER работает как демультиплексор: каждая посылка
+    находится по заголовку и разбирается по байту формата (данные или
+    сообщение), поэтому ACK распознаётся в любой момент потока, а
+    отправка heartbeat и команд не сбрасывает разбор.
+
+    Если наследник возвращает номер пакета из _package_number, номера
+    отслеживаются SequenceTracker, а статистика непрерывности каждые
+    _SEQUENCE_STATS_PERIOD пакетов эмиттится сигналом SEQUENCE_STATS.
+    По сигналам START_STATIC_INIT и START_MEASURING (отправка команды
+    смены стадии) МК начинает нумерацию заново — трекер перезапускается.
+
+    Полученные пакеты данных накапливаются в колоночном хранилище
+    received_data (ColumnarStore) строками типа _store_dtype; строку
+    из пакета формирует _store_row наследника — кортежем значений полей
+    или готовыми байтами строки (копируются в хранилище без распаковки,
+    ColumnarStore.append_raw). Параметр store_limit
+    ограничивает хранилище (кольцевой буфер или отбрасывание новых строк).
+
+    Ответы МК, которых AsyncComPortDevice ждёт с таймаутом (ACK рукопожатия
+    и heartbeat, подтверждение и отказ команды), в схеме QUEUED разбираются
+    приоритетно — при приёме порции, в обход очереди байтов. Поэтому очередь
+    скопившихся данных не приводит к ложным DEVICE_LOST и COMMAND_ACK_TIMEOUT.
+    Когда та же посылка доходит до разбора из очереди, она пропускается.
     """
 
     # Получаемые текстовые сообщения от МК
@@ -55,8 +91,19 @@ class DeviceDecoder(BaseDecoder[T]):
     _DataFormatBt: Optional[bytes] = None       # Пакет с данными
     _MessageFormatBt: Optional[bytes] = None    # Текстовое сообщение
 
-    def __init__(self, signal_bus: McBus, mc_logger: McLogger):
-        super().__init__(logger=mc_logger.get_child_logger("BaseDecoder"))
+    # Тип строки хранилища received_data
+    _store_dtype: Optional[np.dtype] = None
+
+    def __init__(self, signal_bus: McBus, mc_logger: McLogger,
+                 engine: DecoderEngine = DecoderEngine.FSM,
+                 byte_queue_limit: QueueLimit = DEFAULT_BYTE_QUEUE_LIMIT,
+                 package_queue_limit: QueueLimit = DEFAULT_PACKAGE_QUEUE_LIMIT,
+                 pipeline: DecoderPipeline = DecoderPipeline.QUEUED,
+                 store_limit: QueueLimit = DEFAULT_STORE_LIMIT):
+        super().__init__(logger=mc_logger.get_child_logger("BaseDecoder"), engine=engine,
+                         byte_queue_limit=byte_queue_limit,
+                         package_queue_limit=package_queue_limit,
+                         pipeline=pipeline)
 
         # Проверим текстовые сообщения
         if any(msg is None for msg in [self._handshake_ack, self._heartbeat_ack,
@@ -71,9 +118,13 @@ class DeviceDecoder(BaseDecoder[T]):
         if any(bt is None for bt in [self._DataFormatBt, self._MessageFormatBt]):
             raise RuntimeError("Задайте константы форматов пакетов протокола!")
 
+        # Проверим тип строки хранилища пакетов
+        if self._store_dtype is None:
+            raise RuntimeError("Задайте тип строки хранилища пакетов _store_dtype!")
+
         # Словарь для соответствия формата пакета и функции для его декодирования.
         # Может быть расширен в наследнике!
-        self._fmt_to_decode_func: dict[bytes, Callable[[list[bytes]], Coroutine[Any, Any, None]]] = {
+        self._fmt_to_decode_func: dict[bytes, Callable[[Frame], Coroutine[Any, Any, None]]] = {
             self._DataFormatBt: self._bytes_to_data,
             self._MessageFormatBt: self._bytes_to_message
         }
@@ -87,19 +138,34 @@ class DeviceDecoder(BaseDecoder[T]):
             self._command_rejected_msg: self._command_rejected_msg_handler,
         }
 
+        # Ответы МК, которые разбираются в обход очереди байтов, и их посылки,
+        # ещё не дошедшие до разбора из очереди
+        self._priority_messages: frozenset[str] = frozenset(self._msg_to_handler.keys())
+        self._priority_frames: deque[bytes] = deque(maxlen=_PRIORITY_FRAMES_LIMIT)
+        self._enable_priority_lane([self._MessageFormatBt])
+
         self._device_decoder_logger = mc_logger.get_child_logger("BaseDecoder.DeviceDecoder")
         self._bus: McBus = signal_bus       # Используемая сигнальная шина
-        self.received_data: list[T] = []    # Список полученных пакетов данных
+        # Хранилище полученных пакетов данных
+        self.received_data: ColumnarStore = ColumnarStore(self._store_dtype, store_limit)
 
         # Сохранённое состояние автомата на время обработки heartbeat / команды
         self._saved_state: Optional[SavedState] = None
+        # Нужны ли снимки состояния (только для побайтового автомата)
+        self._uses_state_snapshots: bool = engine is DecoderEngine.FSM
+
+        # Непрерывность номеров пакетов данных
+        self._sequence_tracker: SequenceTracker = SequenceTracker()
 
         # Самостоятельная подписка на сигналы шины
         self._bus.new_byte.subscribe(self)
+        self._bus.new_bytes.subscribe(self)
         self._bus.handshake_init.subscribe(self)
         self._bus.heartbeat_sent.subscribe(self)
         self._bus.command_sent.subscribe(self)
         self._bus.command_ack_timeout.subscribe(self)
+        self._bus.start_static_init.subscribe(self)
+        self._bus.start_measuring.subscribe(self)
 
     # =============================================================
     # ======= Методы для работы в контекстном менеджере ===========
@@ -108,10 +174,13 @@ class DeviceDecoder(BaseDecoder[T]):
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
         """Отпишемся от всех сигналов шины."""
         self._bus.new_byte.unsubscribe(self)
+        self._bus.new_bytes.unsubscribe(self)
         self._bus.handshake_init.unsubscribe(self)
         self._bus.heartbeat_sent.unsubscribe(self)
         self._bus.command_sent.unsubscribe(self)
         self._bus.command_ack_timeout.unsubscribe(self)
+        self._bus.start_static_init.unsubscribe(self)
+        self._bus.start_measuring.unsubscribe(self)
 
         return await super().__aexit__(exc_type, exc_val, exc_tb)
 
@@ -120,14 +189,25 @@ class DeviceDecoder(BaseDecoder[T]):
     # =============================================================
 
     async def on_byte_received(self, bt: bytes) -> None:
-        """Обработчик сигнала NEW_BYTE — кладёт байт во внутреннюю очередь.
+        """Обработчик сигнала NEW_BYTE — передаёт байт на разбор (см. _accept_chunk).
 
         Args:
             bt (bytes): Один полученный байт.
         """
-        await self._byte_queue.put(bt)
+        await self._accept_chunk(bt)
         # self._device_decoder_logger.debug(f'Получен новый байт: bt = {bt}')
 
+    async def on_bytes_received(self, buf: memoryview) -> None:
+        """Обработчик сигнала NEW_BYTES — передаёт порцию байтов на разбор.
+
+        Буфер валиден только на время вызова: в схеме QUEUED в очередь
+        кладётся его копия, в схеме DIRECT порция разбирается до возврата.
+
+        Args:
+            buf (memoryview): Порция полученных байтов.
+        """
+        await self._accept_chunk(buf)
+
     async def on_handshake_init(self) -> None:
         """Обработчик сигнала HANDSHAKE_INIT — чистит состояние FSM.
 
@@ -142,8 +222,10 @@ class DeviceDecoder(BaseDecoder[T]):
 
         Переключает декодер в WantHeader для корректного приёма ACK пакета
         heartbeat. Состояние восстанавливается в _restore_state() после ACK.
+        Для движка BUFFER ничего не делает.
         """
-        self._save_state('heartbeat')
+        if self._uses_state_snapshots:
+            self._save_state('heartbeat')
 
     async def on_command_sent(self) -> None:
         """Обработчик сигнала COMMAND_SENT — сохраняет состояние автомата.
@@ -151,8 +233,10 @@ class DeviceDecoder(BaseDecoder[T]):
         Переключает декодер в WantHeader для корректного приёма подтверждения
         команды от МК. Состояние восстанавливается в _restore_state() после ACK
         либо после COMMAND_ACK_TIMEOUT (через on_command_ack_timeout).
+        Для движка BUFFER ничего не делает.
         """
-        self._save_state('подтверждения команды')
+        if self._uses_state_snapshots:
+            self._save_state('подтверждения команды')
 
     async def on_command_ack_timeout(self) -> None:
         """Обработчик сигнала COMMAND_ACK_TIMEOUT — восстанавливает состояние.
@@ -162,12 +246,22 @@ class DeviceDecoder(BaseDecoder[T]):
         перепишет _saved_state и изначальное состояние будет потеряно.
         Декодер возвращается в исходный режим работы (до отправки команды).
         """
+        if not self._uses_state_snapshots:
+            return
         if self._saved_state is None:
             self._device_decoder_logger.warning('COMMAND_ACK_TIMEOUT без предварительно сохранённого состояния')
             return
         self._restore_state()
         self._device_decoder_logger.warning('Состояние декодера восстановлено после таймаута команды')
 
+    async def on_start_static_init(self) -> None:
+        """Обработчик сигнала START_STATIC_INIT — нумерация пакетов начинается заново."""
+        self._sequence_tracker.restart()
+
+    async def on_start_measuring(self) -> None:
+        """Обработчик сигнала START_MEASURING — нумерация пакетов начинается заново."""
+        self._sequence_tracker.restart()
+
     # =============================================================
     # =================== Публичные методы ========================
     # =============================================================
@@ -177,6 +271,11 @@ class DeviceDecoder(BaseDecoder[T]):
         """Возвращает количество накопленных пакетов данных IMU."""
         return len(self.received_data)
 
+    @property
+    def sequence_stats(self) -> SequenceStats:
+        """Статистика непрерывности номеров пакетов данных."""
+        return self._sequence_tracker.stats
+
     # =============================================================
     # ================= Внутренняя логика =========================
     # =============================================================
@@ -185,11 +284,16 @@ class DeviceDecoder(BaseDecoder[T]):
         """ Эмиттирование полученного пакета в сигнальную шины. """
         await self._bus.package_ready.emit(data)
 
+    async def _packages_sending(self, batch: list[T]) -> None:
+        """ Эмиттирование пачки пакетов одной порции в сигнальную шину. """
+        await self._bus.packages_ready.emit(batch)
+
     def _clear(self) -> None:
         """Очищает состояние DeviceDecoder.
 
-        Расширяет BaseDecoder._clear() очисткой received_data и _saved_state.
-        Используется list.clear() вместо переприсваивания, чтобы внешние
+        Расширяет BaseDecoder._clear() очисткой received_data, _saved_state и
+        посылок, уже разобранных приоритетно, но ещё не дошедших до очереди байтов.
+        Используется ColumnarStore.clear() вместо переприсваивания, чтобы внешние
         ссылки на received_data (если они есть) оставались валидными.
 
         Вызывается:
@@ -201,9 +305,11 @@ class DeviceDecoder(BaseDecoder[T]):
         super()._clear()
         self.received_data.clear()
         self._saved_state = None
+        self._priority_frames.clear()
+        self._sequence_tracker.reset()
         self._device_decoder_logger.debug('Состояние DeviceDecoder очищено')
 
-    def _get_decode_func(self, fmt: bytes) -> Optional[Callable[[list[bytes]], Coroutine[Any, Any, None]]]:
+    def _get_decode_func(self, fmt: bytes) -> Optional[Callable[[Frame], Coroutine[Any, Any, None]]]:
         """Возвращает функцию декодирования по байту формата пакета.
 
         Args:
@@ -218,36 +324,68 @@ class DeviceDecoder(BaseDecoder[T]):
         return None
 
     @abstractmethod
-    def _bytes_to_protocol_data(self, byte_list: list[bytes]) -> T:
+    def _bytes_to_protocol_data(self, byte_list: Frame) -> T:
         """ Декодирование байтов в пакет данных, отправляемый МК """
         ...
 
-    async def _bytes_to_data(self, byte_list: list[bytes]) -> None:
-        """Декодирует список байтов в структуру T
+    @abstractmethod
+    def _store_row(self, data: T) -> Union[tuple, memoryview]:
+        """ Преобразование пакета данных в плоскую строку хранилища с типом _store_dtype
+        (кортеж значений полей или байты строки, совпадающие с _store_dtype) """
+        ...
+
+    def _package_number(self, data: T) -> Optional[int]:
+        """Возвращает порядковый номер пакета данных, присвоенный МК.
+
+        По умолчанию протокол не нумерует пакеты — возвращает None,
+        и непрерывность не отслеживается. Может быть переопределён в наследнике;
+        None для отдельного пакета исключает его из отслеживания.
+        """
+        return None
+
+    async def _bytes_to_data(self, byte_list: Frame) -> None:
+        """Декодирует посылку в структуру T
         с сохранением в received_data и в _package_queue.
 
         Метод должен быть реализован в наследнике!
 
         Args:
-            byte_list (list[bytes]): Список байтов всей посылки.
+            byte_list (Frame): Байты всей посылки (list[bytes] или memoryview).
         """
         data: T = self._bytes_to_protocol_data(byte_list)
-        self.received_data.append(data)
-        await self._package_queue.put(data)
+        row = self._store_row(data)
+        if isinstance(row, tuple):
+            self.received_data.append(row)
+        else:
+            self.received_data.append_raw(row)
+
+        number = self._package_number(data)
+        if number is not None:
+            tracker = self._sequence_tracker
+            tracker.update(number)
+            if tracker.num_packages % _SEQUENCE_STATS_PERIOD == 0:
+                await self._bus.sequence_stats.emit(tracker.stats)
 
-    async def _bytes_to_message(self, byte_list: list[bytes]) -> None:
+        await self._put_package(data)
+
+    async def _bytes_to_message(self, byte_list: Frame) -> None:
         """Декодирует текстовое сообщение от МК и вызывает соответствующий обработчик.
 
         Args:
-            byte_list (list[bytes]): Список байтов всей посылки.
+            byte_list (Frame): Байты всей посылки (list[bytes] или memoryview).
         """
-        # Данные начинаются с индекса 4 (2 байта заголовка + формат + длина)
-        # и заканчиваются до последнего байта (контрольная сумма)
-        message_bytes = b''.join(byte_list[4:-1])
-        try:
-            message = message_bytes.decode('ascii')
-        except UnicodeDecodeError:
-            self._device_decoder_logger.warning(f'Сообщение от МК содержит невалидные ASCII байты: {message_bytes!r}')
+        # Пакеты данных, пришедшие до сообщения, отправляются раньше его обработки
+        await self._flush_packages()
+
+        message = self._frame_message(byte_list)
+        if message is None:
+            self._device_decoder_logger.warning(
+                f'Сообщение от МК содержит невалидные ASCII байты: {frame_to_bytes(byte_list[4:-1])!r}'
+            )
+            return
+
+        # Ответ уже обработан при приёме порции
+        if message in self._priority_messages and self._take_priority_frame(frame_to_bytes(byte_list)):
             return
 
         self._device_decoder_logger.debug(f'Получено сообщение {message}')
@@ -259,6 +397,53 @@ class DeviceDecoder(BaseDecoder[T]):
             self._device_decoder_logger.warning(f'Неизвестное сообщение от МК: "{message}"')
 
 
+    async def _priority_frame_processing(self, frame: memoryview) -> None:
+        """Обработка сообщения МК, найденного при приёме порции (приоритетный разбор).
+
+        Сразу обрабатываются только ответы из _priority_messages, их посылки
+        запоминаются для _take_priority_frame. Остальные сообщения (например,
+        о завершении калибровки) обрабатываются в порядке потока.
+
+        Args:
+            frame (memoryview): Посылка сообщения с верной контрольной суммой.
+        """
+        message = self._frame_message(frame)
+        if message not in self._priority_messages:
+            return
+
+        self._priority_frames.append(bytes(frame))
+        self._device_decoder_logger.debug(f'Получено сообщение {message} (в обход очереди байтов)')
+        await self._msg_to_handler[message]()
+
+    def _take_priority_frame(self, frame: bytes) -> bool:
+        """Проверяет, обработана ли посылка сообщения приоритетным разбором.
+
+        Найденная посылка забывается вместе со всеми запомненными до неё:
+        их порции могли не дойти до разбора (например, были выброшены
+        при переполнении очереди байтов).
+
+        Args:
+            frame (bytes): Вся посылка сообщения.
+
+        Returns:
+            bool: True, если посылка уже обработана и её нужно пропустить.
+        """
+        if frame not in self._priority_frames:
+            return False
+        while self._priority_frames.popleft() != frame:
+            pass
+        return True
+
+    @staticmethod
+    def _frame_message(byte_list: Frame) -> Optional[str]:
+        """Текст сообщения из посылки или None, если в нём невалидные ASCII байты."""
+        # Данные начинаются с индекса 4 (2 байта заголовка + формат + длина)
+        # и заканчиваются до последнего байта (контрольная сумма)
+        try:
+            return frame_to_bytes(byte_list[4:-1]).decode('ascii')
+        except UnicodeDecodeError:
+            return None
+
     def _save_state(self, reason: str) -> None:
         """Сохраняет полное состояние конечного автомата и переводит его в WantHeader.
 
@@ -297,8 +482,10 @@ class DeviceDecoder(BaseDecoder[T]):
 
         Используется после получения ACK heartbeat / подтверждения команды,
         а также после таймаута команды. Вызывающий код логирует причину
-        восстановления сам.
+        восстановления сам. Для движка BUFFER ничего не делает.
         """
+        if not self._uses_state_snapshots:
+            return
         if self._saved_state is None:
             self._device_decoder_logger.warning('Попытка восстановить состояние декодера без предварительного сохранения')
             return
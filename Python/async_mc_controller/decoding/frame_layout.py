@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Модуль декларативного описания расположения полей внутри посылки.
+
+Раскладка задаётся списком полей (имя, смещение, формат struct) и один раз
+компилируется в struct.Struct, после чего вся полезная нагрузка посылки
+распаковывается одним вызовом unpack_from прямо из буфера.
+
+Классы:
+    LayoutField: Описание одного поля посылки.
+    FrameLayout: Скомпилированная раскладка полей посылки.
+"""
+
+# System imports
+import struct
+from typing import Iterable, NamedTuple
+
+# External imports
+
+# User imports
+from async_mc_controller.decoding.base_decoder import Frame
+from async_mc_controller.decoding.utils import frame_to_bytes
+
+#############################################
+
+class LayoutField(NamedTuple):
+    """Описание одного поля посылки.
+
+    Attributes:
+        name (str):   Имя поля.
+        offset (int): Смещение начала поля от начала всей посылки (включая заголовок).
+        fmt (str):    Формат поля в нотации struct без указания порядка байт
+                      (например, 'I', 'f', '3f').
+    """
+    name: str
+    offset: int
+    fmt: str
+
+# ------------------------------------------
+
+class FrameLayout:
+    """Раскладка полей посылки, скомпилированная в один struct.Struct.
+
+    Поля должны идти подряд, без пропусков и перекрытий — тогда вся
+    раскладка описывается одной строкой формата и распаковывается
+    одним вызовом unpack_from.
+
+    Пример использования:
+        layout = FrameLayout([
+            LayoutField('package_num', 4, 'I'),
+            LayoutField('acc', 8, '3f'),
+        ])
+        package_num, acc_x, acc_y, acc_z = layout.unpack(frame)
+    """
+
+    def __init__(self, fields: Iterable[LayoutField], byte_order: str = '<'):
+        """
+        Args:
+            fields (Iterable[LayoutField]): Поля посылки.
+            byte_order (str): Порядок байт в нотации struct. По умолчанию little-endian.
+
+        Raises:
+            ValueError: Если список полей пуст, поля перекрываются
+                или между ними есть пропуски.
+        """
+        self.fields: tuple[LayoutField, ...] = tuple(sorted(fields, key=lambda field: field.offset))
+        if not self.fields:
+            raise ValueError('Раскладка посылки должна содержать хотя бы одно поле')
+
+        expected_offset = self.fields[0].offset
+        for field in self.fields:
+            if field.offset != expected_offset:
+                raise ValueError(
+                    f'Поле {field.name} начинается со смещения {field.offset}, '
+                    f'ожидалось {expected_offset}: поля должны идти подряд'
+                )
+            expected_offset += struct.calcsize(byte_order + field.fmt)
+
+        self.offset: int = self.fields[0].offset     # Смещение первого поля
+        self._struct: struct.Struct = struct.Struct(
+            byte_order + ''.join(field.fmt for field in self.fields)
+        )
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(format={self.format!r}, offset={self.offset})'
+
+    @property
+    def format(self) -> str:
+        """Строка формата скомпилированного struct.Struct."""
+        return self._struct.format
+
+    @property
+    def size(self) -> int:
+        """Суммарный размер всех полей в байтах."""
+        return self._struct.size
+
+    @property
+    def end(self) -> int:
+        """Смещение сразу за последним полем."""
+        return self.offset + self._struct.size
+
+    def unpack(self, frame: Frame) -> tuple:
+        """Распаковывает все поля посылки одним вызовом unpack_from.
+
+        Args:
+            frame (Frame): Вся посылка — непрерывный буфер или список байтов.
+
+        Returns:
+            tuple: Значения полей в порядке раскладки (составные поля,
+                например '3f', разворачиваются в несколько значений).
+        """
+        if isinstance(frame, list):
+            frame = frame_to_bytes(frame)
+        return self._struct.unpack_from(frame, self.offset)
+
+    def pack(self, *values) -> bytes:
+        """Упаковывает значения полей в полезную нагрузку посылки.
+
+        Обратная операция к unpack: результат занимает байты
+        [offset, end) посылки и не содержит заголовка и контрольной суммы.
+
+        Args:
+            *values: Значения полей в порядке раскладки.
+
+        Returns:
+            bytes: Упакованные поля (size байт).
+        """
+        return self._struct.pack(*values)
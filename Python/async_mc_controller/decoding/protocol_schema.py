@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""Модуль декларативного описания протокола обмена с МК.
+
+Одна схема задаёт заголовок посылок, байты форматов, поля пакетов (имя,
+формат struct, имя колонки) и вид контрольной суммы одного направления обмена.
+Из неё один раз собираются все быстрые пути:
+    - FrameLayout (struct.Struct) для распаковки пакета в декодере;
+    - dtype NumPy, побайтно совпадающий с полезной нагрузкой, для пакетной
+      обработки (bin_decoder, колоночное хранилище);
+    - готовые байтовые строки команд.
+
+Смещения полей вычисляются по их порядку, поэтому новое поле добавляется
+одной строкой в схеме — без ручных индексов и срезов.
+
+Классы:
+    SchemaField:    Поле пакета.
+    PacketSchema:   Пакет одного формата.
+    ProtocolSchema: Скомпилированная схема направления обмена.
+"""
+
+# System imports
+import re
+import struct
+from typing import Iterable, NamedTuple, Optional
+
+# External imports
+import numpy as np
+
+# User imports
+from async_mc_controller.decoding.checksum import ChecksumKind, compute_checksum
+from async_mc_controller.decoding.frame_layout import FrameLayout, LayoutField
+
+#############################################
+
+_MAX_BODY_SIZE: int = 255           # Длина тела кодируется одним байтом
+
+# Формат поля: необязательное число элементов и один код struct
+_FIELD_FMT = re.compile(r'(\d*)([?bBhHiIqQefd])')
+
+# Вид числа NumPy по коду struct
+_NUMPY_KINDS: dict[str, str] = {
+    '?': 'b',
+    'b': 'i', 'h': 'i', 'i': 'i', 'q': 'i',
+    'B': 'u', 'H': 'u', 'I': 'u', 'Q': 'u',
+    'e': 'f', 'f': 'f', 'd': 'f',
+}
+
+# ------------------------------------------
+
+class SchemaField(NamedTuple):
+    """Поле пакета.
+
+    Attributes:
+        name (str):   Имя поля (атрибут распакованного пакета).
+        fmt (str):    Формат struct без порядка байт: один код,
+                      возможно с числом элементов ('I', 'f', '3f').
+        column (str): Имя поля в dtype NumPy.
+    """
+    name: str
+    fmt: str
+    column: str
+
+# ------------------------------------------
+
+class PacketSchema(NamedTuple):
+    """Пакет одного формата.
+
+    Attributes:
+        name (str):    Имя пакета внутри схемы ('data', 'message', 'command').
+        fmt (int):     Байт формата.
+        fields (tuple[SchemaField, ...]): Поля тела фиксированной длины.
+                       Пустой кортеж — тело переменной длины (текст, байтовая команда).
+    """
+    name: str
+    fmt: int
+    fields: tuple[SchemaField, ...] = ()
+
+# ------------------------------------------
+
+class ProtocolSchema:
+    """Скомпилированная схема одного направления обмена.
+
+    Посылка: [заголовок] [формат] [длина тела] [тело] [контрольная сумма].
+
+    Пример использования:
+        schema = ProtocolSchema(
+            header=bytes([0xAA, 0xBB]),
+            packets=[PacketSchema('data', 0x01, (SchemaField('num', 'I', 'Num'),)),
+                     PacketSchema('command', 0x02)],
+            commands={'reset': ('command', bytes([0xFF]))},
+        )
+        num, = schema.layout('data').unpack(frame)
+        port.write(schema.commands['reset'])
+    """
+
+    def __init__(self,
+                 header: bytes,
+                 packets: Iterable[PacketSchema],
+                 checksum: ChecksumKind = ChecksumKind.SUM8,
+                 commands: Optional[dict[str, tuple[str, bytes]]] = None,
+                 byte_order: str = '<'):
+        """
+        Args:
+            header (bytes):           Заголовок посылок направления.
+            packets (Iterable):       Пакеты направления.
+            checksum (ChecksumKind):  Вид контрольной суммы.
+            commands (dict):          Команды: имя → (имя пакета, тело).
+                                      Собираются в байтовые строки один раз.
+            byte_order (str):         Порядок байт полей в нотации struct.
+
+        Raises:
+            ValueError: При пустом заголовке, повторе имени или байта формата,
+                        некорректном формате поля или слишком длинном теле пакета.
+        """
+        if not header:
+            raise ValueError('Заголовок посылки не может быть пустым')
+
+        self.header: bytes = bytes(header)
+        self.checksum: ChecksumKind = checksum
+        self.byte_order: str = byte_order
+        self.prefix_size: int = len(self.header) + 2    # Заголовок + формат + длина
+
+        self._packets: dict[str, PacketSchema] = {}
+        self._layouts: dict[str, FrameLayout] = {}
+        self._dtypes: dict[str, np.dtype] = {}
+        for packet in packets:
+            if packet.name in self._packets:
+                raise ValueError(f'Пакет {packet.name} описан в схеме дважды')
+            if any(other.fmt == packet.fmt for other in self._packets.values()):
+                raise ValueError(f'Байт формата 0x{packet.fmt:02X} пакета {packet.name} уже занят')
+            self._packets[packet.name] = packet
+            if packet.fields:
+                self._layouts[packet.name], self._dtypes[packet.name] = self._compile(packet)
+
+        self.commands: dict[str, bytes] = {
+            name: self.build(packet_name, body)
+            for name, (packet_name, body) in (commands or {}).items()
+        }
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(header={self.header.hex(" ").upper()}, '
+                f'packets={list(self._packets)}, checksum={self.checksum.name})')
+
+    # =============================================================
+    # =================== Публичные методы ========================
+    # =============================================================
+
+    def packet(self, name: str) -> PacketSchema:
+        """Описание пакета по имени."""
+        return self._packets[name]
+
+    def format_byte(self, name: str) -> bytes:
+        """Байт формата пакета одной байтовой строкой."""
+        return bytes([self._packets[name].fmt])
+
+    def layout(self, name: str) -> FrameLayout:
+        """Раскладка полей пакета фиксированной длины внутри всей посылки."""
+        return self._layouts[name]
+
+    def dtype(self, name: str) -> np.dtype:
+        """dtype NumPy, побайтно совпадающий с телом пакета фиксированной длины."""
+        return self._dtypes[name]
+
+    def body_size(self, name: str) -> int:
+        """Длина тела пакета фиксированной длины (значение байта длины)."""
+        return self._layouts[name].size
+
+    def frame_size(self, name: str) -> int:
+        """Полный размер посылки фиксированной длины, включая контрольную сумму."""
+        return self._layouts[name].end + 1
+
+    def field_offset(self, packet_name: str, field_name: str) -> int:
+        """Смещение поля от начала всей посылки (включая заголовок)."""
+        for field in self._layouts[packet_name].fields:
+            if field.name == field_name:
+                return field.offset
+        raise KeyError(f'В пакете {packet_name} нет поля {field_name}')
+
+    def build(self, name: str, body: bytes) -> bytes:
+        """Собирает посылку пакета name с телом body.
+
+        Raises:
+            ValueError: Если длина тела превышает 255 байт.
+        """
+        if len(body) > _MAX_BODY_SIZE:
+            raise ValueError(
+                f'Длина тела пакета ({len(body)} байт) превышает максимум ({_MAX_BODY_SIZE} байт)'
+            )
+        frame = self.header + self.format_byte(name) + bytes([len(body)]) + body
+        return frame + bytes([compute_checksum(frame, self.checksum)])
+
+    # =============================================================
+    # ================= Внутренняя логика =========================
+    # =============================================================
+
+    def _compile(self, packet: PacketSchema) -> tuple[FrameLayout, np.dtype]:
+        """Собирает раскладку и dtype пакета, располагая поля подряд за префиксом."""
+        layout_fields = []
+        dtype_fields = []
+        offset = self.prefix_size
+        for field in packet.fields:
+            match = _FIELD_FMT.fullmatch(field.fmt)
+            if match is None:
+                raise ValueError(f'Поле {packet.name}.{field.name}: формат {field.fmt!r} '
+                                 f'должен состоять из одного кода struct с числом элементов')
+            count = int(match.group(1) or 1)
+            code = match.group(2)
+            item_size = struct.calcsize(self.byte_order + code)
+            item_dtype = np.dtype(f'{self.byte_order}{_NUMPY_KINDS[code]}{item_size}')
+
+            layout_fields.append(LayoutField(field.name, offset, field.fmt))
+            dtype_fields.append((field.column, item_dtype, (count,)) if match.group(1)
+                                else (field.column, item_dtype))
+            offset += item_size * count
+
+        layout = FrameLayout(layout_fields, self.byte_order)
+        if layout.size > _MAX_BODY_SIZE:
+            raise ValueError(f'Тело пакета {packet.name} ({layout.size} байт) не помещается в байт длины')
+        return layout, np.dtype(dtype_fields)
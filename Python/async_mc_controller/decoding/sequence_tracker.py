@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""Модуль отслеживания непрерывности номеров пакетов.
+
+МК нумерует пакеты данных беззнаковым счётчиком, поэтому по номерам
+можно прямо во время приёма измерить потери (переполнение UART, пересинхронизация
+после сбойного байта), повторы и нарушения порядка.
+
+Счётчик МК может начинаться заново (например, при смене стадии работы),
+поэтому сеанс связи — это несколько последовательностей номеров.
+
+Номер из посылки, прошедшей контрольную сумму, всё равно может быть
+искажён (SUM8 не ловит часть ошибок), поэтому большой скачок номера
+принимается только после подтверждения следующим номером.
+
+Классы:
+    SequenceStats:   Снимок статистики непрерывности номеров.
+    SequenceTracker: Инкрементный счётчик разрывов последовательности.
+"""
+
+# System imports
+from dataclasses import dataclass, field
+from typing import Optional
+
+# External imports
+import numpy as np
+
+# User imports
+
+#############################################
+
+_HISTOGRAM_SIZE: int = 32   # Число корзин гистограммы длин разрывов (степени двойки)
+_REORDER_WINDOW: int = 64   # Шаг назад не больше этого — нарушение порядка, больший — перезапуск нумерации
+_MAX_JUMP: int = 1 << 16    # Шаг вперёд больше этого требует подтверждения следующим номером
+
+# ------------------------------------------
+
+@dataclass
+class SequenceStats:
+    """Статистика непрерывности номеров пакетов.
+
+    Attributes:
+        num_packages (int):        Количество учтённых пакетов.
+        num_gaps (int):            Количество разрывов последовательности.
+        num_lost (int):            Суммарное количество пропущенных номеров.
+        num_duplicates (int):      Количество повторов предыдущего номера.
+        num_reordered (int):       Количество номеров меньше уже полученных.
+        num_restarts (int):        Количество перезапусков нумерации.
+        num_corrupt (int):         Количество отброшенных номеров-выбросов (скачок,
+                                   не подтверждённый следующим номером).
+        max_gap (int):             Наибольшее число номеров, пропущенных подряд.
+        gap_histogram (list[int]): Количество разрывов по длинам: корзина k
+                                   содержит разрывы длиной от 2**k до 2**(k+1) - 1.
+    """
+    num_packages:   int = 0
+    num_gaps:       int = 0
+    num_lost:       int = 0
+    num_duplicates: int = 0
+    num_reordered:  int = 0
+    num_restarts:   int = 0
+    num_corrupt:    int = 0
+    max_gap:        int = 0
+    gap_histogram:  list[int] = field(default_factory=lambda: [0] * _HISTOGRAM_SIZE)
+
+    @property
+    def loss_rate(self) -> float:
+        """Доля пропущенных номеров среди ожидавшихся (0.0 – 1.0)."""
+        expected = self.num_packages + self.num_lost
+        return self.num_lost / expected if expected else 0.0
+
+    def histogram_str(self) -> str:
+        """Непустые корзины гистограммы в виде '1: n, 2–3: n, ...'."""
+        parts = []
+        for k, count in enumerate(self.gap_histogram):
+            if not count:
+                continue
+            low, high = 1 << k, (1 << (k + 1)) - 1
+            label = f'{low}' if low == high else f'{low}–{high}'
+            parts.append(f'{label}: {count}')
+        return ', '.join(parts) if parts else '—'
+
+    def __str__(self) -> str:
+        return (
+            f'🔍 Непрерывность номеров пакетов:\n'
+            f'| Пакетов:                             {self.num_packages}\n'
+            f'| Разрывов последовательности:         {self.num_gaps}\n'
+            f'| Пропущено номеров:                   {self.num_lost}\n'
+            f'| Доля потерь, %:                      {self.loss_rate * 100:.3f}\n'
+            f'| Повторов:                            {self.num_duplicates}\n'
+            f'| Нарушений порядка:                   {self.num_reordered}\n'
+            f'| Перезапусков нумерации:              {self.num_restarts}\n'
+            f'| Отброшено искажённых номеров:        {self.num_corrupt}\n'
+            f'| Максимальный разрыв:                 {self.max_gap}\n'
+            f'| Длины разрывов:                      {self.histogram_str()}\n'
+            f'| -----------------------------------------------\n'
+        )
+
+# ------------------------------------------
+
+class SequenceTracker:
+    """Инкрементный счётчик разрывов в номерах пакетов.
+
+    Каждый номер сравнивается с наибольшим из уже полученных (по модулю
+    разрядности счётчика, переполнение 0xFFFFFFFF → 0 разрывом не считается):
+        шаг 0                   — повтор;
+        шаг 1                   — норма;
+        шаг от 2 до max_jump    — разрыв, пропущено (шаг - 1) номеров;
+        назад до reorder_window — номер из прошлого (нарушение порядка),
+                                  опорный номер не меняется;
+        дальше вперёд или назад — скачок, требующий подтверждения.
+
+    Номер после скачка откладывается. Если следующий номер продолжает его —
+    скачок подтверждён: это перезапуск нумерации (или пересинхронизация после
+    долгого обрыва), отложенный номер становится опорным, а пропуск в num_lost
+    не входит. Если следующий номер продолжает прежнюю последовательность —
+    отложенный номер искажён: он учитывается в num_corrupt, а разрывы и
+    перезапуски не меняются.
+
+    Шаг больше modulus/2 считается шагом назад. Пропуск, который позже закрыл
+    опоздавший пакет, остаётся в num_lost — оценка потерь консервативная.
+
+    Если момент перезапуска счётчика известен заранее (например, отправлена
+    команда смены стадии), вызовите restart() — тогда короткая последовательность
+    не будет принята за нарушения порядка. Статистика при этом накапливается.
+
+    Пример использования:
+        tracker = SequenceTracker()
+        for package in packages:
+            tracker.update(package.package_num)
+        print(tracker.stats)
+    """
+
+    def __init__(self, bits: int = 32, reorder_window: int = _REORDER_WINDOW,
+                 max_jump: int = _MAX_JUMP):
+        """
+        Args:
+            bits (int):           Разрядность счётчика номеров.
+            reorder_window (int): Наибольший шаг назад, считающийся нарушением порядка.
+            max_jump (int):       Наибольший шаг вперёд, принимаемый без подтверждения.
+        """
+        self._modulus: int = 1 << bits
+        self._half: int = 1 << (bits - 1)
+        self._reorder_window: int = reorder_window
+        self._max_jump: int = min(max_jump, self._half - 1)
+        self._last: Optional[int] = None       # Наибольший полученный номер
+        self._pending: Optional[int] = None    # Номер после скачка, ждущий подтверждения
+        self._stats: SequenceStats = SequenceStats()
+
+    # =============================================================
+    # =================== Публичные методы ========================
+    # =============================================================
+
+    @property
+    def num_packages(self) -> int:
+        """Количество учтённых номеров."""
+        return self._stats.num_packages
+
+    @property
+    def stats(self) -> SequenceStats:
+        """Копия текущей статистики (безопасно передавать в другие задачи)."""
+        s = self._stats
+        return SequenceStats(s.num_packages, s.num_gaps, s.num_lost, s.num_duplicates,
+                             s.num_reordered, s.num_restarts, s.num_corrupt, s.max_gap,
+                             s.gap_histogram.copy())
+
+    def update(self, number: int) -> None:
+        """Учитывает очередной номер пакета.
+
+        Args:
+            number (int): Номер пакета в порядке приёма.
+        """
+        self._stats.num_packages += 1
+
+        last = self._last
+        if last is None:
+            self._last = number
+            return
+
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            if self._is_plausible((number - pending) % self._modulus):
+                # Следующий номер продолжает скачок — нумерация началась заново
+                self._stats.num_restarts += 1
+                self._last = pending
+                self._step(number)
+                return
+            # Отложенный номер — выброс, текущий сравнивается с прежней последовательностью
+            self._stats.num_corrupt += 1
+
+        self._step(number)
+
+    def update_many(self, numbers: np.ndarray) -> None:
+        """Учитывает массив номеров пакетов в порядке приёма.
+
+        Результат совпадает с поочерёдными вызовами update, но участки,
+        где номера растут ровно на 1, учитываются целиком, без цикла Python.
+
+        Args:
+            numbers (np.ndarray): Номера пакетов в порядке приёма.
+        """
+        numbers = np.asarray(numbers, dtype=np.int64)
+        if numbers.size == 0:
+            return
+
+        # Границы участков, внутри которых номера идут подряд
+        breaks = np.flatnonzero(np.diff(numbers) % self._modulus != 1) + 1
+        bounds = [0, *breaks.tolist(), numbers.size]
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            pos = start
+            while pos < stop:
+                number = int(numbers[pos])
+                self.update(number)
+                pos += 1
+                if self._pending is None and self._last == number:
+                    break
+            if pos < stop:
+                # Опорный номер совпал с последним учтённым — остаток участка без разрывов
+                self._stats.num_packages += stop - pos
+                self._last = int(numbers[stop - 1])
+
+    def restart(self) -> None:
+        """Нумерация начинается заново: следующий номер станет опорным.
+
+        Накопленная статистика сохраняется.
+        """
+        if self._last is not None:
+            self._stats.num_restarts += 1
+            self._last = None
+        if self._pending is not None:
+            self._stats.num_corrupt += 1
+            self._pending = None
+
+    def reset(self) -> None:
+        """Сбрасывает статистику и опорный номер."""
+        self._last = None
+        self._pending = None
+        self._stats = SequenceStats()
+
+    # =============================================================
+    # ================= Внутренняя логика =========================
+    # =============================================================
+
+    def _is_plausible(self, step: int) -> bool:
+        """Шаг от опорного номера не требует подтверждения (не скачок)."""
+        return step <= self._max_jump or self._modulus - step <= self._reorder_window
+
+    def _step(self, number: int) -> None:
+        """Сравнивает номер с опорным; скачок откладывается до подтверждения."""
+        stats = self._stats
+        step = (number - self._last) % self._modulus
+        if step == 1:
+            self._last = number
+        elif step == 0:
+            stats.num_duplicates += 1
+        elif not self._is_plausible(step):
+            self._pending = number
+        elif step > self._half:
+            stats.num_reordered += 1
+        else:
+            lost = step - 1
+            stats.num_gaps += 1
+            stats.num_lost += lost
+            if lost > stats.max_gap:
+                stats.max_gap = lost
+            stats.gap_histogram[min(lost.bit_length() - 1, _HISTOGRAM_SIZE - 1)] += 1
+            self._last = number
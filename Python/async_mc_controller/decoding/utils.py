@@ -4,10 +4,16 @@
 Содержит вспомогательные функции для объединения списка байтов в одну
 байтовую строку и последующего преобразования в различные числовые типы
 (int, float) с использованием порядка байт little-endian.
+
+Функции bytes_to_* принимают как список однобайтовых объектов, так и
+непрерывный буфер (bytes, bytearray, memoryview). Функции buffer_to_*
+распаковывают значения прямо из буфера по смещению через предкомпилированные
+struct.Struct — без нарезки и склейки байтов.
 """
 
 # System imports
 import struct
+from typing import TypeAlias, Union
 
 # External imports
 
@@ -16,14 +22,37 @@ from async_mc_controller.decoding.common_data_description import TriaxialData
 
 #############################################
 
+# Непрерывный буфер байтов
+Buffer: TypeAlias = Union[bytes, bytearray, memoryview]
+
+# Предкомпилированные структуры для распаковки из буфера
+_FLOAT_STRUCT:     struct.Struct = struct.Struct('<f')
+_UINT32_STRUCT:    struct.Struct = struct.Struct('<I')
+_INT32_STRUCT:     struct.Struct = struct.Struct('<i')
+_TRIAXIAL_STRUCT:  struct.Struct = struct.Struct('<3f')
+
+# ------------------------------------------
+
+def frame_to_bytes(frame: Union[list[bytes], bytes, bytearray, memoryview]) -> bytes:
+    """Приводит посылку к одной байтовой строке.
+    Args:
+        frame: Список байтов (каждый элемент — байт длины 1) или непрерывный буфер.
+    Returns:
+        bytes: Последовательность байтов посылки.
+    """
+    if isinstance(frame, list):
+        return b''.join(frame)
+    return bytes(frame)
+
+
 def _join_bytes(byte_list: list[bytes]) -> bytes:
     """Объединяет список байтов в одну байтовую строку.
     Args:
-        byte_list (list[bytes]): Список байтов (каждый элемент — байт длины 1).
+        byte_list (list[bytes]): Список байтов (каждый элемент — байт длины 1) или буфер.
     Returns:
         bytes: Конкатенированная последовательность байтов.
     """
-    return b''.join(byte_list)
+    return frame_to_bytes(byte_list)
 
 
 def bytes_to_float(byte_list: list[bytes]) -> float:
@@ -95,3 +124,72 @@ def bytes_to_triaxial(byte_list: list[bytes]) -> TriaxialData:
         y_coord=bytes_to_float(byte_list[4:8]),
         z_coord=bytes_to_float(byte_list[8:12])
     )
+
+# ------------------------------------------
+# Функции для распаковки значений прямо из буфера
+# (bytes, bytearray, memoryview) без промежуточных копий
+# ------------------------------------------
+
+def buffer_to_float(buffer: Buffer, offset: int = 0) -> float:
+    """Распаковывает число с плавающей запятой (4 байта, little-endian) из буфера.
+    Args:
+        buffer: Буфер с данными.
+        offset (int): Смещение значения в буфере.
+    Returns:
+        float: Распакованное значение.
+    Raises:
+        struct.error: Если в буфере недостаточно байтов.
+    """
+    return _FLOAT_STRUCT.unpack_from(buffer, offset)[0]
+
+
+def buffer_to_uint32(buffer: Buffer, offset: int = 0) -> int:
+    """Распаковывает беззнаковое 32-битное целое (little-endian) из буфера.
+    Args:
+        buffer: Буфер с данными.
+        offset (int): Смещение значения в буфере.
+    Returns:
+        int: Беззнаковое целое число.
+    Raises:
+        struct.error: Если в буфере недостаточно байтов.
+    """
+    return _UINT32_STRUCT.unpack_from(buffer, offset)[0]
+
+
+def buffer_to_int32(buffer: Buffer, offset: int = 0) -> int:
+    """Распаковывает знаковое 32-битное целое (little-endian) из буфера.
+    Args:
+        buffer: Буфер с данными.
+        offset (int): Смещение значения в буфере.
+    Returns:
+        int: Знаковое целое число (может быть отрицательным).
+    Raises:
+        struct.error: Если в буфере недостаточно байтов.
+    """
+    return _INT32_STRUCT.unpack_from(buffer, offset)[0]
+
+
+def buffer_to_uint8(buffer: Buffer, offset: int = 0) -> int:
+    """Возвращает байт буфера (uint8_t) как целое число.
+    Args:
+        buffer: Буфер с данными.
+        offset (int): Смещение значения в буфере.
+    Returns:
+        int: Значение байта в диапазоне 0–255.
+    Raises:
+        IndexError: Если смещение выходит за пределы буфера.
+    """
+    return buffer[offset]
+
+
+def buffer_to_triaxial(buffer: Buffer, offset: int = 0) -> TriaxialData:
+    """Распаковывает три числа с плавающей запятой (12 байт) из буфера в TriaxialData.
+    Args:
+        buffer: Буфер с данными.
+        offset (int): Смещение первого значения в буфере.
+    Returns:
+        TriaxialData: Распакованные значения по трём осям.
+    Raises:
+        struct.error: Если в буфере недостаточно байтов.
+    """
+    return TriaxialData._make(_TRIAXIAL_STRUCT.unpack_from(buffer, offset))
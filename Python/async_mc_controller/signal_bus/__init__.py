@@ -8,10 +8,14 @@ __author__ = 'Roman Romanovskiy'
 # --------------------------------------------------------
 
 from .signals import Signals
-from .signal_bus import SignalBus, Subscriber
+from .signal_bus import SignalBus, Subscriber, DispatchPolicy
+from .bus_metrics import BusMetrics, SignalMetrics, HandlerMetrics
 from .subscribers import (
     NewByteSubscriber,
+    NewBytesSubscriber,
     PackageReadySubscriber,
+    PackagesReadySubscriber,
+    SequenceStatsSubscriber,
     StopExecutingSubscriber,
     StartMeasuringSubscriber,
     StopMeasuringSubscriber,
@@ -41,13 +45,22 @@ __all__ = [
     'SignalBus',
     'Subscriber',
     'Signals',
+    'DispatchPolicy',
+
+    # Метрики шины
+    'BusMetrics',
+    'SignalMetrics',
+    'HandlerMetrics',
 
     # Типизированная обёртка
     'McBus',
 
     # Протоколы подписчиков
     'NewByteSubscriber',
+    'NewBytesSubscriber',
     'PackageReadySubscriber',
+    'PackagesReadySubscriber',
+    'SequenceStatsSubscriber',
     'StopExecutingSubscriber',
     'StartMeasuringSubscriber',
     'StopMeasuringSubscriber',
@@ -0,0 +1,173 @@
+# System imports
+import time
+from typing import Any
+
+# External imports
+
+# User imports
+from .signals import Signals
+
+
+#########################
+
+
+# Корзины гистограммы длительности обработчика по степеням двойки микросекунд:
+# 0 — [0, 1) мкс, k — [2^(k-1), 2^k) мкс, последняя — всё, что дольше
+_HISTOGRAM_BUCKETS: int = 32
+
+# Перцентили длительности обработчика в snapshot()
+_PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+# ------------------------------------------
+
+class HandlerMetrics:
+    """Статистика вызовов одного подписчика сигнала.
+
+    Длительность вызова копится в логарифмической гистограмме, поэтому запись
+    стоит O(1) и не хранит отдельные замеры, а перцентили оцениваются сверху
+    границей корзины (с точностью до двух раз).
+
+    Длительность обработчика включает обработчики сигналов, которые он сам
+    эмиттит, и время ожидания внутри него (например, заполненной очереди).
+    """
+    __slots__ = ('calls', 'errors', 'total_ns', 'max_ns', 'histogram')
+
+    def __init__(self):
+        self.calls: int = 0             # Количество вызовов
+        self.errors: int = 0            # Вызовы, завершившиеся исключением
+        self.total_ns: int = 0          # Суммарная длительность, нс
+        self.max_ns: int = 0            # Максимальная длительность, нс
+        self.histogram: list[int] = [0] * _HISTOGRAM_BUCKETS
+
+    def record(self, duration_ns: int) -> None:
+        """Учитывает один вызов длительностью duration_ns."""
+        self.calls += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.histogram[min((duration_ns // 1000).bit_length(), _HISTOGRAM_BUCKETS - 1)] += 1
+
+    def percentile_us(self, percent: float) -> float:
+        """Оценка сверху перцентиля длительности, мкс (не больше максимума)."""
+        if self.calls == 0:
+            return 0.0
+        threshold = self.calls * percent / 100
+        cumulative = 0
+        for bucket, count in enumerate(self.histogram):
+            cumulative += count
+            if cumulative >= threshold:
+                return min(float(1 << bucket), self.max_ns / 1000)
+        return self.max_ns / 1000
+
+    def snapshot(self) -> dict[str, Any]:
+        """Статистика в виде словаря, пригодного для JSON."""
+        result = {
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_ms': self.total_ns / 1e6,
+            'mean_us': self.total_ns / self.calls / 1000 if self.calls else 0.0,
+        }
+        for percent in _PERCENTILES:
+            result[f'p{percent}_us'] = self.percentile_us(percent)
+        result['max_us'] = self.max_ns / 1000
+        return result
+
+# ------------------------------------------
+
+class SignalMetrics:
+    """Статистика одного сигнала: количество эмиссий и подписчики по именам."""
+    __slots__ = ('emits', 'handlers')
+
+    def __init__(self):
+        self.emits: int = 0
+        self.handlers: dict[str, HandlerMetrics] = {}
+
+    def handler(self, name: str) -> HandlerMetrics:
+        """Статистика подписчика name (создаётся при первом обращении)."""
+        metrics = self.handlers.get(name)
+        if metrics is None:
+            metrics = self.handlers[name] = HandlerMetrics()
+        return metrics
+
+# ------------------------------------------
+
+class BusMetrics:
+    """Метрики сигнальной шины: эмиссии каждого сигнала и длительность его подписчиков.
+
+    Заполняется SignalBus, у которой включены метрики (SignalBus.enable_metrics).
+    Подписчик идентифицируется так же, как в SignalBus.get_subscribers:
+    по объекту-владельцу bound-метода — в метриках это имя его класса,
+    для свободной функции — её __qualname__. Статистика подписчиков одного
+    класса на один сигнал суммируется.
+
+    Пример использования:
+        bus = SignalBus(metrics=True)
+        ...
+        report = bus.metrics.snapshot(reset=True)   # статистика за интервал
+    """
+
+    def __init__(self):
+        self._signals: dict[Signals, SignalMetrics] = {signal: SignalMetrics() for signal in Signals}
+        self._started: float = time.monotonic()    # Начало интервала накопления
+
+    def __str__(self) -> str:
+        lines = [f'🔍 Метрики сигнальной шины за {time.monotonic() - self._started:.1f} с:']
+        for signal, metrics in self._signals.items():
+            if metrics.emits == 0:
+                continue
+            lines.append(f'| {signal.value + ":":<36} {metrics.emits} эмиссий')
+            for name, handler in metrics.handlers.items():
+                lines.append(
+                    f'|   {name + ":":<34} {handler.calls} вызовов, '
+                    f'среднее {handler.total_ns / max(handler.calls, 1) / 1000:.1f} мкс, '
+                    f'p99 ≤ {handler.percentile_us(99):.0f} мкс, макс. {handler.max_ns / 1000:.0f} мкс'
+                    + (f', ошибок {handler.errors}' if handler.errors else '')
+                )
+        lines.append('| -----------------------------------------------')
+        return '\n'.join(lines) + '\n'
+
+    # =============================================================
+    # =================== Публичные методы ========================
+    # =============================================================
+
+    def signal(self, signal: Signals) -> SignalMetrics:
+        """Статистика сигнала signal."""
+        return self._signals[signal]
+
+    def snapshot(self, reset: bool = False) -> dict[str, Any]:
+        """Возвращает метрики в виде словаря, пригодного для JSON.
+
+        В результат попадают только сигналы, которые эмиттились за интервал.
+
+        Args:
+            reset: Начать новый интервал накопления после снимка.
+
+        Returns:
+            dict: {'interval_s': длительность интервала,
+                   'signals': {имя сигнала: {'emits': ..., 'handlers': {подписчик: {...}}}}}.
+        """
+        result = {
+            'interval_s': time.monotonic() - self._started,
+            'signals': {
+                signal.value: {
+                    'emits': metrics.emits,
+                    'handlers': {name: handler.snapshot() for name, handler in metrics.handlers.items()},
+                }
+                for signal, metrics in self._signals.items() if metrics.emits
+            },
+        }
+        if reset:
+            self.reset()
+        return result
+
+    def reset(self) -> None:
+        """Обнуляет метрики и начинает новый интервал накопления.
+
+        Объекты SignalMetrics и HandlerMetrics сохраняются, чтобы
+        скомпилированные кортежи обработчиков шины оставались валидными.
+        """
+        for metrics in self._signals.values():
+            metrics.emits = 0
+            for handler in metrics.handlers.values():
+                handler.__init__()
+        self._started = time.monotonic()
@@ -1,17 +1,21 @@
 # System imports
 import logging
 import sys
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 # External imports
 
 # User imports
 from async_mc_controller.logger import McLogger
 from .signals import Signals
-from .signal_bus import SignalBus
+from .signal_bus import DispatchPolicy, Emitter, SignalBus
+from .bus_metrics import BusMetrics
 from .subscribers import (
     NewByteSubscriber,
+    NewBytesSubscriber,
     PackageReadySubscriber,
+    PackagesReadySubscriber,
+    SequenceStatsSubscriber,
     StopExecutingSubscriber,
     StartMeasuringSubscriber,
     StopMeasuringSubscriber,
@@ -37,14 +41,45 @@ from async_mc_controller.byte_source.read_error import ReadError
 
 #########################
 
+class _McSignal:
+    """Базовый класс дескриптора сигнала McBus.
+
+    Наследник задаёт _signal, методы subscribe/unsubscribe и аннотацию emit
+    с сигнатурой эмиссии. Сам emit — эмиттер, собранный McBus._compile_emitter
+    один раз при создании дескриптора: вызов bus.new_bytes.emit(buf) сразу
+    перебирает кортеж обработчиков без промежуточных корутин.
+
+    Дескриптор привязан к SignalBus своего экземпляра McBus.
+    """
+    _signal: Signals
+    emit: Emitter
+
+    def __init__(self, bus: 'McBus'):
+        self._signal_bus: SignalBus = bus._signal_bus
+        self.emit = bus._compile_emitter(self._signal)
+
+# ------------------------------------------
+
 class McBus:
     """Типизированная обёртка над SignalBus для конкретного приложения.
 
     Каждый сигнал представлен отдельным вложенным классом-дескриптором,
     который инкапсулирует методы subscribe, unsubscribe и emit.
 
+    Каждый экземпляр McBus — независимая шина со своей таблицей подписчиков.
+    Декодер, источник байтов и контроллер одной McSession получают один и тот
+    же экземпляр, а несколько сессий в одном event loop (несколько тележек,
+    IMU и опорный датчик) работают каждая со своей шиной и не получают
+    сигналов друг друга.
+
+    Сигналы готовых пакетов (PACKAGE_READY, PACKAGES_READY) доставляются
+    подписчикам одновременно (DispatchPolicy.CONCURRENT): их потребители
+    (контроллер, обработчики и запись пакетов) независимы, и медленный или
+    упавший подписчик не задерживает остальных и декодер. Исключения таких
+    подписчиков логируются и учитываются в get_error_counts().
+
     Пример использования:
-        bus = McBus()
+        bus = McBus(mc_logger)
 
         class Decoder:
             async def on_byte_received(self, bt: bytes) -> None:
@@ -55,14 +90,8 @@ class McBus:
         await bus.new_byte.emit(b'\\xff')
     """
 
-    # Используемая сигнальная шина
-    _signal_bus: SignalBus = SignalBus()
-
-    # Используемый логгер
-    _logger: Optional[logging.Logger] = None
-
     # Сигналы, эмиссия которых логируется на уровне DEBUG.
-    # Высокочастотные сигналы (NEW_BYTE, PACKAGE_READY) намеренно исключены.
+    # Высокочастотные сигналы (NEW_BYTE, NEW_BYTES, PACKAGE_READY, PACKAGES_READY) намеренно исключены.
     _logged_signals: set[Signals] = {
         Signals.STOP_EXECUTING,
         Signals.START_MEASURING,
@@ -85,456 +114,485 @@ class McBus:
         Signals.COMMAND_REJECTED,
     }
 
-    @staticmethod
-    async def _emit(signal: Signals, *args: Any, **kwargs: Any) -> None:
-        """Внутренняя обёртка над _signal_bus.emit с опциональным логированием.
-    
-        Логирует эмиссию сигнала если он входит в _logged_signals
-        и уровень логирования равен DEBUG. Отправитель определяется
-        через sys._getframe() — только при необходимости логирования.
-        Используется всеми дескрипторами McBus вместо прямого вызова _signal_bus.emit.
+    # Сигналы с независимыми подписчиками, доставляемые с DispatchPolicy.CONCURRENT
+    _concurrent_signals: set[Signals] = {
+        Signals.PACKAGE_READY,
+        Signals.PACKAGES_READY,
+    }
+
+    def _compile_emitter(self, signal: Signals) -> Emitter:
+        """Собирает эмиттер сигнала один раз при создании его дескриптора.
+
+        Для сигналов вне _logged_signals возвращается эмиттер SignalBus без
+        обёрток — на частых сигналах (NEW_BYTE, NEW_BYTES, PACKAGE_READY,
+        PACKAGES_READY) эмиссия не делает ни одной лишней проверки.
+        Эмиттер логируемого сигнала пишет в лог, если уровень логирования
+        равен DEBUG. Отправитель определяется через sys._getframe() — только
+        при необходимости логирования.
         """
-        if signal in McBus._logged_signals and McBus._logger.isEnabledFor(logging.DEBUG):
-            frame  = sys._getframe(2)   # 0=_emit, 1=дескриптор emit, 2=реальный вызывающий код
-            caller = frame.f_locals.get('self', None)
-            sender = type(caller).__name__ if caller else frame.f_code.co_name
-            McBus._logger.debug(f'[{sender}] → {signal.value}')
-        await McBus._signal_bus.emit(signal, *args, **kwargs)
+        emitter = self._signal_bus.emitter(signal)
+        if signal not in self._logged_signals:
+            return emitter
+
+        logger = self._logger
+
+        async def emit(*args: Any, **kwargs: Any) -> None:
+            if logger.isEnabledFor(logging.DEBUG):
+                frame  = sys._getframe(1)   # 0=emit, 1=реальный вызывающий код
+                caller = frame.f_locals.get('self', None)
+                sender = type(caller).__name__ if caller else frame.f_code.co_name
+                logger.debug(f'[{sender}] → {signal.value}')
+            await emitter(*args, **kwargs)
+
+        return emit
 
 
     # =============================================================
     # ===================== Передача данных =======================
     # =============================================================
 
-    class NewByteSignal:
-        """Эмиттится ComPort при получении байта."""
+    class NewByteSignal(_McSignal):
+        """Эмиттится при получении одного байта.
+
+        Сохранён для совместимости: ComPort передаёт данные порциями
+        через NEW_BYTES."""
+
+        _signal = Signals.NEW_BYTE
+        emit: Callable[[bytes], Awaitable[None]]
+
+        def subscribe(self, subscriber: NewByteSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_byte_received)
+
+        def unsubscribe(self, subscriber: NewByteSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_byte_received)
+
+    # ------------------------------------------
+
+    class NewBytesSignal(_McSignal):
+        """Эмиттится ComPort при получении порции байтов."""
 
-        @staticmethod
-        def subscribe(subscriber: NewByteSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.NEW_BYTE, subscriber.on_byte_received)
+        _signal = Signals.NEW_BYTES
+        emit: Callable[[memoryview], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: NewByteSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.NEW_BYTE, subscriber.on_byte_received)
+        def subscribe(self, subscriber: NewBytesSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_bytes_received)
 
-        @staticmethod
-        async def emit(bt: bytes) -> None:
-            await McBus._emit(Signals.NEW_BYTE, bt)
+        def unsubscribe(self, subscriber: NewBytesSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_bytes_received)
 
     # ------------------------------------------
 
-    class PackageReadySignal:
+    class PackageReadySignal(_McSignal):
         """Эмиттится Decoder при успешной сборке пакета."""
 
-        @staticmethod
-        def subscribe(subscriber: PackageReadySubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.PACKAGE_READY, subscriber.on_package_ready)
+        _signal = Signals.PACKAGE_READY
+        emit: Callable[[Any], Awaitable[None]]
+
+        def subscribe(self, subscriber: PackageReadySubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_package_ready)
+
+        def unsubscribe(self, subscriber: PackageReadySubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_package_ready)
+
+    # ------------------------------------------
 
-        @staticmethod
-        def unsubscribe(subscriber: PackageReadySubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.PACKAGE_READY, subscriber.on_package_ready)
+    class PackagesReadySignal(_McSignal):
+        """Эмиттится Decoder пачкой пакетов, собранных из одной порции байтов."""
+
+        _signal = Signals.PACKAGES_READY
+        emit: Callable[[list], Awaitable[None]]
+
+        def subscribe(self, subscriber: PackagesReadySubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_packages_ready)
+
+        def unsubscribe(self, subscriber: PackagesReadySubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_packages_ready)
+
+    # ------------------------------------------
 
-        @staticmethod
-        async def emit(data) -> None:
-            await McBus._emit(Signals.PACKAGE_READY, data)
+    class SequenceStatsSignal(_McSignal):
+        """Эмиттится Decoder с периодической статистикой непрерывности номеров пакетов."""
+
+        _signal = Signals.SEQUENCE_STATS
+        emit: Callable[[Any], Awaitable[None]]
+
+        def subscribe(self, subscriber: SequenceStatsSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_sequence_stats)
+
+        def unsubscribe(self, subscriber: SequenceStatsSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_sequence_stats)
 
     # =============================================================
     # =================== Управление измерением ===================
     # =============================================================
 
-    class StopExecutingSignal:
+    class StopExecutingSignal(_McSignal):
         """Эмиттится контроллером для штатного завершения работы"""
 
-        @staticmethod
-        def subscribe(subscriber: StopExecutingSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.STOP_EXECUTING, subscriber.on_stop_executing)
+        _signal = Signals.STOP_EXECUTING
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: StopExecutingSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.STOP_EXECUTING, subscriber.on_stop_executing)
+        def subscribe(self, subscriber: StopExecutingSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_stop_executing)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.STOP_EXECUTING)
+        def unsubscribe(self, subscriber: StopExecutingSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_stop_executing)
 
-    class StartMeasuringSignal:
+    class StartMeasuringSignal(_McSignal):
         """Эмиттится контроллером для запуска чтения."""
 
-        @staticmethod
-        def subscribe(subscriber: StartMeasuringSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.START_MEASURING, subscriber.on_start_measuring)
+        _signal = Signals.START_MEASURING
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: StartMeasuringSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.START_MEASURING, subscriber.on_start_measuring)
+        def subscribe(self, subscriber: StartMeasuringSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_start_measuring)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.START_MEASURING)
+        def unsubscribe(self, subscriber: StartMeasuringSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_start_measuring)
 
     # ------------------------------------------
 
-    class StopMeasuringSignal:
+    class StopMeasuringSignal(_McSignal):
         """Эмиттится контроллером для остановки чтения."""
 
-        @staticmethod
-        def subscribe(subscriber: StopMeasuringSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.STOP_MEASURING, subscriber.on_stop_measuring)
+        _signal = Signals.STOP_MEASURING
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: StopMeasuringSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.STOP_MEASURING, subscriber.on_stop_measuring)
+        def subscribe(self, subscriber: StopMeasuringSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_stop_measuring)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.STOP_MEASURING)
+        def unsubscribe(self, subscriber: StopMeasuringSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_stop_measuring)
 
     # ------------------------------------------
 
-    class StartCalibrationSignal:
+    class StartCalibrationSignal(_McSignal):
         """Эмиттится контроллером для запуска калибровки датчиков."""
 
-        @staticmethod
-        def subscribe(subscriber: StartCalibrationSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.START_CALIBRATION, subscriber.on_start_calibration)
+        _signal = Signals.START_CALIBRATION
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: StartCalibrationSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.START_CALIBRATION, subscriber.on_start_calibration)
+        def subscribe(self, subscriber: StartCalibrationSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_start_calibration)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.START_CALIBRATION)
+        def unsubscribe(self, subscriber: StartCalibrationSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_start_calibration)
 
     # ------------------------------------------
 
-    class StopCalibrationSignal:
+    class StopCalibrationSignal(_McSignal):
         """Эмиттится контроллером при завершении калибровки датчиков."""
 
-        @staticmethod
-        def subscribe(subscriber: StopCalibrationSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.STOP_CALIBRATION, subscriber.on_stop_calibration)
+        _signal = Signals.STOP_CALIBRATION
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: StopCalibrationSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.STOP_CALIBRATION, subscriber.on_stop_calibration)
+        def subscribe(self, subscriber: StopCalibrationSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_stop_calibration)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.STOP_CALIBRATION)
+        def unsubscribe(self, subscriber: StopCalibrationSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_stop_calibration)
 
     # ------------------------------------------
 
-    class StartStaticInitSignal:
+    class StartStaticInitSignal(_McSignal):
         """Эмиттится контроллером для запуска сбора статического буфера."""
 
-        @staticmethod
-        def subscribe(subscriber: StartStaticInitSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.START_STATIC_INIT, subscriber.on_start_static_init)
+        _signal = Signals.START_STATIC_INIT
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: StartStaticInitSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.START_STATIC_INIT, subscriber.on_start_static_init)
+        def subscribe(self, subscriber: StartStaticInitSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_start_static_init)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.START_STATIC_INIT)
+        def unsubscribe(self, subscriber: StartStaticInitSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_start_static_init)
 
     # ------------------------------------------
 
-    class StopStaticInitSignal:
+    class StopStaticInitSignal(_McSignal):
         """Эмиттится контроллером при завершении сбора статического буфера."""
 
-        @staticmethod
-        def subscribe(subscriber: StopStaticInitSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.STOP_STATIC_INIT, subscriber.on_stop_static_init)
+        _signal = Signals.STOP_STATIC_INIT
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: StopStaticInitSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.STOP_STATIC_INIT, subscriber.on_stop_static_init)
+        def subscribe(self, subscriber: StopStaticInitSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_stop_static_init)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.STOP_STATIC_INIT)
+        def unsubscribe(self, subscriber: StopStaticInitSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_stop_static_init)
 
     # ------------------------------------------
 
-    class InterruptMeasuringSignal:
+    class InterruptMeasuringSignal(_McSignal):
         """Эмиттится контроллером при аварийной остановке (HANDSHAKE_FAILED,
         DEVICE_LOST, COMMAND_ACK_TIMEOUT, COMMAND_REJECTED, READ_ERROR).
 
         В отличие от STOP_MEASURING, означает «связь с МК нарушена —
         не пытаться послать ему завершающие команды»."""
 
-        @staticmethod
-        def subscribe(subscriber: InterruptMeasuringSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.INTERRUPT_MEASURING, subscriber.on_interrupt_measuring)
+        _signal = Signals.INTERRUPT_MEASURING
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: InterruptMeasuringSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.INTERRUPT_MEASURING, subscriber.on_interrupt_measuring)
+        def subscribe(self, subscriber: InterruptMeasuringSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_interrupt_measuring)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.INTERRUPT_MEASURING)
+        def unsubscribe(self, subscriber: InterruptMeasuringSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_interrupt_measuring)
 
     # ------------------------------------------
 
-    class ReadErrorSignal:
+    class ReadErrorSignal(_McSignal):
         """Эмиттится AsyncComPort.reading_loop при перехвате ComPortReadError.
 
         Слушает только контроллером — выставляет _force_stop. Сам ComPort на
         этот сигнал не подписан: о необходимости остановки он узнаёт через
         INTERRUPT_MEASURING, который контроллером эмиттит из stop()."""
 
-        @staticmethod
-        def subscribe(subscriber: ReadErrorSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.READ_ERROR, subscriber.on_read_error)
+        _signal = Signals.READ_ERROR
+        emit: Callable[['ReadError'], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: ReadErrorSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.READ_ERROR, subscriber.on_read_error)
+        def subscribe(self, subscriber: ReadErrorSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_read_error)
 
-        @staticmethod
-        async def emit(err: 'ReadError') -> None:
-            await McBus._emit(Signals.READ_ERROR, err)
+        def unsubscribe(self, subscriber: ReadErrorSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_read_error)
 
     # =============================================================
     # ====================== Рукопожатие =========================
     # =============================================================
 
-    class HandshakeInitSignal:
+    class HandshakeInitSignal(_McSignal):
         """Эмиттится AsyncComPortImu в начале процедуры рукопожатия.
 
         Семантика: «начинается работа с неизвестным МК — обнулить
         накопленное состояние, чтобы первый байт нового сеанса
         разбирался с чистого листа»."""
 
-        @staticmethod
-        def subscribe(subscriber: HandshakeInitSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.HANDSHAKE_INIT, subscriber.on_handshake_init)
+        _signal = Signals.HANDSHAKE_INIT
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: HandshakeInitSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.HANDSHAKE_INIT, subscriber.on_handshake_init)
+        def subscribe(self, subscriber: HandshakeInitSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_handshake_init)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.HANDSHAKE_INIT)
+        def unsubscribe(self, subscriber: HandshakeInitSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_handshake_init)
 
     # ------------------------------------------
 
-    class HandshakeDoneSignal:
+    class HandshakeDoneSignal(_McSignal):
         """Эмиттится Decoder при получении ACK рукопожатия."""
 
-        @staticmethod
-        def subscribe(subscriber: HandshakeDoneSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.HANDSHAKE_DONE, subscriber.on_handshake_done)
+        _signal = Signals.HANDSHAKE_DONE
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: HandshakeDoneSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.HANDSHAKE_DONE, subscriber.on_handshake_done)
+        def subscribe(self, subscriber: HandshakeDoneSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_handshake_done)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.HANDSHAKE_DONE)
+        def unsubscribe(self, subscriber: HandshakeDoneSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_handshake_done)
 
     # ------------------------------------------
 
-    class HandshakeFailedSignal:
+    class HandshakeFailedSignal(_McSignal):
         """Эмиттится AsyncComPortImu при таймауте рукопожатия."""
 
-        @staticmethod
-        def subscribe(subscriber: HandshakeFailedSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.HANDSHAKE_FAILED, subscriber.on_handshake_failed)
+        _signal = Signals.HANDSHAKE_FAILED
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: HandshakeFailedSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.HANDSHAKE_FAILED, subscriber.on_handshake_failed)
+        def subscribe(self, subscriber: HandshakeFailedSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_handshake_failed)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.HANDSHAKE_FAILED)
+        def unsubscribe(self, subscriber: HandshakeFailedSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_handshake_failed)
 
     # =============================================================
     # ======================== Heartbeat ==========================
     # =============================================================
 
-    class HeartbeatSentSignal:
+    class HeartbeatSentSignal(_McSignal):
         """Эмиттится AsyncComPortImu перед отправкой heartbeat."""
 
-        @staticmethod
-        def subscribe(subscriber: HeartbeatSentSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.HEARTBEAT_SENT, subscriber.on_heartbeat_sent)
+        _signal = Signals.HEARTBEAT_SENT
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: HeartbeatSentSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.HEARTBEAT_SENT, subscriber.on_heartbeat_sent)
+        def subscribe(self, subscriber: HeartbeatSentSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_heartbeat_sent)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.HEARTBEAT_SENT)
+        def unsubscribe(self, subscriber: HeartbeatSentSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_heartbeat_sent)
 
     # ------------------------------------------
 
-    class HeartbeatAckSignal:
+    class HeartbeatAckSignal(_McSignal):
         """Эмиттится Decoder при получении heartbeat ACK от МК."""
 
-        @staticmethod
-        def subscribe(subscriber: HeartbeatAckSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.HEARTBEAT_ACK, subscriber.on_heartbeat_ack)
+        _signal = Signals.HEARTBEAT_ACK
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: HeartbeatAckSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.HEARTBEAT_ACK, subscriber.on_heartbeat_ack)
+        def subscribe(self, subscriber: HeartbeatAckSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_heartbeat_ack)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.HEARTBEAT_ACK)
+        def unsubscribe(self, subscriber: HeartbeatAckSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_heartbeat_ack)
 
     # ------------------------------------------
 
-    class DeviceLostSignal:
+    class DeviceLostSignal(_McSignal):
         """Эмиттится AsyncComPortImu при таймауте heartbeat."""
 
-        @staticmethod
-        def subscribe(subscriber: DeviceLostSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.DEVICE_LOST, subscriber.on_device_lost)
+        _signal = Signals.DEVICE_LOST
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: DeviceLostSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.DEVICE_LOST, subscriber.on_device_lost)
+        def subscribe(self, subscriber: DeviceLostSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_device_lost)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.DEVICE_LOST)
+        def unsubscribe(self, subscriber: DeviceLostSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_device_lost)
 
     # =============================================================
     # ==================== Подтверждение команд ===================
     # =============================================================
 
-    class CommandSentSignal:
+    class CommandSentSignal(_McSignal):
         """Эмиттится AsyncComPortImu перед отправкой команды с подтверждением."""
 
-        @staticmethod
-        def subscribe(subscriber: CommandSentSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.COMMAND_SENT, subscriber.on_command_sent)
+        _signal = Signals.COMMAND_SENT
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: CommandSentSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.COMMAND_SENT, subscriber.on_command_sent)
+        def subscribe(self, subscriber: CommandSentSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_command_sent)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.COMMAND_SENT)
+        def unsubscribe(self, subscriber: CommandSentSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_command_sent)
 
     # ------------------------------------------
 
-    class CommandAckSignal:
+    class CommandAckSignal(_McSignal):
         """Эмиттится Decoder при получении подтверждения команды от МК."""
 
-        @staticmethod
-        def subscribe(subscriber: CommandAckSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.COMMAND_ACK, subscriber.on_command_ack)
+        _signal = Signals.COMMAND_ACK
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: CommandAckSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.COMMAND_ACK, subscriber.on_command_ack)
+        def subscribe(self, subscriber: CommandAckSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_command_ack)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.COMMAND_ACK)
+        def unsubscribe(self, subscriber: CommandAckSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_command_ack)
 
     # ------------------------------------------
 
-    class CommandAckTimeoutSignal:
+    class CommandAckTimeoutSignal(_McSignal):
         """Эмиттится AsyncComPortImu при таймауте подтверждения команды."""
 
-        @staticmethod
-        def subscribe(subscriber: CommandAckTimeoutSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.COMMAND_ACK_TIMEOUT, subscriber.on_command_ack_timeout)
+        _signal = Signals.COMMAND_ACK_TIMEOUT
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: CommandAckTimeoutSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.COMMAND_ACK_TIMEOUT, subscriber.on_command_ack_timeout)
+        def subscribe(self, subscriber: CommandAckTimeoutSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_command_ack_timeout)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.COMMAND_ACK_TIMEOUT)
+        def unsubscribe(self, subscriber: CommandAckTimeoutSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_command_ack_timeout)
 
     # ------------------------------------------
 
-    class CommandRejectedSignal:
+    class CommandRejectedSignal(_McSignal):
         """Эмиттится ImuDecoder при получении от МК сообщения 'UNKNOWN_COMMAND'.
 
         Семантически — третий исход команды от ПК (наряду с COMMAND_ACK и
         COMMAND_ACK_TIMEOUT): МК ответил, но не понял команду — программная
         ошибка контракта ПК↔МК."""
 
-        @staticmethod
-        def subscribe(subscriber: CommandRejectedSubscriber) -> None:
-            McBus._signal_bus.subscribe(Signals.COMMAND_REJECTED, subscriber.on_command_rejected)
+        _signal = Signals.COMMAND_REJECTED
+        emit: Callable[[], Awaitable[None]]
 
-        @staticmethod
-        def unsubscribe(subscriber: CommandRejectedSubscriber) -> None:
-            McBus._signal_bus.unsubscribe(Signals.COMMAND_REJECTED, subscriber.on_command_rejected)
+        def subscribe(self, subscriber: CommandRejectedSubscriber) -> None:
+            self._signal_bus.subscribe(self._signal, subscriber.on_command_rejected)
 
-        @staticmethod
-        async def emit() -> None:
-            await McBus._emit(Signals.COMMAND_REJECTED)
+        def unsubscribe(self, subscriber: CommandRejectedSubscriber) -> None:
+            self._signal_bus.unsubscribe(self._signal, subscriber.on_command_rejected)
 
     # =============================================================
     # ===================== Интроспекция ==========================
     # =============================================================
 
-    @staticmethod
-    def get_subscribers() -> dict[Signals, list[object]]:
-        """Возвращает текущих подписчиков всех сигналов в виде объектов-владельцев.
+    def get_subscribers(self) -> dict[Signals, list[object]]:
+        """Возвращает текущих подписчиков всех сигналов этой шины в виде объектов-владельцев.
 
         Тонкая делегирующая обёртка над `SignalBus.get_subscribers()`,
-        чтобы пользователи `McBus.` могли пользоваться им как единой точкой
-        входа и не обращались к приватному модульному `McBus._bus` напрямую.
+        чтобы пользователи `McBus` могли пользоваться им как единой точкой
+        входа и не обращались к приватной `_signal_bus` напрямую.
 
         Returns:
             dict[Signals, list[object]]: Словарь {сигнал: [объекты-подписчики]}.
                 Сигналы без подписчиков попадают в результат с пустым списком.
         """
-        return McBus._signal_bus.get_subscribers()
+        return self._signal_bus.get_subscribers()
+
+    @property
+    def metrics(self) -> Optional[BusMetrics]:
+        """Метрики шины (эмиссии сигналов и длительность подписчиков) или None, если они выключены."""
+        return self._signal_bus.metrics
+
+    def enable_metrics(self) -> BusMetrics:
+        """Включает сбор метрик шины, см. `SignalBus.enable_metrics()`."""
+        return self._signal_bus.enable_metrics()
+
+    def disable_metrics(self) -> None:
+        """Выключает сбор метрик шины."""
+        self._signal_bus.disable_metrics()
+
+    def set_dispatch_policy(self, signal: Signals, policy: DispatchPolicy) -> None:
+        """Задаёт способ доставки сигнала подписчикам, см. `SignalBus.set_dispatch_policy()`."""
+        self._signal_bus.set_dispatch_policy(signal, policy)
+
+    def get_error_counts(self) -> dict[Signals, dict[str, int]]:
+        """Количество исключений подписчиков по сигналам, см. `SignalBus.get_error_counts()`."""
+        return self._signal_bus.get_error_counts()
 
     # =============================================================
 
-    def __init__(self, mc_logger: McLogger):
-        McBus._logger = mc_logger.get_child_logger("McBus")
+    def __init__(self, mc_logger: McLogger, metrics: bool = False):
+        """
+        Args:
+            mc_logger: Логгер приложения.
+            metrics:   Сразу включить сбор метрик шины (см. enable_metrics).
+        """
+        self._logger: logging.Logger = mc_logger.get_child_logger("McBus")     # Логгер эмиссии сигналов
+        self._signal_bus: SignalBus = SignalBus(metrics, self._logger)         # Таблица подписчиков этой шины
+        for signal in self._concurrent_signals:
+            self._signal_bus.set_dispatch_policy(signal, DispatchPolicy.CONCURRENT)
 
         # Передача данных
-        self.new_byte = McBus.NewByteSignal()
-        self.package_ready = McBus.PackageReadySignal()
+        self.new_byte = McBus.NewByteSignal(self)
+        self.new_bytes = McBus.NewBytesSignal(self)
+        self.package_ready = McBus.PackageReadySignal(self)
+        self.packages_ready = McBus.PackagesReadySignal(self)
+        self.sequence_stats = McBus.SequenceStatsSignal(self)
 
         # Управление измерением
-        self.stop_executing = McBus.StopExecutingSignal()
-        self.start_measuring = McBus.StartMeasuringSignal()
-        self.stop_measuring = McBus.StopMeasuringSignal()
-        self.interrupt_measuring = McBus.InterruptMeasuringSignal()
-        self.start_calibration = McBus.StartCalibrationSignal()
-        self.start_static_init = McBus.StartStaticInitSignal()
-        self.stop_calibration = McBus.StopCalibrationSignal()
-        self.stop_static_init = McBus.StopStaticInitSignal()
+        self.stop_executing = McBus.StopExecutingSignal(self)
+        self.start_measuring = McBus.StartMeasuringSignal(self)
+        self.stop_measuring = McBus.StopMeasuringSignal(self)
+        self.interrupt_measuring = McBus.InterruptMeasuringSignal(self)
+        self.start_calibration = McBus.StartCalibrationSignal(self)
+        self.start_static_init = McBus.StartStaticInitSignal(self)
+        self.stop_calibration = McBus.StopCalibrationSignal(self)
+        self.stop_static_init = McBus.StopStaticInitSignal(self)
 
         # Ошибки чтения
-        self.read_error = McBus.ReadErrorSignal()
+        self.read_error = McBus.ReadErrorSignal(self)
 
         # Рукопожатие
-        self.handshake_init = McBus.HandshakeInitSignal()
-        self.handshake_done = McBus.HandshakeDoneSignal()
-        self.handshake_failed = McBus.HandshakeFailedSignal()
+        self.handshake_init = McBus.HandshakeInitSignal(self)
+        self.handshake_done = McBus.HandshakeDoneSignal(self)
+        self.handshake_failed = McBus.HandshakeFailedSignal(self)
 
         # Heartbeat
-        self.heartbeat_sent = McBus.HeartbeatSentSignal()
-        self.heartbeat_ack = McBus.HeartbeatAckSignal()
-        self.device_lost = McBus.DeviceLostSignal()
+        self.heartbeat_sent = McBus.HeartbeatSentSignal(self)
+        self.heartbeat_ack = McBus.HeartbeatAckSignal(self)
+        self.device_lost = McBus.DeviceLostSignal(self)
 
         # Подтверждение команд
-        self.command_sent = McBus.CommandSentSignal()
-        self.command_ack = McBus.CommandAckSignal()
-        self.command_ack_timeout = McBus.CommandAckTimeoutSignal()
-        self.command_rejected = McBus.CommandRejectedSignal()
\ No newline at end of file
+        self.command_sent = McBus.CommandSentSignal(self)
+        self.command_ack = McBus.CommandAckSignal(self)
+        self.command_ack_timeout = McBus.CommandAckTimeoutSignal(self)
+        self.command_rejected = McBus.CommandRejectedSignal(self)
\ No newline at end of file
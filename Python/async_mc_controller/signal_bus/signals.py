@@ -19,10 +19,13 @@ class Signals(Enum):
     """
 
     # ComPort → Decoder
-    NEW_BYTE = 'NewByte'
+    NEW_BYTE  = 'NewByte'
+    NEW_BYTES = 'NewBytes'
 
     # Decoder → Controller
-    PACKAGE_READY = 'PackageReady'
+    PACKAGE_READY  = 'PackageReady'
+    PACKAGES_READY = 'PackagesReady'
+    SEQUENCE_STATS = 'SequenceStats'
 
     # Controller → ComPort
     STOP_EXECUTING      = 'StopExecuting'
@@ -41,6 +41,25 @@ class NewByteSubscriber(Protocol):
     async def on_byte_received(self, bt: bytes) -> None: ...
 
 
+# ------------------------------------------
+
+class NewBytesSubscriber(Protocol):
+    """Протокол подписчика сигнала Signals.NEW_BYTES.
+
+    Любой объект, реализующий метод on_bytes_received, может быть
+    передан в McBus.new_bytes.subscribe().
+
+    Буфер гарантированно валиден только на время вызова обработчика:
+    если подписчику нужно сохранить данные, он копирует их сам.
+
+    Пример реализации:
+        class Decoder:
+            async def on_bytes_received(self, buf: memoryview) -> None:
+                self._queue.put_nowait(bytes(buf))
+    """
+    async def on_bytes_received(self, buf: memoryview) -> None: ...
+
+
 # ------------------------------------------
 
 class PackageReadySubscriber(Protocol):
@@ -57,6 +76,38 @@ class PackageReadySubscriber(Protocol):
     async def on_package_ready(self, data) -> None: ...
 
 
+# ------------------------------------------
+
+class PackagesReadySubscriber(Protocol):
+    """Протокол подписчика сигнала Signals.PACKAGES_READY.
+
+    Любой объект, реализующий метод on_packages_ready, может быть
+    передан в McBus.packages_ready.subscribe().
+
+    Пример реализации:
+        class Controller:
+            async def on_packages_ready(self, batch: list[ImuData]) -> None:
+                self._received_data.extend(batch)
+    """
+    async def on_packages_ready(self, batch: list) -> None: ...
+
+
+# ------------------------------------------
+
+class SequenceStatsSubscriber(Protocol):
+    """Протокол подписчика сигнала Signals.SEQUENCE_STATS.
+
+    Любой объект, реализующий метод on_sequence_stats, может быть
+    передан в McBus.sequence_stats.subscribe().
+
+    Пример реализации:
+        class Controller:
+            async def on_sequence_stats(self, stats: SequenceStats) -> None:
+                self._logger.info(f'Потери: {stats.loss_rate:.2%}')
+    """
+    async def on_sequence_stats(self, stats) -> None: ...
+
+
 # ------------------------------------------
 
 class StopExecutingSubscriber(Protocol):
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Конвертер бинарных файлов потока Telega в наборы данных.
+
+Преобразует один или несколько .bin файлов (см. DecoderTelega.setup_bin_file)
+в CSV-файлы того же формата, что пишет приложение и читает
+data_analys.load_run_csv, и при необходимости в колонночные .npy/.npz.
+
+Большие файлы делятся на диапазоны, которые декодируются параллельно в пуле
+процессов; на границах диапазонов декодер синхронизируется по заголовку
+и учитывает посылки, пересекающие границу, поэтому результат совпадает
+с декодированием файла целиком.
+
+Примеры:
+    python bin_to_dataset.py telega_measuring_1.bin
+    python bin_to_dataset.py runs/ -o datasets --formats csv npz --workers 4
+"""
+
+# System imports
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from multiprocessing import freeze_support
+from pathlib import Path
+from typing import Iterator, Optional
+
+# External imports
+
+# User imports
+from telega_session.bin_decoder import BinDecodeResult
+from telega_session.bin_decoder import decode_bin_file, merge_results, count_package_gaps
+from telega_session.dataset_export import DATASET_FORMATS, to_dataset, save_dataset
+
+##########################################################
+
+_DEFAULT_CHUNK_MB: int = 64
+
+# ------------------------------------------
+
+def split_ranges(file_size: int, chunk_size: int) -> list[tuple[int, int]]:
+    """Делит файл на последовательные диапазоны [start, stop) размером chunk_size."""
+    if file_size == 0:
+        return [(0, 0)]
+    return [(start, min(start + chunk_size, file_size)) for start in range(0, file_size, chunk_size)]
+
+
+def decode_files(paths: list[Path], chunk_size: int,
+                 executor: Optional[Executor] = None,
+                 max_pending: int = 1) -> Iterator[tuple[Path, BinDecodeResult]]:
+    """Декодирует файлы по диапазонам и выдаёт результаты в порядке paths.
+
+    Диапазоны всех файлов образуют одну очередь задач: в executor одновременно
+    отправляется не больше max_pending диапазонов, поэтому мелкие файлы тоже
+    декодируются параллельно, а в памяти не копятся результаты всей очереди.
+    Без executor диапазоны декодируются в текущем процессе.
+    """
+    tasks = deque(
+        (path, start, stop, stop == ranges[-1][1])
+        for path in paths
+        for ranges in [split_ranges(path.stat().st_size, chunk_size)]
+        for start, stop in ranges
+    )
+    pending: deque[tuple[Path, bool, Future]] = deque()
+    parts: list[BinDecodeResult] = []
+
+    while tasks or pending:
+        if executor is None:
+            path, start, stop, is_last = tasks.popleft()
+            parts.append(decode_bin_file(path, start, stop))
+        else:
+            while tasks and len(pending) < max_pending:
+                path, start, stop, is_last = tasks.popleft()
+                pending.append((path, is_last, executor.submit(decode_bin_file, path, start, stop)))
+            path, is_last, future = pending.popleft()
+            parts.append(future.result())
+
+        if is_last:
+            yield path, merge_results(parts)
+            parts = []
+
+# =============================================================
+# ======================= CLI =================================
+# =============================================================
+
+def _collect_inputs(inputs: list[str]) -> list[Path]:
+    """Раскрывает директории в список .bin файлов."""
+    paths = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            paths.extend(sorted(path.glob('*.bin')))
+        else:
+            paths.append(path)
+    return paths
+
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Конвертация бинарных файлов потока Telega в CSV/NPY/NPZ.'
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help='.bin файлы или директории с ними')
+    parser.add_argument('-o', '--output-dir', type=Path, default=None,
+                        help='Директория для результатов. По умолчанию рядом с исходным файлом')
+    parser.add_argument('-f', '--formats', nargs='+', choices=DATASET_FORMATS, default=['csv'],
+                        help='Форматы выходных файлов. По умолчанию csv')
+    parser.add_argument('--sep', default=' ',
+                        help='Разделитель полей CSV. По умолчанию пробел')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help='Количество процессов декодирования. 1 — без пула процессов')
+    parser.add_argument('--chunk-mb', type=int, default=_DEFAULT_CHUNK_MB,
+                        help=f'Размер диапазона файла для одного процесса, МБ. По умолчанию {_DEFAULT_CHUNK_MB}')
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error('--workers должен быть не меньше 1')
+    if args.chunk_mb < 1:
+        parser.error('--chunk-mb должен быть не меньше 1')
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Запуск конвертера. Возвращает код завершения процесса."""
+    args = _parse_args(argv)
+    chunk_size = args.chunk_mb * 1024 * 1024
+    exit_code = 0
+
+    paths = []
+    for path in _collect_inputs(args.inputs):
+        if path.is_file():
+            paths.append(path)
+        else:
+            print(f'❌ Файл {path} не найден', file=sys.stderr)
+            exit_code = 1
+
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    try:
+        started = time.perf_counter()
+        for path, result in decode_files(paths, chunk_size, executor, max_pending=2 * args.workers):
+            dataset = to_dataset(result.data)
+            output_dir = args.output_dir if args.output_dir is not None else path.parent
+            saved = save_dataset(dataset, output_dir / path.stem, args.formats, args.sep)
+
+            print(f'📄 {path} → {", ".join(str(p) for p in saved)}')
+            print(result.report)
+            print(count_package_gaps(dataset['PackageNum']))
+        print(f'⏱ Обработано файлов: {len(paths)} за {time.perf_counter() - started:.2f} c')
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return exit_code
+
+# =============================================================
+
+if __name__ == '__main__':
+    freeze_support()
+    sys.exit(main())
@@ -0,0 +1,484 @@
+# -*- coding: utf-8 -*-
+"""Бенчмарк пропускной способности декодера потока Telega.
+
+Генерирует синтетический поток МК → ПК с настраиваемыми помехами (мусорные
+байты, ложные заголовки, обрезанные посылки, ошибки контрольной суммы,
+текстовые сообщения) и прогоняет его через DecoderTelega без COM-порта:
+порции подаются прямо в сигнал NEW_BYTES шины McBus.
+
+Для каждого сочетания профиля помех, движка (DecoderEngine) и схемы
+(DecoderPipeline) измеряются:
+    - пропускная способность, байт/с и посылок/с;
+    - задержка посылки — от подачи порции с её последним байтом до получения
+      пакета подписчиком (перцентили p50/p90/p99 и максимум);
+    - процессорное время;
+    - пиковый объём памяти Python (tracemalloc, отдельным прогоном, чтобы
+      трассировка не искажала время).
+
+Логирование декодера отключено (уровень ERROR): измеряется сам разбор.
+По умолчанию поток подаётся максимально быстро, и в схеме QUEUED задержка
+включает ожидание в очередях декодера; --rate задаёт темп реального канала.
+Результаты пишутся в JSON; файл предыдущего запуска можно передать в
+--compare, чтобы увидеть изменение пропускной способности.
+
+Примеры:
+    python decoder_benchmark.py
+    python decoder_benchmark.py --frames 200000 --profiles noisy hostile --engines BUFFER
+    python decoder_benchmark.py -o after.json --compare before.json
+"""
+
+# System imports
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# External imports
+import numpy as np
+
+# User imports
+from async_mc_controller.config import McConfig
+from async_mc_controller.logger import McLogger
+from async_mc_controller.signal_bus import McBus
+from async_mc_controller.decoding import DecoderEngine, DecoderPipeline
+from telega_session import DecoderTelega, TELEGA_DEVICE_SCHEMA
+from telega_session.decoder_telega import TELEGA_DTYPE
+from telega_session.packet_builders import PacketBuilderTelegaData, PacketBuilderTelegaMessage
+
+##########################################################
+
+_DEFAULT_FRAMES: int = 50_000
+_DEFAULT_CHUNK_SIZE: int = 4096
+_DEFAULT_OUTPUT: Path = Path('decoder_benchmark.json')
+
+_MESSAGE_TEXT: str = 'BENCHMARK_MESSAGE'
+_LATENCY_PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+# ------------------------------------------
+
+@dataclass(frozen=True)
+class StreamProfile:
+    """Профиль помех синтетического потока.
+
+    Вероятности задаются на одну посылку данных.
+
+    Attributes:
+        name (str):              Имя профиля в отчёте.
+        noise_rate (float):      Вставка перед посылкой от 1 до max_noise_len мусорных байтов.
+        max_noise_len (int):     Максимальная длина вставки мусора.
+        false_header_rate (float): Вставка заголовка со случайным форматом и хвостом мусора.
+        truncated_rate (float):  Посылка обрезается на случайном байте.
+        bad_crc_rate (float):    Контрольная сумма посылки искажается.
+        message_rate (float):    Вставка текстового сообщения МК.
+    """
+    name: str
+    noise_rate: float = 0.0
+    max_noise_len: int = 32
+    false_header_rate: float = 0.0
+    truncated_rate: float = 0.0
+    bad_crc_rate: float = 0.0
+    message_rate: float = 0.0
+
+
+PROFILES: dict[str, StreamProfile] = {
+    profile.name: profile for profile in (
+        StreamProfile('clean'),
+        StreamProfile('noisy', noise_rate=0.05, false_header_rate=0.01, truncated_rate=0.005,
+                      bad_crc_rate=0.01, message_rate=0.001),
+        StreamProfile('hostile', noise_rate=0.3, false_header_rate=0.05, truncated_rate=0.02,
+                      bad_crc_rate=0.05, message_rate=0.01),
+    )
+}
+
+# ------------------------------------------
+
+@dataclass
+class SyntheticStream:
+    """Сгенерированный поток и ожидаемый результат его декодирования.
+
+    Attributes:
+        data (bytes):            Байты потока.
+        frame_ends (dict):       Номер пакета → смещение за последним байтом
+                                 каждой неповреждённой посылки данных.
+        num_messages (int):      Количество неповреждённых текстовых сообщений.
+    """
+    data: bytes
+    frame_ends: dict[int, int]
+    num_messages: int = 0
+
+# ------------------------------------------
+
+@dataclass
+class BenchmarkResult:
+    """Результат одного прогона декодера."""
+    profile: str
+    engine: str
+    pipeline: str
+    lazy_data: bool
+    stream_bytes: int
+    frames_expected: int
+    frames_decoded: int
+    frames_wrong_crc: int
+    frames_recovered: int
+    wall_time_s: float
+    cpu_time_s: float
+    bytes_per_s: float
+    frames_per_s: float
+    latency_us: dict[str, Optional[float]] = field(default_factory=dict)
+    peak_memory_bytes: Optional[int] = None
+
+    @property
+    def key(self) -> tuple:
+        """Ключ для сопоставления прогонов разных запусков."""
+        return self.profile, self.engine, self.pipeline, self.lazy_data
+
+    @property
+    def label(self) -> str:
+        """Краткое имя прогона для вывода."""
+        return f'{self.profile} · {self.engine} · {self.pipeline}{" · lazy" if self.lazy_data else ""}'
+
+    def __str__(self) -> str:
+        latency = ' / '.join('—' if self.latency_us.get(f'p{p}') is None else f'{self.latency_us[f"p{p}"]:.0f}'
+                             for p in _LATENCY_PERCENTILES)
+        memory = '—' if self.peak_memory_bytes is None else f'{self.peak_memory_bytes / 2 ** 20:.1f}'
+        return (
+            f'🔍 {self.label}:\n'
+            f'| Посылок принято / ожидалось:         {self.frames_decoded} / {self.frames_expected}\n'
+            f'| Ошибки CRC / восстановлено:          {self.frames_wrong_crc} / {self.frames_recovered}\n'
+            f'| Время, с (wall / CPU):               {self.wall_time_s:.3f} / {self.cpu_time_s:.3f}\n'
+            f'| Пропускная способность, МБ/с:        {self.bytes_per_s / 2 ** 20:.2f}\n'
+            f'| Посылок в секунду:                   {self.frames_per_s:.0f}\n'
+            f'| Задержка p50 / p90 / p99, мкс:       {latency}\n'
+            f'| Пиковая память, МБ:                  {memory}\n'
+            f'| -----------------------------------------------\n'
+        )
+
+# =============================================================
+# ================= Генерация потока ==========================
+# =============================================================
+
+def generate_stream(num_frames: int, profile: StreamProfile, seed: int = 0) -> SyntheticStream:
+    """Генерирует поток из num_frames посылок данных с помехами профиля profile.
+
+    Номера пакетов идут подряд, включая повреждённые посылки, поэтому
+    повреждения видны декодеру как пропуски номеров.
+    """
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+
+    bodies = np.zeros(num_frames, dtype=TELEGA_DTYPE)
+    bodies['PackageNum'] = np.arange(num_frames)
+    bodies['Acc'] = np_rng.normal(0.0, 1.0, (num_frames, 3))
+    bodies['Gyro'] = np_rng.normal(0.0, 0.1, (num_frames, 3))
+    bodies['Temp'] = np_rng.normal(25.0, 0.5, num_frames)
+    bodies['DppCode'] = np.cumsum(np_rng.integers(0, 3, num_frames))
+    body_bytes = bodies.tobytes()
+    body_size = TELEGA_DTYPE.itemsize
+
+    header = TELEGA_DEVICE_SCHEMA.header
+    message = PacketBuilderTelegaMessage.build_message(_MESSAGE_TEXT)
+
+    parts: list[bytes] = []
+    frame_ends: dict[int, int] = {}
+    num_messages = 0
+    size = 0
+
+    def put(part: bytes) -> None:
+        nonlocal size
+        parts.append(part)
+        size += len(part)
+
+    for num in range(num_frames):
+        if rng.random() < profile.noise_rate:
+            put(rng.randbytes(rng.randint(1, profile.max_noise_len)))
+        if rng.random() < profile.false_header_rate:
+            put(header + rng.randbytes(rng.randint(1, profile.max_noise_len)))
+        if rng.random() < profile.message_rate:
+            put(message)
+            num_messages += 1
+
+        frame = PacketBuilderTelegaData.build_data_packet(body_bytes[num * body_size:(num + 1) * body_size])
+        if rng.random() < profile.truncated_rate:
+            put(frame[:rng.randint(1, len(frame) - 1)])
+        elif rng.random() < profile.bad_crc_rate:
+            put(frame[:-1] + bytes([(frame[-1] + 1) & 0xFF]))
+        else:
+            put(frame)
+            frame_ends[num] = size
+
+    return SyntheticStream(b''.join(parts), frame_ends, num_messages)
+
+# =============================================================
+# ================= Прогон декодера ===========================
+# =============================================================
+
+class _PackageSink:
+    """Подписчик, запоминающий номер и время получения каждого пакета."""
+
+    def __init__(self):
+        self.package_nums: list[int] = []
+        self.arrival_ns: list[int] = []
+
+    async def on_package_ready(self, package) -> None:
+        self.package_nums.append(package.package_num)
+        self.arrival_ns.append(time.perf_counter_ns())
+
+    async def on_packages_ready(self, packages) -> None:
+        now = time.perf_counter_ns()
+        self.package_nums.extend(package.package_num for package in packages)
+        self.arrival_ns.extend([now] * len(packages))
+
+
+def _make_logger() -> McLogger:
+    """Логгер без обработчиков с уровнем ERROR."""
+    config = McConfig()
+    config.logger_config.use_file = False
+    config.logger_config.use_console = False
+    mc_logger = McLogger(config)
+    mc_logger.set_log_level(logging.ERROR)
+    return mc_logger
+
+
+async def _run_decoder(stream: SyntheticStream, engine: DecoderEngine, pipeline: DecoderPipeline,
+                       lazy_data: bool, chunk_size: int,
+                       rate: Optional[float]) -> tuple[DecoderTelega, _PackageSink, list[int], float, float]:
+    """Подаёт поток в декодер порциями и ждёт обработки всех байтов.
+
+    Returns:
+        Декодер, подписчик, время подачи каждой порции (нс), время wall и CPU, с.
+    """
+    mc_logger = _make_logger()
+    bus = McBus(mc_logger)
+    decoder = DecoderTelega(bus, mc_logger, engine=engine, pipeline=pipeline, lazy_data=lazy_data)
+    sink = _PackageSink()
+    bus.package_ready.subscribe(sink)
+    bus.packages_ready.subscribe(sink)
+
+    data = memoryview(stream.data)
+    emit_ns: list[int] = []
+    try:
+        async with decoder:
+            started_cpu = time.process_time()
+            started = time.perf_counter()
+            for offset in range(0, len(data), chunk_size):
+                if rate is not None:
+                    delay = started + offset / rate - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                emit_ns.append(time.perf_counter_ns())
+                await bus.new_bytes.emit(data[offset:offset + chunk_size])
+            await decoder.wait_idle()
+            wall_time = time.perf_counter() - started
+            cpu_time = time.process_time() - started_cpu
+    finally:
+        bus.package_ready.unsubscribe(sink)
+        bus.packages_ready.unsubscribe(sink)
+
+    return decoder, sink, emit_ns, wall_time, cpu_time
+
+
+def _latency_us(stream: SyntheticStream, sink: _PackageSink, emit_ns: list[int],
+                chunk_size: int) -> dict[str, Optional[float]]:
+    """Перцентили задержки неповреждённых посылок, мкс (None, если посылок не получено)."""
+    latencies = [
+        arrival - emit_ns[(stream.frame_ends[num] - 1) // chunk_size]
+        for num, arrival in zip(sink.package_nums, sink.arrival_ns)
+        if num in stream.frame_ends
+    ]
+    if not latencies:
+        return {f'p{p}': None for p in _LATENCY_PERCENTILES} | {'max': None}
+
+    values = np.asarray(latencies, dtype=np.float64) / 1000
+    result = {f'p{p}': float(v) for p, v in zip(_LATENCY_PERCENTILES, np.percentile(values, _LATENCY_PERCENTILES))}
+    result['max'] = float(values.max())
+    return result
+
+
+def run_benchmark(stream: SyntheticStream, profile: StreamProfile, engine: DecoderEngine,
+                  pipeline: DecoderPipeline, lazy_data: bool = False,
+                  chunk_size: int = _DEFAULT_CHUNK_SIZE, rate: Optional[float] = None,
+                  measure_memory: bool = True) -> BenchmarkResult:
+    """Прогоняет поток через декодер и собирает метрики.
+
+    Args:
+        stream:         Поток от generate_stream.
+        profile:        Профиль, по которому сгенерирован поток (для отчёта).
+        engine:         Движок разбора.
+        pipeline:       Схема прохождения данных.
+        lazy_data:      Выдавать пакеты как TelegaDataView.
+        chunk_size:     Размер порции, подаваемой в NEW_BYTES.
+        rate:           Темп подачи, байт/с. None — максимально быстро.
+        measure_memory: Выполнить дополнительный прогон под tracemalloc.
+    """
+    decoder, sink, emit_ns, wall_time, cpu_time = asyncio.run(
+        _run_decoder(stream, engine, pipeline, lazy_data, chunk_size, rate)
+    )
+
+    peak_memory = None
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            asyncio.run(_run_decoder(stream, engine, pipeline, lazy_data, chunk_size, rate))
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    frames_decoded = len(sink.package_nums)
+    return BenchmarkResult(
+        profile=profile.name,
+        engine=engine.name,
+        pipeline=pipeline.name,
+        lazy_data=lazy_data,
+        stream_bytes=len(stream.data),
+        frames_expected=len(stream.frame_ends),
+        frames_decoded=frames_decoded,
+        frames_wrong_crc=decoder.num_wrong_packages,
+        frames_recovered=decoder.num_recovered_packages,
+        wall_time_s=wall_time,
+        cpu_time_s=cpu_time,
+        bytes_per_s=len(stream.data) / wall_time,
+        frames_per_s=frames_decoded / wall_time,
+        latency_us=_latency_us(stream, sink, emit_ns, chunk_size),
+        peak_memory_bytes=peak_memory,
+    )
+
+# =============================================================
+# ================= Сохранение и сравнение ====================
+# =============================================================
+
+def _git_revision() -> Optional[str]:
+    """Текущий коммит репозитория, если он доступен."""
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+                                   capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def save_results(results: list[BenchmarkResult], path: Path, settings: dict) -> None:
+    """Сохраняет результаты и условия запуска в JSON."""
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_revision': _git_revision(),
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            **settings,
+        },
+        'results': [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def compare_results(results: list[BenchmarkResult], baseline_path: Path) -> str:
+    """Сравнивает посылки/с с результатами предыдущего запуска."""
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    previous = {
+        (item['profile'], item['engine'], item['pipeline'], item['lazy_data']): item
+        for item in baseline['results']
+    }
+
+    lines = [f'🔍 Сравнение с {baseline_path} ({baseline["meta"].get("git_revision")}):']
+    for result in results:
+        item = previous.get(result.key)
+        if item is None or not item['frames_per_s']:
+            continue
+        change = (result.frames_per_s / item['frames_per_s'] - 1) * 100
+        lines.append(f'| {result.label:<40} '
+                     f'{item["frames_per_s"]:>10.0f} → {result.frames_per_s:>10.0f} посылок/с ({change:+.1f}%)')
+    lines.append('| -----------------------------------------------')
+    return '\n'.join(lines) + '\n'
+
+# =============================================================
+# ======================= CLI =================================
+# =============================================================
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Бенчмарк пропускной способности декодера потока Telega на синтетических данных.'
+    )
+    parser.add_argument('-n', '--frames', type=int, default=_DEFAULT_FRAMES,
+                        help=f'Количество посылок данных в потоке. По умолчанию {_DEFAULT_FRAMES}')
+    parser.add_argument('-p', '--profiles', nargs='+', choices=list(PROFILES), default=list(PROFILES),
+                        help='Профили помех. По умолчанию все')
+    parser.add_argument('-e', '--engines', nargs='+', choices=[e.name for e in DecoderEngine],
+                        default=[e.name for e in DecoderEngine],
+                        help='Движки разбора. По умолчанию все')
+    parser.add_argument('--pipelines', nargs='+', choices=[p.name for p in DecoderPipeline],
+                        default=[p.name for p in DecoderPipeline],
+                        help='Схемы прохождения данных. По умолчанию все')
+    parser.add_argument('--lazy', action='store_true',
+                        help='Выдавать пакеты как TelegaDataView')
+    parser.add_argument('--chunk-size', type=int, default=_DEFAULT_CHUNK_SIZE,
+                        help=f'Размер порции байтов. По умолчанию {_DEFAULT_CHUNK_SIZE}')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='Темп подачи, байт/с. По умолчанию максимально быстро')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Зерно генератора потока. По умолчанию 0')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Не измерять пиковую память (без дополнительного прогона)')
+    parser.add_argument('-o', '--output', type=Path, default=_DEFAULT_OUTPUT,
+                        help=f'JSON-файл результатов. По умолчанию {_DEFAULT_OUTPUT}')
+    parser.add_argument('--compare', type=Path, default=None,
+                        help='JSON-файл предыдущего запуска для сравнения')
+    args = parser.parse_args(argv)
+
+    if args.frames < 1:
+        parser.error('--frames должен быть не меньше 1')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size должен быть не меньше 1')
+    if args.rate is not None and args.rate <= 0:
+        parser.error('--rate должен быть положительным')
+    if args.compare is not None and not args.compare.is_file():
+        parser.error(f'Файл {args.compare} не найден')
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Запуск бенчмарка. Возвращает код завершения процесса."""
+    args = _parse_args(argv)
+
+    results = []
+    for profile_name in args.profiles:
+        profile = PROFILES[profile_name]
+        stream = generate_stream(args.frames, profile, args.seed)
+        for engine_name in args.engines:
+            for pipeline_name in args.pipelines:
+                result = run_benchmark(stream, profile, DecoderEngine[engine_name],
+                                       DecoderPipeline[pipeline_name], args.lazy,
+                                       args.chunk_size, args.rate, not args.no_memory)
+                print(result)
+                results.append(result)
+
+    settings = {
+        'frames': args.frames,
+        'chunk_size': args.chunk_size,
+        'rate': args.rate,
+        'seed': args.seed,
+        'profiles': {name: asdict(PROFILES[name]) for name in args.profiles},
+    }
+    save_results(results, args.output, settings)
+    print(f'📄 Результаты сохранены в {args.output}')
+
+    if args.compare is not None:
+        print(compare_results(results, args.compare))
+    return 0
+
+# =============================================================
+
+if __name__ == '__main__':
+    sys.exit(main())
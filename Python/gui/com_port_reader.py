@@ -6,6 +6,7 @@
 `Decoder` и передачи полученных пакетов в главный поток через сигналы.
 """
 # System imports
+import json
 import logging
 from queue import Empty
 from threading import Thread
@@ -21,7 +22,7 @@ from PyQt5.QtCore import QObject, pyqtSignal
 # User imports
 from async_mc_controller.config import LoggerConfig, ComPortConfig
 from telega_session import start_telega_session
-from telega_session import TelegaData as PackageType
+from telega_session import TelegaDataView as PackageType
 
 ##########################################################
 
@@ -58,6 +59,8 @@ class ComPortReader(QObject):
     Сигналы:
         data_received(PackageType): Испускается при получении нового пакета данных.
         connection_failed(str): Испускается при ошибке запуска сессии подключения.
+        bus_metrics_received(dict): Испускается с метриками сигнальной шины сессии
+            (BusMetrics.snapshot()), если они включены в configure().
         error_occurred(str): Испускается при возникновении ошибки чтения или декодирования.
         finished(): Испускается после полной остановки потока и очистки ресурсов.
     """
@@ -66,6 +69,7 @@ class ComPortReader(QObject):
     handshake_done = pyqtSignal()
     handshake_failed = pyqtSignal()
     connection_failed = pyqtSignal(str)
+    bus_metrics_received = pyqtSignal(dict)
     calibration_done = pyqtSignal()
     static_init_done = pyqtSignal()
     error_occurred = pyqtSignal(str)
@@ -167,13 +171,15 @@ class ComPortReader(QObject):
         def launch(self,
                    logger_config: LoggerConfig,
                    com_port_config: ComPortConfig,
-                   bin_file: Path) -> None:
+                   bin_file: Path,
+                   bus_metrics_period: Optional[float] = None) -> None:
             """Запускает процесс сессии МК и потоки чтения IPC-очередей.
 
             Args:
                 logger_config: Конфигурация логирования дочернего процесса.
                 com_port_config: Конфигурация COM-порта дочернего процесса.
                 bin_file: Файл для сохранения исходного байтового потока.
+                bus_metrics_period: Период отправки метрик шины сессии, сек. None — без метрик.
 
             Raises:
                 ComPortReaderException: Если сессия взаимодействия с МК уже запущена.
@@ -194,6 +200,7 @@ class ComPortReader(QObject):
                     self._command_queue,
                     self._response_queue,
                     self._data_queue,
+                    bus_metrics_period,
                 ),
                 daemon=True,
             )
@@ -454,6 +461,11 @@ class ComPortReader(QObject):
 
     def _message_handler(self, msg: str) -> None:
         """ Обработка полученного сообщения от контроллера """
+        if msg.startswith("BUS_METRICS"):
+            _, _, metrics_info = msg.partition(":")
+            self._bus_metrics_handler(metrics_info.strip())
+            return
+
         self._logger.debug(f'Получено сообщение: {msg}')
         if msg.startswith("CONNECTION_FAILED"):
             _, _, error_info = msg.partition(":")
@@ -481,6 +493,15 @@ class ComPortReader(QObject):
         message = error_info or 'Не удалось подключиться к COM-порту'
         self.connection_failed.emit(message)
 
+    def _bus_metrics_handler(self, metrics_info: str) -> None:
+        """ Обработчик периодических метрик сигнальной шины сессии """
+        try:
+            metrics = json.loads(metrics_info)
+        except json.JSONDecodeError as err:
+            self._logger.warning(f'Некорректные метрики шины от контроллера: {err}')
+            return
+        self.bus_metrics_received.emit(metrics)
+
     def _stop_calibration_handler(self) -> None:
         """ Обработчик завершения калибровки датчиков """
         self._calibration_running_flag = False
@@ -560,13 +581,16 @@ class ComPortReader(QObject):
         """Блокирующе закрывает ComPortReader."""
         self.shutdown()
 
-    def configure(self, logger_config: LoggerConfig, com_port_name: str, bin_file: Path) -> None:
+    def configure(self, logger_config: LoggerConfig, com_port_name: str, bin_file: Path,
+                  bus_metrics_period: Optional[float] = None) -> None:
         """Конфигурирует сессию взаимодействия с МК и запускает рукопожатие.
 
         Args:
             logger_config: Конфигурация используемого логгера.
             com_port_name: Имя COM-порта для подключения к МК.
             bin_file: Путь к бинарному файлу для будущего сохранения сырого потока.
+            bus_metrics_period: Период получения метрик шины сессии (bus_metrics_received), сек.
+                                None — метрики не собираются.
 
         Raises:
             ComPortReaderException: Если сессия уже запущена или имя COM-порта не задано.
@@ -586,7 +610,7 @@ class ComPortReader(QObject):
 
         self._logger.debug(f'Конфигурирование ComPortReader: port={com_port_name}, bin_file={bin_file}')
         try:
-            self._worker.launch(logger_config, com_port_config, bin_file)
+            self._worker.launch(logger_config, com_port_config, bin_file, bus_metrics_period)
             self._worker.send_command("HANDSHAKE_INIT")
             self._is_configured = True
         except Exception:
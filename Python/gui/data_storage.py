@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Optional, TextIO
 
 # User imports
-from telega_session import TelegaData
+from telega_session import TelegaData, TelegaDataView
 
 ##########################################################
 
@@ -67,7 +67,7 @@ class DataStorage:
         Raises:
             TypeError: Если package не является экземпляром TelegaData.
         """
-        if not isinstance(package, TelegaData):
+        if not isinstance(package, (TelegaData, TelegaDataView)):
             raise TypeError(f"Ожидается package: TelegaData, получен {type(package)}")
         file = self._file
         if file is None or file.closed:
@@ -5,7 +5,7 @@
 from PyQt5.QtWidgets import QLCDNumber
 
 # User imports
-from telega_session import TelegaData
+from telega_session import TelegaData, TelegaDataView
 
 ##########################################################
 
@@ -66,7 +66,7 @@ class DataVisualizer:
 
     def visualize_package(self, package: TelegaData) -> None:
         """Отображает полученный пакет данных."""
-        if not isinstance(package, TelegaData):
+        if not isinstance(package, (TelegaData, TelegaDataView)):
             raise TypeError(f"Ожидается package типа TelegaData, получен {type(package)}")
 
         self._value_acc_x.display(package.acc.x_coord)
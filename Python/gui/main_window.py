@@ -24,7 +24,7 @@ from gui.com_port_reader import ComPortReader, ComPortReaderException
 from gui.data_storage import DataStorage
 from gui.data_visualization import DataVisualizer
 from gui.indicator_blinker import IndicatorBlinker
-from telega_session import TelegaData
+from telega_session import TelegaDataView
 
 ##########################################################
 
@@ -712,7 +712,7 @@ class MainWindow(QMainWindow):
     # =============== Методы для обработки сигналов ===============
     # =============================================================
 
-    def _data_received(self, package: TelegaData) -> None:
+    def _data_received(self, package: TelegaDataView) -> None:
         """ Обработка полученного пакета данных от МК. """
         try:
             self._data_storage.add_package(package)
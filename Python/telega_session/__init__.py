@@ -11,20 +11,39 @@ __author__ = 'Roman Romanovskiy'
 
 # --------------------------------------------------------
 
+from .telega_protocol import TELEGA_DEVICE_SCHEMA, TELEGA_HOST_SCHEMA
 from .com_port_telega import ComPortTelega
 from .controller_telega import ControllerTelega
-from .decoder_telega import DecoderTelega, TelegaData
-from .start_telega_session import start_telega_session
+from .decoder_telega import DecoderTelega, TelegaData, TelegaDataView, TelegaPackage
+from .start_telega_session import start_telega_session, start_telega_replay
+from .bin_decoder import BinDecodeReport, BinDecodeResult, decode_bin_file
+from .bin_decoder import PackageGapStats, merge_results, count_package_gaps
+from .dataset_export import DATASET_DTYPE, DATASET_FORMATS, to_dataset, save_dataset
 
 
 # --------------------------------------------------------
 
 __all__ = [
+    'TELEGA_DEVICE_SCHEMA',
+    'TELEGA_HOST_SCHEMA',
     'ComPortTelega',
     'ControllerTelega',
     'DecoderTelega',
     'TelegaData',
-    'start_telega_session'
+    'TelegaDataView',
+    'TelegaPackage',
+    'start_telega_session',
+    'start_telega_replay',
+    'BinDecodeReport',
+    'BinDecodeResult',
+    'decode_bin_file',
+    'PackageGapStats',
+    'merge_results',
+    'count_package_gaps',
+    'DATASET_DTYPE',
+    'DATASET_FORMATS',
+    'to_dataset',
+    'save_dataset',
 ]
 
 # --------------------------------------------------------
\ No newline at end of file
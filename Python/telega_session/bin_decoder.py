@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+"""Пакетный (offline) декодер бинарных файлов потока Telega.
+
+Бинарный файл, который пишет DecoderTelega.setup_bin_file, содержит сырой
+поток байтов от МК. Модуль декодирует такой файл целиком без asyncio и без
+побайтового конечного автомата:
+    1. файл отображается в память (numpy.memmap);
+    2. начала посылок ищутся векторным сравнением с заголовком;
+    3. контрольная сумма (сумма байтов по модулю 256) проверяется
+       сразу для всех кандидатов одним вызовом verify_frames;
+    4. полезная нагрузка корректных посылок превращается в структурированный
+       массив NumPy одним view.
+
+Файл можно декодировать по частям: decode_bin_file(path, start, stop)
+возвращает только посылки, начинающиеся в [start, stop), но просматривает
+байты вокруг диапазона, чтобы синхронизироваться по заголовку на границах.
+Перед start контекст захватывает всю цепочку пересекающихся кандидатов
+посылок, поэтому объединение результатов соседних диапазонов совпадает
+с декодированием файла целиком.
+
+Функции:
+    decode_bin_file:     Декодирование бинарного файла (целиком или диапазона).
+    decode_bin_buffer:   Декодирование массива байтов, уже находящегося в памяти.
+    merge_results:       Объединение результатов последовательных диапазонов.
+    count_package_gaps:  Статистика пропусков номеров пакетов.
+"""
+
+# System imports
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+# External imports
+import numpy as np
+
+# User imports
+from async_mc_controller.decoding import ChecksumKind, SequenceStats, SequenceTracker, verify_frames
+from telega_session.decoder_telega import TELEGA_DATA_LAYOUT, TELEGA_DTYPE
+from telega_session.telega_protocol import TELEGA_DEVICE_SCHEMA
+
+#########################
+
+# Заголовок, форматы и размеры посылок потока МК → ПК
+_HEADER: bytes = TELEGA_DEVICE_SCHEMA.header
+_DATA_FORMAT: int = TELEGA_DEVICE_SCHEMA.packet('data').fmt
+_MESSAGE_FORMAT: int = TELEGA_DEVICE_SCHEMA.packet('message').fmt
+_CHECKSUM: ChecksumKind = TELEGA_DEVICE_SCHEMA.checksum
+
+_PREFIX_SIZE: int = TELEGA_DEVICE_SCHEMA.prefix_size             # Заголовок + формат + длина
+_DATA_SIZE: int = TELEGA_DEVICE_SCHEMA.body_size('data')         # Значение байта длины в посылке данных
+_FRAME_SIZE: int = TELEGA_DEVICE_SCHEMA.frame_size('data')       # Полный размер посылки данных (с CRC)
+_MAX_FRAME_SIZE: int = _PREFIX_SIZE + 255 + 1                    # Максимальный размер любой посылки
+
+# Количество кандидатов, обрабатываемых за один шаг (ограничивает пиковую память)
+_BLOCK_SIZE: int = 1 << 20
+
+# ------------------------------------------
+
+@dataclass
+class BinDecodeReport:
+    """Статистика декодирования бинарного файла.
+
+    Смещения отсчитываются от начала декодированного буфера и указывают
+    на первый байт заголовка отвергнутой посылки.
+    """
+
+    total_bytes: int = 0            # Размер декодированного буфера
+    num_frames: int = 0             # Принятые посылки данных
+    num_messages: int = 0           # Принятые текстовые сообщения
+    num_crc_errors: int = 0         # Посылки с неверной контрольной суммой
+    num_bad_length: int = 0         # Посылки данных с неверным байтом длины
+    num_unknown_format: int = 0     # Заголовки с неизвестным байтом формата
+    num_truncated: int = 0          # Посылки, обрезанные концом файла
+    crc_error_offsets: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    unknown_format_offsets: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+
+    @property
+    def num_rejected(self) -> int:
+        """Общее количество отвергнутых посылок."""
+        return self.num_crc_errors + self.num_bad_length + self.num_unknown_format + self.num_truncated
+
+    def __str__(self) -> str:
+        return (
+            f'🔍 Декодирование бинарного файла:\n'
+            f'| Размер файла, байт:                  {self.total_bytes}\n'
+            f'| Принято посылок данных:              {self.num_frames}\n'
+            f'| Принято текстовых сообщений:         {self.num_messages}\n'
+            f'| Ошибки контрольной суммы:            {self.num_crc_errors}\n'
+            f'| Неверный байт длины:                 {self.num_bad_length}\n'
+            f'| Неизвестный формат:                  {self.num_unknown_format}\n'
+            f'| Обрезанные концом файла:             {self.num_truncated}\n'
+            f'| -----------------------------------------------\n'
+        )
+
+
+@dataclass
+class BinDecodeResult:
+    """Результат декодирования: данные и отчёт об отвергнутых посылках."""
+
+    data: np.ndarray            # Структурированный массив с типом TELEGA_DTYPE
+    report: BinDecodeReport
+
+
+@dataclass
+class PackageGapStats(SequenceStats):
+    """Статистика непрерывности номеров пакетов (PackageNum) записи.
+
+    Дополняет SequenceStats количеством пакетов выставки (номер 0),
+    которые в анализ не входят.
+    """
+
+    num_static: int = 0
+
+    def __str__(self) -> str:
+        lines = super().__str__().splitlines(keepends=True)
+        lines.insert(2, f'| Пакетов выставки (номер 0):          {self.num_static}\n')
+        return ''.join(lines)
+
+# ------------------------------------------
+
+def decode_bin_file(path: Union[Path, str],
+                    start: int = 0,
+                    stop: Optional[int] = None) -> BinDecodeResult:
+    """Декодирует бинарный файл потока Telega или его диапазон.
+
+    Файл не читается в память целиком, а отображается через numpy.memmap.
+    Возвращаются только посылки, начинающиеся в [start, stop); для
+    синхронизации по заголовку на границах дополнительно просматриваются
+    байты перед start (см. _context_start) и после stop. Смещения в
+    отчёте — от начала файла.
+
+    Args:
+        path:  Путь к бинарному файлу, записанному DecoderTelega.setup_bin_file.
+        start: Смещение начала диапазона. По умолчанию начало файла.
+        stop:  Смещение конца диапазона. По умолчанию конец файла.
+
+    Returns:
+        BinDecodeResult: Принятые посылки данных и отчёт о декодировании.
+    """
+    path = Path(path)
+    file_size = path.stat().st_size
+    stop = file_size if stop is None else min(stop, file_size)
+    if file_size == 0 or start >= stop:
+        return decode_bin_buffer(np.zeros(0, dtype=np.uint8))
+
+    raw = np.memmap(path, dtype=np.uint8, mode='r')
+    context_start = _context_start(raw, start)
+    context_stop = min(file_size, stop + _MAX_FRAME_SIZE)
+
+    result = decode_bin_buffer(raw[context_start:context_stop],
+                               first=start - context_start,
+                               last=stop - context_start)
+    result.report.total_bytes = stop - start
+    result.report.crc_error_offsets += context_start
+    result.report.unknown_format_offsets += context_start
+    return result
+
+
+def decode_bin_buffer(raw: np.ndarray,
+                      first: int = 0,
+                      last: Optional[int] = None) -> BinDecodeResult:
+    """Декодирует одномерный массив байтов потока Telega.
+
+    Посылки принимаются жадно, как и в потоковом декодере: заголовки,
+    попавшие внутрь уже принятой посылки данных, считаются её полезной
+    нагрузкой и в отчёт не попадают.
+
+    Args:
+        raw (np.ndarray): Одномерный массив np.uint8.
+        first (int): В результат попадают посылки, начинающиеся не раньше first.
+        last (int | None): ...и раньше last. По умолчанию конец буфера.
+
+    Returns:
+        BinDecodeResult: Принятые посылки данных и отчёт о декодировании.
+    """
+    raw = np.asarray(raw, dtype=np.uint8)
+    last = raw.size if last is None else last
+    report = BinDecodeReport(total_bytes=last - first)
+
+    starts = _find_headers(raw)
+    # Кандидаты без байтов формата и длины обрезаны концом буфера
+    has_prefix = starts + _PREFIX_SIZE <= raw.size
+    report.num_truncated += int(np.count_nonzero(~has_prefix & (starts >= first) & (starts < last)))
+    starts = starts[has_prefix]
+
+    fmt = raw[starts + len(_HEADER)]
+    length = raw[starts + len(_HEADER) + 1]
+
+    # ----- Посылки данных -----
+    data_starts = starts[fmt == _DATA_FORMAT]
+    data_length = length[fmt == _DATA_FORMAT]
+    bad_length_starts = data_starts[data_length != _DATA_SIZE]
+    data_starts = data_starts[data_length == _DATA_SIZE]
+
+    is_full = data_starts + _FRAME_SIZE <= raw.size
+    truncated_starts = data_starts[~is_full]
+    data_starts = data_starts[is_full]
+
+    crc_ok = _check_crc(raw, data_starts)
+    good = _drop_overlapping(data_starts[crc_ok])
+    crc_error_starts = data_starts[~crc_ok]
+
+    # ----- Текстовые сообщения -----
+    message_starts = starts[fmt == _MESSAGE_FORMAT]
+    message_starts = message_starts[~_inside_frames(message_starts, good)]
+    message_starts = message_starts[(message_starts >= first) & (message_starts < last)]
+    message_ends = message_starts + _PREFIX_SIZE + raw[message_starts + len(_HEADER) + 1] + 1
+    is_full = message_ends <= raw.size
+    report.num_truncated += int(np.count_nonzero(~is_full))
+    message_starts = message_starts[is_full]
+    message_ok = verify_frames(raw, message_starts, message_ends[is_full], _CHECKSUM)
+    report.num_messages = int(np.count_nonzero(message_ok))
+    crc_error_starts = np.concatenate([crc_error_starts, message_starts[~message_ok]])
+
+    # ----- Неизвестные форматы -----
+    unknown_starts = starts[(fmt != _DATA_FORMAT) & (fmt != _MESSAGE_FORMAT)]
+
+    # Заголовки внутри принятых посылок — это полезная нагрузка, а не ошибки
+    crc_error_starts = np.sort(crc_error_starts[~_inside_frames(crc_error_starts, good)])
+    bad_length_starts = bad_length_starts[~_inside_frames(bad_length_starts, good)]
+    unknown_starts = unknown_starts[~_inside_frames(unknown_starts, good)]
+    truncated_starts = truncated_starts[~_inside_frames(truncated_starts, good)]
+
+    # Оставим только посылки, начинающиеся в [first, last)
+    good = _in_range(good, first, last)
+    crc_error_starts = _in_range(crc_error_starts, first, last)
+    bad_length_starts = _in_range(bad_length_starts, first, last)
+    unknown_starts = _in_range(unknown_starts, first, last)
+    truncated_starts = _in_range(truncated_starts, first, last)
+
+    report.num_frames = int(good.size)
+    report.num_crc_errors = int(crc_error_starts.size)
+    report.num_bad_length = int(bad_length_starts.size)
+    report.num_unknown_format = int(unknown_starts.size)
+    report.num_truncated += int(truncated_starts.size)
+    report.crc_error_offsets = crc_error_starts.astype(np.int64)
+    report.unknown_format_offsets = unknown_starts.astype(np.int64)
+
+    return BinDecodeResult(data=_gather_payload(raw, good), report=report)
+
+
+def merge_results(results: Iterable[BinDecodeResult]) -> BinDecodeResult:
+    """Объединяет результаты декодирования последовательных диапазонов одного файла.
+
+    Args:
+        results: Результаты в порядке следования диапазонов.
+
+    Returns:
+        BinDecodeResult: Общий результат.
+    """
+    results = list(results)
+    report = BinDecodeReport()
+    for result in results:
+        report.total_bytes += result.report.total_bytes
+        report.num_frames += result.report.num_frames
+        report.num_messages += result.report.num_messages
+        report.num_crc_errors += result.report.num_crc_errors
+        report.num_bad_length += result.report.num_bad_length
+        report.num_unknown_format += result.report.num_unknown_format
+        report.num_truncated += result.report.num_truncated
+
+    if results:
+        report.crc_error_offsets = np.concatenate([r.report.crc_error_offsets for r in results])
+        report.unknown_format_offsets = np.concatenate([r.report.unknown_format_offsets for r in results])
+        data = np.concatenate([r.data for r in results])
+    else:
+        data = np.zeros(0, dtype=TELEGA_DTYPE)
+
+    return BinDecodeResult(data=data, report=report)
+
+
+def count_package_gaps(package_nums: np.ndarray) -> PackageGapStats:
+    """Считает разрывы, повторы и нарушения порядка номеров пакетов.
+
+    Номера разбираются тем же SequenceTracker, что и при приёме
+    (DeviceDecoder), поэтому офлайн и живая статистика совпадают:
+    переполнение счётчика МК разрывом не считается, скачок номера
+    принимается только после подтверждения следующим номером.
+
+    МК нумерует пакеты счётчиком тиков таймера, который обнуляется при
+    входе в стадии выставки и измерения. Во время выставки таймер не
+    работает, и все её пакеты имеют номер 0 — они в анализ не входят
+    (num_static). Запись из нескольких стадий — несколько последовательностей,
+    переход между ними учитывается как перезапуск нумерации.
+
+    Args:
+        package_nums (np.ndarray): Номера пакетов в порядке приёма.
+
+    Returns:
+        PackageGapStats: Статистика непрерывности.
+    """
+    is_static = package_nums == 0
+    tracker = SequenceTracker()
+    tracker.update_many(package_nums[~is_static])
+    return PackageGapStats(**vars(tracker.stats), num_static=int(np.count_nonzero(is_static)))
+
+# =============================================================
+# ================= Внутренняя логика =========================
+# =============================================================
+
+def _find_headers(raw: np.ndarray) -> np.ndarray:
+    """Векторный поиск всех вхождений заголовка в буфере.
+
+    Returns:
+        np.ndarray: Отсортированные смещения начала заголовков (np.int64).
+    """
+    if raw.size < len(_HEADER):
+        return np.zeros(0, dtype=np.int64)
+
+    mask = raw[:raw.size - len(_HEADER) + 1] == _HEADER[0]
+    for i in range(1, len(_HEADER)):
+        mask &= raw[i:raw.size - len(_HEADER) + 1 + i] == _HEADER[i]
+    return np.flatnonzero(mask).astype(np.int64)
+
+
+def _check_crc(raw: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Проверяет контрольную сумму всех посылок данных блоками.
+
+    Returns:
+        np.ndarray: Булева маска корректных посылок.
+    """
+    crc_ok = np.zeros(starts.size, dtype=bool)
+    for block in range(0, starts.size, _BLOCK_SIZE):
+        block_starts = starts[block:block + _BLOCK_SIZE]
+        crc_ok[block:block + _BLOCK_SIZE] = verify_frames(raw, block_starts, block_starts + _FRAME_SIZE,
+                                                          _CHECKSUM)
+    return crc_ok
+
+
+def _context_start(raw: np.ndarray, start: int) -> int:
+    """Начало контекста, с которого разбор диапазона [start, ...) совпадает с разбором файла целиком.
+
+    Посылки принимаются жадно, поэтому судьба посылки зависит от цепочки
+    пересекающихся с ней предыдущих кандидатов (например, ложный заголовок
+    внутри корректной посылки, который сам проходит проверку CRC и
+    накрывает следующую посылку). Цепочка может уходить за _FRAME_SIZE
+    байтов до start.
+
+    Контекст расширяется назад, пока перед ним не окажется промежуток
+    в _FRAME_SIZE - 1 байтов без корректных кандидатов посылок данных:
+    последняя принятая до такой точки посылка заканчивается раньше неё
+    и не влияет на разбор дальше. В чистом потоке хватает одного-двух шагов.
+
+    Args:
+        raw (np.ndarray): Весь файл (np.uint8).
+        start (int): Начало диапазона.
+
+    Returns:
+        int: Смещение начала контекста (не больше start - _FRAME_SIZE + 1).
+    """
+    context_start = max(0, start - (_FRAME_SIZE - 1))
+    while context_start > 0:
+        lo = max(0, context_start - (_FRAME_SIZE - 1))
+        candidates = _valid_data_starts(raw, lo, context_start)
+        if candidates.size == 0:
+            break
+        context_start = int(candidates[0])
+    return context_start
+
+
+def _valid_data_starts(raw: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    """Начала полных посылок данных с верной контрольной суммой в [lo, hi)."""
+    window = raw[lo:min(raw.size, hi + _FRAME_SIZE - 1)]
+    starts = _find_headers(window)
+    starts = starts[(starts < hi - lo) & (starts + _FRAME_SIZE <= window.size)]
+    starts = starts[(window[starts + len(_HEADER)] == _DATA_FORMAT) &
+                    (window[starts + len(_HEADER) + 1] == _DATA_SIZE)]
+    return starts[_check_crc(window, starts)] + lo
+
+
+def _in_range(positions: np.ndarray, first: int, last: int) -> np.ndarray:
+    """Оставляет позиции из полуинтервала [first, last)."""
+    return positions[(positions >= first) & (positions < last)]
+
+
+def _drop_overlapping(starts: np.ndarray) -> np.ndarray:
+    """Жадно отбрасывает посылки, начинающиеся внутри предыдущей принятой.
+
+    Обычно пересечений нет совсем, поэтому цикл выполняется один раз.
+    """
+    while True:
+        conflicts = np.flatnonzero(np.diff(starts) < _FRAME_SIZE)
+        if conflicts.size == 0:
+            return starts
+        # В каждой цепочке пересечений отбрасываем посылку, следующую за первой
+        first_in_chain = conflicts[np.r_[True, np.diff(conflicts) > 1]]
+        starts = np.delete(starts, first_in_chain + 1)
+
+
+def _inside_frames(positions: np.ndarray, frame_starts: np.ndarray) -> np.ndarray:
+    """Маска позиций, попадающих внутрь (но не в начало) принятых посылок данных."""
+    if positions.size == 0 or frame_starts.size == 0:
+        return np.zeros(positions.size, dtype=bool)
+    index = np.searchsorted(frame_starts, positions, side='right') - 1
+    previous = frame_starts[np.maximum(index, 0)]
+    return (index >= 0) & (positions != previous) & (positions - previous < _FRAME_SIZE)
+
+
+def _gather_payload(raw: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Собирает полезную нагрузку принятых посылок в структурированный массив.
+
+    Строки выбираются из скользящего окна по буферу (view без копирования),
+    поэтому индекс — одно смещение на посылку, а не матрица смещений всех
+    её байтов, и пиковая память не превышает размера результата.
+    """
+    result = np.empty(starts.size, dtype=TELEGA_DTYPE)
+    if starts.size == 0:
+        return result
+    payload = result.view(np.uint8).reshape(starts.size, TELEGA_DTYPE.itemsize)
+    windows = np.lib.stride_tricks.sliding_window_view(raw, TELEGA_DTYPE.itemsize)
+    offset = TELEGA_DATA_LAYOUT.offset
+    for block in range(0, starts.size, _BLOCK_SIZE):
+        payload[block:block + _BLOCK_SIZE] = windows[starts[block:block + _BLOCK_SIZE] + offset]
+    return result
@@ -6,26 +6,27 @@ import asyncio
 # User imports
 from async_mc_controller.signal_bus import McBus
 from async_mc_controller.logger import McLogger
-from async_mc_controller.byte_source.com_port import AsyncComPortDevice
-from .packet_builders import PacketBuilderTelegaText, PacketBuilderTelegaBytes
+from async_mc_controller.byte_source.com_port import AsyncComPortDevice, ComPortTransport
+from .telega_protocol import TELEGA_HOST_SCHEMA
 
 #########################
 
 class ComPortTelega(AsyncComPortDevice):
-    # Команды, отправляемые на МК
-    _handshake_req_command: bytes = PacketBuilderTelegaText.build_text_command('HANDSHAKE_ACK')
-    _heartbeat_req_command: bytes = PacketBuilderTelegaText.build_text_command('HEARTBEAT_ACK')
+    # Команды, отправляемые на МК (собраны схемой TELEGA_HOST_SCHEMA)
+    _handshake_req_command: bytes = TELEGA_HOST_SCHEMA.commands['handshake_req']
+    _heartbeat_req_command: bytes = TELEGA_HOST_SCHEMA.commands['heartbeat_req']
 
-    _restart_command: bytes = PacketBuilderTelegaBytes.build_byte_command(bytes([0xFF, 0xFF]))
+    _restart_command: bytes = TELEGA_HOST_SCHEMA.commands['restart']
 
-    _set_foo_stage_command:         bytes = PacketBuilderTelegaBytes.build_byte_command(bytes([0xAA, 0x00]))
-    _set_calibration_stage_command: bytes = PacketBuilderTelegaBytes.build_byte_command(bytes([0xAA, 0x01]))
-    _set_measure_stage_command:     bytes = PacketBuilderTelegaBytes.build_byte_command(bytes([0xAA, 0x02]))
-    _set_static_init_stage_command: bytes = PacketBuilderTelegaBytes.build_byte_command(bytes([0xAA, 0x03]))
+    _set_foo_stage_command:         bytes = TELEGA_HOST_SCHEMA.commands['set_foo_stage']
+    _set_calibration_stage_command: bytes = TELEGA_HOST_SCHEMA.commands['set_calibration_stage']
+    _set_measure_stage_command:     bytes = TELEGA_HOST_SCHEMA.commands['set_measure_stage']
+    _set_static_init_stage_command: bytes = TELEGA_HOST_SCHEMA.commands['set_static_init_stage']
 
     def __init__(self, port_name: str, baudrate: int,
-                 bus: McBus, mc_logger: McLogger):
-        super().__init__(port_name, baudrate, bus, mc_logger)
+                 bus: McBus, mc_logger: McLogger,
+                 transport: ComPortTransport = ComPortTransport.STREAM):
+        super().__init__(port_name, baudrate, bus, mc_logger, transport)
 
         self._telega_mc_logger = mc_logger.get_child_logger("ComPort.Device.Telega")
 
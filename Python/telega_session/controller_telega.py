@@ -1,5 +1,6 @@
 # System imports
 import asyncio
+import json
 import logging
 from enum import IntEnum
 from multiprocessing import Queue
@@ -12,7 +13,9 @@ from typing import Callable, Awaitable, Optional
 from async_mc_controller.signal_bus import McBus
 from async_mc_controller.logger import McLogger
 from async_mc_controller.byte_source.read_error import ReadError
+from async_mc_controller.byte_source.file import EndOfFileError
 from async_mc_controller.controller import Controller
+from async_mc_controller.decoding import SequenceStats
 from telega_session.decoder_telega import TelegaData
 
 #########################
@@ -74,13 +77,28 @@ class ControllerTelega(Controller):
     * STOP_CALIBRATION - получено сообщение от МК о завершении калибровки
     * STOP_STATIC_INIT - получено сообщение от МК о завершении набора статического буфера
     * UNKNOWN_ERROR - поймано непредвиденное исключение
-    * READ_ERROR - получено исключение ReadError от AsyncComPort
+    * READ_ERROR - получено исключение ReadError от источника байтов
+    * REPLAY_FINISHED - воспроизведение файла штатно дошло до конца (EndOfFileError),
+      сессия завершается с кодом SUCCESS
     * DEVICE_LOST - устройство не ответило на HEARTBEAT
     * COMMAND_ACK_TIMEOUT - таймаут подтверждения получения команды МК
     * COMMAND_REJECTED - МК получил неизвестную ему команду
+    * BUS_METRICS: <json> - периодический снимок метрик шины BusMetrics.snapshot()
+      за прошедший интервал (только при заданном bus_metrics_period)
     """
     def __init__(self, bus: McBus, mc_logger: McLogger,
-                 command_queue: Queue, response_queue: Queue, data_queue: Queue):
+                 command_queue: Queue, response_queue: Queue, data_queue: Queue,
+                 bus_metrics_period: Optional[float] = None):
+        """
+        Args:
+            bus_metrics_period: Период отправки метрик шины в response_queue, с.
+                                Если задан, контроллер включает сбор метрик шины.
+
+        Raises:
+            ValueError: Если bus_metrics_period не положителен.
+        """
+        if bus_metrics_period is not None and bus_metrics_period <= 0:
+            raise ValueError(f'Период отправки метрик шины должен быть положительным: {bus_metrics_period}')
 
         # Вызов родительского конструктора
         super().__init__(bus, mc_logger)
@@ -100,9 +118,16 @@ class ControllerTelega(Controller):
         self._response_queue = response_queue
         self._data_queue = data_queue
 
+        # Количество пропущенных номеров пакетов на момент последнего SEQUENCE_STATS
+        self._last_num_lost: int = 0
+
         # Таска по чтению очереди команд от родительского процесса
         self._reading_cmd_queue_task: Optional[asyncio.Task] = None
 
+        # Период и таска отправки метрик шины родительскому процессу
+        self._bus_metrics_period: Optional[float] = bus_metrics_period
+        self._sending_bus_metrics_task: Optional[asyncio.Task] = None
+
         # Словарь для соответствия полученного сообщения и метода отработки.
         self._command_to_handler: dict[str, Callable[[], Awaitable[None]]] = {
             "STOP_RUNNING": self._stop_running,
@@ -126,10 +151,16 @@ class ControllerTelega(Controller):
         self._bus.stop_calibration.subscribe(self)
         self._bus.stop_static_init.subscribe(self)
         self._bus.interrupt_measuring.subscribe(self)
+        self._bus.sequence_stats.subscribe(self)
 
         # Запустим задачу чтения входящих команд
         self._reading_cmd_queue_task = asyncio.create_task(self._reading_command_queue())
 
+        # Запустим периодическую отправку метрик шины
+        if self._bus_metrics_period is not None:
+            self._bus.enable_metrics()
+            self._sending_bus_metrics_task = asyncio.create_task(self._sending_bus_metrics())
+
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
@@ -139,11 +170,18 @@ class ControllerTelega(Controller):
         self._bus.stop_calibration.unsubscribe(self)
         self._bus.stop_static_init.unsubscribe(self)
         self._bus.interrupt_measuring.unsubscribe(self)
+        self._bus.sequence_stats.unsubscribe(self)
 
         # Отменим задачу чтения входящих команд
         await self._cancel_task(self._reading_cmd_queue_task)
         self._reading_cmd_queue_task = None
 
+        # Отменим отправку метрик шины и залогируем метрики последнего интервала
+        if self._sending_bus_metrics_task is not None:
+            await self._cancel_task(self._sending_bus_metrics_task)
+            self._sending_bus_metrics_task = None
+            self._telega_controller_logger.info(self._bus.metrics)
+
         if self._telega_status_code == TelegaStatusCode.SUCCESS:
             self._telega_controller_logger.info(
                 f'Код завершения работы с устройством: {self._telega_status_code} '
@@ -247,6 +285,20 @@ class ControllerTelega(Controller):
         except asyncio.CancelledError:
             self._telega_controller_logger.debug('Таска _reading_command_queue отменена')
 
+    async def _sending_bus_metrics(self) -> None:
+        """Периодическая отправка метрик шины за прошедший интервал в response_queue"""
+
+        self._telega_controller_logger.debug('Запуск _sending_bus_metrics')
+
+        try:
+            while True:
+                await asyncio.sleep(self._bus_metrics_period)
+                snapshot = self._bus.metrics.snapshot(reset=True)
+                await self._send_info_msg(f'BUS_METRICS: {json.dumps(snapshot)}')
+
+        except asyncio.CancelledError:
+            self._telega_controller_logger.debug('Таска _sending_bus_metrics отменена')
+
     async def _send_package(self, data_package: TelegaData) -> None:
         """ Оправка пакета data_package в data_queue """
         try:
@@ -254,6 +306,18 @@ class ControllerTelega(Controller):
         except Exception as e:
             self._telega_controller_logger.error(f"Не удалось отправить пакет в data_queue: {e}")
 
+    async def _send_packages(self, batch: list[TelegaData]) -> None:
+        """ Отправка пачки пакетов в data_queue одним переходом в поток """
+        try:
+            await asyncio.to_thread(self._put_packages, batch)
+        except Exception as e:
+            self._telega_controller_logger.error(f"Не удалось отправить пачку из {len(batch)} пакетов в data_queue: {e}")
+
+    def _put_packages(self, batch: list[TelegaData]) -> None:
+        """ Поочерёдная запись пакетов пачки в data_queue (выполняется в потоке) """
+        for data_package in batch:
+            self._data_queue.put(data_package)
+
     async def _send_info_msg(self, msg: str) -> None:
         """ Отправка информационных сообщений в response_queue """
         try:
@@ -275,6 +339,35 @@ class ControllerTelega(Controller):
         """
         await self._send_package(data_package)
 
+    async def on_packages_ready(self, batch: list[TelegaData]) -> None:
+        """Обработчик сигнала PACKAGES_READY.
+
+        Отправка всей пачки пакетов в очередь data_queue
+
+        Args:
+            batch: Декодированные пакеты данных одной порции байтов
+        """
+        await self._send_packages(batch)
+
+    async def on_sequence_stats(self, stats: SequenceStats) -> None:
+        """Обработчик сигнала SEQUENCE_STATS.
+
+        Логирует рост потерь пакетов с момента предыдущей статистики.
+
+        Args:
+            stats: Статистика непрерывности номеров пакетов
+        """
+        new_lost = stats.num_lost - self._last_num_lost
+        self._last_num_lost = stats.num_lost
+        if new_lost > 0:
+            self._telega_controller_logger.warning(
+                f'Потеряно {new_lost} пакетов с прошлой проверки: всего {stats.num_lost} '
+                f'из {stats.num_packages + stats.num_lost} ({stats.loss_rate:.3%}), '
+                f'длины разрывов: {stats.histogram_str()}'
+            )
+        else:
+            self._telega_controller_logger.debug(f'Пакетов без потерь: {stats.num_packages}')
+
     async def on_handshake_done(self) -> None:
         """Обработчик сигнала HANDSHAKE_DONE от декодера.
 
@@ -314,9 +407,19 @@ class ControllerTelega(Controller):
         Отменим self._measuring_pipeline_task, установим TelegaStatusCode.READ_ERROR
         и вызовем родительский обработчик сигнала.
 
+        EndOfFileError — штатный конец воспроизведения файла, а не ошибка:
+        код завершения остаётся SUCCESS, родителю отправляется REPLAY_FINISHED.
+
         Args:
             err (ReadError): Исключение, которое привело к остановке чтения.
         """
+        if isinstance(err, EndOfFileError):
+            # Сообщение отправляется до остановки сессии, иначе его отправка может быть отменена
+            self._telega_controller_logger.info(f'Воспроизведение завершено: {err}')
+            await self._send_info_msg("REPLAY_FINISHED")
+            self._stop_event.set()
+            return
+
         self._telega_controller_logger.error(f'Получено исключение: {err}')
         self._telega_status_code = TelegaStatusCode.READ_ERROR
         self._stop_event.set()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""Экспорт данных пакетов Telega в наборы данных CSV / NPY / NPZ.
+
+Общий формат выходных файлов для DecoderTelega.save_received_data и
+конвертера bin_to_dataset.py: плоские колонки DATASET_DTYPE. Колонки
+выводятся из типа пакета данных схемы TELEGA_DEVICE_SCHEMA: скалярное поле
+даёт одну колонку, поле-подмассив — по колонке на компоненту с суффиксом
+оси (Acc → AccX, AccY, AccZ). Поэтому новое поле схемы попадает во все
+форматы без правок модуля. Имена колонок совпадают с RAW_COLUMNS из
+data_analys.data_loader, который выбирает колонки по имени.
+
+CSV форматируется крупными блоками строк: блок переводится в список кортежей
+одним вызовом tolist(), а строки получаются одним шаблоном '%'. Это быстрее
+и f-строки на каждый пакет, и numpy.savetxt, который форматирует структурированный
+массив построчно через NumPy-скаляры. Для CSV можно передать последовательность
+блоков, тогда весь набор данных не собирается в памяти.
+
+Функции:
+    to_dataset:   Перевод массива TELEGA_DTYPE в колонки DATASET_DTYPE.
+    save_csv:     Запись набора данных (или последовательности блоков) в CSV.
+    save_array:   Запись набора данных в один файл выбранного формата.
+    save_dataset: Запись набора данных во всех запрошенных форматах.
+"""
+
+# System imports
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional, Union
+
+# External imports
+import numpy as np
+
+# User imports
+from .telega_protocol import TELEGA_DEVICE_SCHEMA
+
+#########################
+
+class _Column(NamedTuple):
+    """Колонка набора данных и её источник в строке пакета."""
+    name: str                   # Имя колонки
+    field: str                  # Поле TELEGA_DTYPE
+    index: Optional[int]        # Компонента поля-подмассива (None для скалярного поля)
+    dtype: np.dtype             # Тип значения
+
+
+_AXES: str = 'XYZ'      # Суффиксы компонент полей-подмассивов (сверх трёх — номера компонент)
+
+
+def _flat_columns(dtype: np.dtype) -> tuple[_Column, ...]:
+    """Разворачивает структурированный dtype в плоские колонки.
+
+    Raises:
+        ValueError: Если поле — многомерный подмассив.
+    """
+    columns = []
+    for name in dtype.names:
+        field_dtype = dtype.fields[name][0]
+        if not field_dtype.shape:
+            columns.append(_Column(name, name, None, field_dtype))
+            continue
+        if len(field_dtype.shape) != 1:
+            raise ValueError(f'Поле {name} с формой {field_dtype.shape} не разворачивается в колонки')
+        size = field_dtype.shape[0]
+        for index in range(size):
+            suffix = _AXES[index] if size <= len(_AXES) else str(index)
+            columns.append(_Column(f'{name}{suffix}', name, index, field_dtype.base))
+    return tuple(columns)
+
+
+def _csv_format(dtype: np.dtype) -> str:
+    """Формат записи значения в CSV, однозначно восстанавливающий число."""
+    if dtype.kind in 'biu':
+        return '%d'
+    return '%.9g' if dtype.itemsize <= 4 else '%.17g'
+
+# ------------------------------------------
+
+# Колонки выходного набора данных в порядке полей пакета данных схемы
+_COLUMNS: tuple[_Column, ...] = _flat_columns(TELEGA_DEVICE_SCHEMA.dtype('data'))
+
+DATASET_DTYPE: np.dtype = np.dtype([(column.name, column.dtype) for column in _COLUMNS])
+
+DATASET_FORMATS: tuple[str, ...] = ('csv', 'npy', 'npz')     # Поддерживаемые форматы файлов
+
+# Форматы записи значений в CSV
+_CSV_FORMATS: list[str] = [_csv_format(column.dtype) for column in _COLUMNS]
+
+_CSV_BLOCK_ROWS: int = 100_000      # Количество строк CSV, форматируемых за один шаг
+
+# ------------------------------------------
+
+def to_dataset(data: np.ndarray) -> np.ndarray:
+    """Переводит массив с типом TELEGA_DTYPE в плоский набор колонок DATASET_DTYPE."""
+    dataset = np.empty(data.size, dtype=DATASET_DTYPE)
+    for column in _COLUMNS:
+        values = data[column.field]
+        dataset[column.name] = values if column.index is None else values[:, column.index]
+    return dataset
+
+
+def save_csv(dataset: Union[np.ndarray, Iterable[np.ndarray]], path: Path, sep: str = ' ') -> None:
+    """Сохраняет набор данных в CSV-файл с заголовком из имён колонок.
+
+    Args:
+        dataset: Массив DATASET_DTYPE или последовательность таких массивов (блоков),
+                 которые записываются друг за другом.
+        path:    Путь к файлу.
+        sep:     Разделитель полей.
+    """
+    blocks = [dataset] if isinstance(dataset, np.ndarray) else dataset
+    line_format = sep.join(_CSV_FORMATS) + '\n'
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(sep.join(DATASET_DTYPE.names) + '\n')
+        for block in blocks:
+            for start in range(0, block.size, _CSV_BLOCK_ROWS):
+                rows = block[start:start + _CSV_BLOCK_ROWS].tolist()
+                file.write(''.join(map(line_format.__mod__, rows)))
+
+
+def save_array(dataset: np.ndarray, path: Path, file_format: str, sep: str = ' ') -> None:
+    """Сохраняет набор данных в один файл формата file_format.
+
+    Raises:
+        ValueError: Если формат не входит в DATASET_FORMATS.
+    """
+    if file_format == 'csv':
+        save_csv(dataset, path, sep)
+    elif file_format == 'npy':
+        np.save(path, dataset)
+    elif file_format == 'npz':
+        np.savez(path, **{name: dataset[name] for name in DATASET_DTYPE.names})
+    else:
+        raise ValueError(f'Неизвестный формат {file_format!r}. Допустимые: {", ".join(DATASET_FORMATS)}')
+
+
+def save_dataset(dataset: np.ndarray, output_stem: Path, formats: list[str], sep: str = ' ') -> list[Path]:
+    """Сохраняет набор данных во всех запрошенных форматах.
+
+    Returns:
+        list[Path]: Пути к созданным файлам.
+    """
+    output_stem.parent.mkdir(parents=True, exist_ok=True)
+    saved = []
+    for file_format in formats:
+        path = output_stem.with_suffix(f'.{file_format}')
+        save_array(dataset, path, file_format, sep)
+        saved.append(path)
+    return saved
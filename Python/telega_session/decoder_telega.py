@@ -1,16 +1,21 @@
 # System imports
 import asyncio
-from typing import NamedTuple, Optional, BinaryIO
+import struct
+from typing import NamedTuple, Optional, BinaryIO, Union
 import logging
 from pathlib import Path
 
 # External imports
+import numpy as np
 
 # User imports
 from async_mc_controller.signal_bus import McBus
 from async_mc_controller.logger import McLogger
-from async_mc_controller.decoding import DeviceDecoder, TriaxialData
-from async_mc_controller.decoding.utils import *
+from async_mc_controller.decoding import DeviceDecoder, DecoderEngine, DecoderPipeline, Frame, TriaxialData
+from async_mc_controller.decoding import QueueLimit, DEFAULT_BYTE_QUEUE_LIMIT, DEFAULT_PACKAGE_QUEUE_LIMIT
+from async_mc_controller.decoding import FrameLayout, DEFAULT_STORE_LIMIT, frame_to_bytes
+from .telega_protocol import TELEGA_DEVICE_SCHEMA
+from .dataset_export import DATASET_FORMATS, to_dataset, save_csv, save_array
 
 #########################
 
@@ -41,19 +46,156 @@ class TelegaData(NamedTuple):
 # Описание начала индексов данных внутри посылки
 class TelegaDataIndexes:
     """Смещения начала полей данных внутри бинарного пакета.
-    Индексы отсчитываются от начала всей посылки, включая заголовок.
+    Индексы отсчитываются от начала всей посылки, включая заголовок,
+    и вычисляются по схеме TELEGA_DEVICE_SCHEMA.
     """
-    package_num = 4
-    acc_index = 8
-    gyro_index = 20
-    temp_index = 32
-    dpp_code_index = 36
+    package_num = TELEGA_DEVICE_SCHEMA.field_offset('data', 'package_num')
+    acc_index = TELEGA_DEVICE_SCHEMA.field_offset('data', 'acc')
+    gyro_index = TELEGA_DEVICE_SCHEMA.field_offset('data', 'gyro')
+    temp_index = TELEGA_DEVICE_SCHEMA.field_offset('data', 'temp')
+    dpp_code_index = TELEGA_DEVICE_SCHEMA.field_offset('data', 'dpp_code')
 
 # ------------------------------------------
 
-class DecoderTelega(DeviceDecoder[TelegaData]):
-    # Зададим заголовок посылки
-    _header = [b'\x7e', b'\xe7']
+# Раскладка полей TelegaData внутри посылки, скомпилированная в struct.Struct('<I3f3ffi')
+TELEGA_DATA_LAYOUT: FrameLayout = TELEGA_DEVICE_SCHEMA.layout('data')
+
+# Полный размер посылки данных: заголовок, формат, длина, данные и контрольная сумма
+TELEGA_DATA_FRAME_SIZE: int = TELEGA_DEVICE_SCHEMA.frame_size('data')
+
+# Тип строки с данными одного пакета. Совпадает побайтно с полезной нагрузкой посылки.
+TELEGA_DTYPE: np.dtype = TELEGA_DEVICE_SCHEMA.dtype('data')
+
+# ------------------------------------------
+
+class TelegaDataView:
+    """Ленивое представление пакета данных поверх байтов посылки.
+
+    Хранит только memoryview проверенной посылки (заголовок, формат, длина,
+    данные, CRC) и распаковывает поле при обращении к нему, не создавая
+    TriaxialData и float для полей, которые потребителю не нужны.
+    Атрибуты совпадают с TelegaData, полный TelegaData возвращает to_data().
+
+    Представление сравнивается с TelegaData и с другими представлениями по
+    значениям полей, а при сериализации pickle передаёт только байты посылки.
+
+    Пример использования:
+        view = TelegaDataView(frame_bytes)
+        if view.dpp_code != 0:
+            bin_file.write(view.frame)
+    """
+
+    __slots__ = ('_frame',)
+
+    # Структуры и смещения отдельных полей по схеме TELEGA_DEVICE_SCHEMA
+    _fields: dict[str, tuple[struct.Struct, int]] = {
+        field.name: (struct.Struct(TELEGA_DEVICE_SCHEMA.byte_order + field.fmt), field.offset)
+        for field in TELEGA_DATA_LAYOUT.fields
+    }
+
+    def __init__(self, frame: Union[bytes, bytearray, memoryview]):
+        """
+        Args:
+            frame: Вся посылка данных размером TELEGA_DATA_FRAME_SIZE. Буфер не копируется,
+                   поэтому он не должен изменяться, пока представление используется.
+        """
+        self._frame: memoryview = memoryview(frame)
+
+    @classmethod
+    def from_frame(cls, frame: Frame) -> 'TelegaDataView':
+        """Создаёт представление над посылкой из буфера декодера.
+
+        Движок BUFFER передаёт memoryview неизменяемого снимка буфера —
+        он оборачивается без копирования. Список байтов автомата FSM
+        (и изменяемый буфер) копируется в один объект bytes.
+        """
+        if isinstance(frame, memoryview) and frame.readonly:
+            return cls(frame)
+        return cls(frame_to_bytes(frame))
+
+    @property
+    def frame(self) -> memoryview:
+        """Байты всей посылки (например, для записи в бинарный файл)."""
+        return self._frame
+
+    @property
+    def payload(self) -> memoryview:
+        """Байты полей пакета без заголовка и CRC — побайтно строка TELEGA_DTYPE."""
+        return self._frame[TELEGA_DATA_LAYOUT.offset:TELEGA_DATA_LAYOUT.end]
+
+    @property
+    def package_num(self) -> int:
+        return self._unpack_field('package_num')[0]
+
+    @property
+    def acc(self) -> TriaxialData:
+        return TriaxialData(*self._unpack_field('acc'))
+
+    @property
+    def gyro(self) -> TriaxialData:
+        return TriaxialData(*self._unpack_field('gyro'))
+
+    @property
+    def temp(self) -> float:
+        return self._unpack_field('temp')[0]
+
+    @property
+    def dpp_code(self) -> int:
+        return self._unpack_field('dpp_code')[0]
+
+    def values(self) -> tuple:
+        """Плоские значения всех полей в порядке TELEGA_DATA_LAYOUT одним вызовом unpack_from."""
+        return TELEGA_DATA_LAYOUT.unpack(self._frame)
+
+    def to_data(self) -> TelegaData:
+        """Распаковывает все поля в TelegaData."""
+        (package_num,
+         acc_x, acc_y, acc_z,
+         gyro_x, gyro_y, gyro_z,
+         temp, dpp_code) = self.values()
+
+        return TelegaData(
+            package_num=    package_num,
+            acc=            TriaxialData(acc_x, acc_y, acc_z),
+            gyro=           TriaxialData(gyro_x, gyro_y, gyro_z),
+            temp=           temp,
+            dpp_code=       dpp_code
+        )
+
+    def _unpack_field(self, name: str) -> tuple:
+        """Распаковывает одно поле посылки."""
+        field_struct, offset = self._fields[name]
+        return field_struct.unpack_from(self._frame, offset)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TelegaDataView):
+            return self.to_data() == other.to_data()
+        if isinstance(other, TelegaData):
+            return self.to_data() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.to_data())
+
+    def __reduce__(self) -> tuple:
+        # memoryview не сериализуется pickle — передаются байты посылки
+        return self.__class__, (bytes(self._frame),)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.to_data()!r})'
+
+    def __str__(self) -> str:
+        return str(self.to_data())
+
+# Пакет данных, который выдаёт DecoderTelega: распакованный или ленивый
+TelegaPackage = Union[TelegaData, TelegaDataView]
+
+# ------------------------------------------
+
+class DecoderTelega(DeviceDecoder[TelegaPackage]):
+    # Зададим заголовок посылки и вид контрольной суммы
+    _header = [bytes([bt]) for bt in TELEGA_DEVICE_SCHEMA.header]
+    _checksum_kind = TELEGA_DEVICE_SCHEMA.checksum
 
     # Получаемые текстовые сообщения от МК
     _handshake_ack: str = "TELEGA_STM32_ACK"            # Ожидаемое сообщение рукопожатия
@@ -65,13 +207,31 @@ class DecoderTelega(DeviceDecoder[TelegaData]):
     _end_of_static_init_msg: str = "END_OF_STATIC_INIT"     # Сообщение о завершение набора статического буфера
 
     # Константы форматов пакетов протокола
-    _DataFormatBt: bytes = b'\xC8'       # Пакет с данными
-    _MessageFormatBt: bytes = b'\xCD'    # Текстовое сообщение
-
-    def __init__(self, signal_bus: McBus, mc_logger: McLogger):
-        super().__init__(signal_bus, mc_logger)
+    _DataFormatBt: bytes = TELEGA_DEVICE_SCHEMA.format_byte('data')         # Пакет с данными
+    _MessageFormatBt: bytes = TELEGA_DEVICE_SCHEMA.format_byte('message')   # Текстовое сообщение
+
+    # Тип строки хранилища received_data
+    _store_dtype: np.dtype = TELEGA_DTYPE
+
+    def __init__(self, signal_bus: McBus, mc_logger: McLogger,
+                 engine: DecoderEngine = DecoderEngine.FSM,
+                 byte_queue_limit: QueueLimit = DEFAULT_BYTE_QUEUE_LIMIT,
+                 package_queue_limit: QueueLimit = DEFAULT_PACKAGE_QUEUE_LIMIT,
+                 pipeline: DecoderPipeline = DecoderPipeline.QUEUED,
+                 store_limit: QueueLimit = DEFAULT_STORE_LIMIT,
+                 lazy_data: bool = False):
+        """
+        Args:
+            lazy_data (bool): Выдавать пакеты как TelegaDataView (поля распаковываются
+                              при обращении) вместо TelegaData. По умолчанию False.
+        """
+        super().__init__(signal_bus, mc_logger, engine, byte_queue_limit, package_queue_limit,
+                         pipeline, store_limit)
         self._telega_decoder_logger: logging.Logger = mc_logger.get_child_logger("BaseDecoder.DeviceDecoder.TelegaDecoder")
 
+        # Ленивые представления пакетов вместо распакованных TelegaData
+        self._lazy_data: bool = lazy_data
+
         # Сохраним обработчики _end_of_calibration_msg и _end_of_static_init_msg
         self._msg_to_handler[self._end_of_calibration_msg] = self._end_of_calibration
         self._msg_to_handler[self._end_of_static_init_msg] = self._end_of_static_init
@@ -79,6 +239,9 @@ class DecoderTelega(DeviceDecoder[TelegaData]):
         # Сохраним переданный путь к бинарному файлу
         self._bin_file: Optional[BinaryIO] = None
 
+    def __str__(self) -> str:
+        return super().__str__() + str(self.sequence_stats)
+
     # =============================================================
     # ======= Методы для работы в контекстном менеджере ===========
     # =============================================================
@@ -98,43 +261,66 @@ class DecoderTelega(DeviceDecoder[TelegaData]):
             self._bin_file.write(bt)
         await super().on_byte_received(bt)
 
+    async def on_bytes_received(self, buf: memoryview) -> None:
+        """ При получении порции байтов сохраним её в self._bin_file одной записью """
+        if self._bin_file:
+            self._bin_file.write(buf)
+        await super().on_bytes_received(buf)
+
     # =============================================================
     # =================== Публичные методы ========================
     # =============================================================
 
-    def save_received_data(self, filepath: Path, sep: str = ' ') -> None:
-        """Сохраняет все накопленные данные декодера в CSV-файл.
+    def save_received_data(self, filepath: Path, sep: str = ' ',
+                           formats: Optional[list[str]] = None) -> list[Path]:
+        """Сохраняет все накопленные данные декодера в CSV, NPY и/или NPZ.
 
-        Формат: PackageNum, AccX, AccY, AccZ, GyroX, GyroY, GyroZ.
-        Числа с плавающей точкой записываются с точкой как десятичным
-        разделителем — поэтому разделитель полей по умолчанию пробел.
+        Колонки выводятся из полей пакета данных схемы (см. dataset_export.DATASET_DTYPE):
+        PackageNum, AccX, AccY, AccZ, GyroX, GyroY, GyroZ, Temp, DppCode. CSV пишется
+        блоками хранилища received_data, не собирая таблицу целиком; числа
+        с плавающей точкой записываются с точкой как десятичным разделителем —
+        поэтому разделитель полей по умолчанию пробел.
 
         Args:
-            filepath (Path): Путь к файлу сохранения.
-            sep (str):       Разделитель полей. По умолчанию пробел.
+            filepath (Path):   Путь к файлу сохранения.
+            sep (str):         Разделитель полей CSV. По умолчанию пробел.
+            formats (list):    Форматы из DATASET_FORMATS. Каждый файл получает
+                               расширение формата. По умолчанию формат
+                               определяется по расширению filepath
+                               (.npy, .npz, иначе CSV) и файл пишется как есть.
+
+        Returns:
+            list[Path]: Пути к созданным файлам.
 
         Raises:
-            ValueError: Если нет данных для сохранения.
+            ValueError: Если нет данных для сохранения или формат неизвестен.
         """
         if not self.received_data:
-            raise ValueError('Нет данных для сохранения. Список received_data пуст.')
+            raise ValueError('Нет данных для сохранения. Хранилище received_data пусто.')
 
         file_path = Path(filepath)
+        if formats is None:
+            suffix = file_path.suffix.lstrip('.')
+            targets = [(file_path, suffix if suffix in DATASET_FORMATS else 'csv')]
+        else:
+            targets = [(file_path.with_suffix(f'.{file_format}'), file_format) for file_format in formats]
+
+        unknown = [file_format for _, file_format in targets if file_format not in DATASET_FORMATS]
+        if unknown:
+            raise ValueError(f'Неизвестные форматы: {", ".join(unknown)}. '
+                             f'Допустимые: {", ".join(DATASET_FORMATS)}')
+
         file_path.parent.mkdir(parents=True, exist_ok=True)
+        dataset: Optional[np.ndarray] = None
+        for path, file_format in targets:
+            if file_format == 'csv':
+                save_csv((to_dataset(block) for block in self.received_data.chunks()), path, sep)
+                continue
+            if dataset is None:
+                dataset = to_dataset(self.received_data.to_array())
+            save_array(dataset, path, file_format, sep)
 
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(
-                f'PackageNum{sep}DppCode{sep}'
-                f'AccX{sep}AccY{sep}AccZ{sep}'
-                f'GyroX{sep}GyroY{sep}GyroZ\n'
-            )
-            for data in self.received_data:
-                file.write(
-                    f'{data.package_num}{sep}'
-                    f'{data.dpp_code}{sep}'
-                    f'{data.acc.x_coord}{sep}{data.acc.y_coord}{sep}{data.acc.z_coord}{sep}'
-                    f'{data.gyro.x_coord}{sep}{data.gyro.y_coord}{sep}{data.gyro.z_coord}\n'
-                )
+        return [path for path, _ in targets]
 
     # =============================================================
     # ================= Внутренняя логика =========================
@@ -157,16 +343,43 @@ class DecoderTelega(DeviceDecoder[TelegaData]):
             self._telega_decoder_logger.debug(f"Закрытие файла {self._bin_file.name}")
             self._bin_file.close()
 
-    def _bytes_to_protocol_data(self, byte_list: list[bytes]) -> TelegaData:
-        """ Декодирование байтов в пакет данных TelegaData """
+    def _bytes_to_protocol_data(self, byte_list: Frame) -> TelegaPackage:
+        """ Декодирование байтов в пакет данных TelegaData
+        одним вызовом unpack_from по раскладке TELEGA_DATA_LAYOUT
+        (или в TelegaDataView над байтами посылки при lazy_data) """
+        if self._lazy_data:
+            return TelegaDataView.from_frame(byte_list)
+
+        (package_num,
+         acc_x, acc_y, acc_z,
+         gyro_x, gyro_y, gyro_z,
+         temp, dpp_code) = TELEGA_DATA_LAYOUT.unpack(byte_list)
+
         return TelegaData(
-            package_num=    bytes_to_uint32(byte_list[TelegaDataIndexes.package_num: TelegaDataIndexes.package_num + 4]),
-            acc=            bytes_to_triaxial(byte_list[TelegaDataIndexes.acc_index: TelegaDataIndexes.acc_index + 12]),
-            gyro=           bytes_to_triaxial(byte_list[TelegaDataIndexes.gyro_index: TelegaDataIndexes.gyro_index + 12]),
-            temp=           bytes_to_float(byte_list[TelegaDataIndexes.temp_index: TelegaDataIndexes.temp_index + 4]),
-            dpp_code=       bytes_to_int32(byte_list[TelegaDataIndexes.dpp_code_index: TelegaDataIndexes.dpp_code_index + 4])
+            package_num=    package_num,
+            acc=            TriaxialData(acc_x, acc_y, acc_z),
+            gyro=           TriaxialData(gyro_x, gyro_y, gyro_z),
+            temp=           temp,
+            dpp_code=       dpp_code
         )
 
+    def _store_row(self, data: TelegaPackage) -> Union[tuple, memoryview]:
+        """ Плоская строка хранилища с типом TELEGA_DTYPE из пакета TelegaData
+        (для TelegaDataView — байты полезной нагрузки, совпадающие со строкой) """
+        if isinstance(data, TelegaDataView):
+            return data.payload
+        return (data.package_num, *data.acc, *data.gyro, data.temp, data.dpp_code)
+
+    def _package_number(self, data: TelegaPackage) -> Optional[int]:
+        """ Номер пакета TelegaData, присвоенный МК.
+
+        Номер — счётчик тиков таймера МК, обнуляемый при входе в выставку
+        и в измерение. При выставке таймер не запущен, и все её пакеты
+        имеют номер 0 — они не отслеживаются (None). Измерение начинается
+        с номера 1.
+        """
+        return data.package_num or None
+
     async def _end_of_calibration(self) -> None:
         """ Процедура завершения калибровки """
         await self._bus.stop_calibration.emit()
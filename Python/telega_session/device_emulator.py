@@ -0,0 +1,521 @@
+# -*- coding: utf-8 -*-
+"""Эмулятор МК путеизмерительной тележки на псевдотерминале (Linux).
+
+Открывает пару pty и говорит с подключённой к подчинённой стороне
+программой по протоколу Telega так же, как прошивка STM32:
+    * HANDSHAKE_ACK / HEARTBEAT_ACK → TELEGA_STM32_ACK / TELEGA_STM32_ALIVE;
+    * команды смены стадии (0xAA 0x00..0x03) и перезапуска (0xFF 0xFF)
+      подтверждаются CONFIRM_RECEIVED_COMMAND;
+    * калибровка завершается END_OF_CALIBRATION, набор статического
+      буфера — отправкой static_init_frames пакетов и END_OF_STATIC_INIT;
+    * в стадии измерений пакеты данных 0xC8 идут с частотой rate;
+    * номер пакета — счётчик тиков таймера, как tick_counter прошивки:
+      обнуляется при входе в выставку и в измерение, во время выставки
+      не меняется (все её пакеты имеют номер 0), в измерении увеличивается
+      перед отправкой (первый пакет — номер 1);
+    * неизвестные команды получают ответ UNKNOWN_COMMAND.
+
+Путь подчинённой стороны (например, /dev/pts/5) передаётся в ComPortTelega
+вместо имени COM-порта — так AsyncComPortDevice работает через настоящий
+serial_asyncio. Частоту rate можно поднимать в 10–100 раз выше реальной
+(10 Гц), чтобы найти точку насыщения цепочки порт → декодер → контроллер.
+
+В пакеты данных можно вносить искажения (FaultInjection): мусор между
+пакетами, инверсию битов и потерю байтов. Служебные сообщения не искажаются.
+
+Запуск:
+    python -m telega_session.device_emulator --rate 1000 --bit-errors 1e-5
+"""
+
+# System imports
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+# External imports
+
+# User imports
+from async_mc_controller.logger import LoggerProtocol, FooLogger
+from async_mc_controller.decoding import compute_checksum
+from telega_session.decoder_telega import DecoderTelega, TELEGA_DATA_LAYOUT
+from telega_session.telega_protocol import TELEGA_HOST_SCHEMA
+from telega_session.packet_builders import PacketBuilderTelegaText
+from telega_session.packet_builders import PacketBuilderTelegaMessage, PacketBuilderTelegaData
+
+#########################
+
+_SENSOR_RATE: float = 10.0          # Частота выдачи данных прошивкой в стадии измерений (Гц)
+_STATIC_INIT_FRAMES: int = 256      # Количество пакетов выставки (InitFrameNum в прошивке)
+_STAGE_DELAY: float = 2.0           # Пауза в начале калибровки и выставки (сек)
+_END_MESSAGE_DELAY: float = 0.5     # Пауза перед END_OF_* (сек)
+_MAX_BATCH: int = 256               # Максимум пакетов данных за одну запись в pty
+
+_COMMAND_HEADER: bytes = TELEGA_HOST_SCHEMA.header
+_COMMAND_PREFIX_SIZE: int = TELEGA_HOST_SCHEMA.prefix_size    # Заголовок + формат + длина
+
+# ------------------------------------------
+
+class EmulatorStage(Enum):
+    """Стадии прошивки МК."""
+    FOO = 0             # Ожидание
+    CALIBRATION = 1     # Калибровка
+    MEASURING = 2       # Измерения
+    STATIC_INIT = 3     # Набор статического буфера
+
+# ------------------------------------------
+
+@dataclass
+class FaultInjection:
+    """Параметры искажения потока пакетов данных.
+
+    Attributes:
+        noise_rate:      Вероятность вставки случайных байтов перед пакетом.
+        max_noise_len:   Максимальная длина вставляемого мусора.
+        bit_error_rate:  Вероятность инверсии одного бита в каждом байте.
+        drop_rate:       Вероятность потери каждого байта.
+        seed:            Зерно генератора случайных чисел (None — случайное).
+    """
+    noise_rate: float = 0.0
+    max_noise_len: int = 8
+    bit_error_rate: float = 0.0
+    drop_rate: float = 0.0
+    seed: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.noise_rate > 0 or self.bit_error_rate > 0 or self.drop_rate > 0
+
+# ------------------------------------------
+
+@dataclass
+class EmulatorStats:
+    """Статистика работы эмулятора."""
+    frames_sent: int = 0            # Отправлено пакетов данных
+    messages_sent: int = 0          # Отправлено текстовых сообщений
+    bytes_sent: int = 0             # Всего записано байтов
+    commands_received: int = 0      # Принято команд
+    unknown_commands: int = 0       # Команды, получившие UNKNOWN_COMMAND
+    wrong_commands: int = 0         # Команды с неверной контрольной суммой
+    noise_bytes: int = 0            # Вставлено байтов мусора
+    flipped_bits: int = 0           # Инвертировано битов
+    dropped_bytes: int = 0          # Потеряно байтов
+
+    def __str__(self) -> str:
+        return (
+            f'🔍 Статистика эмулятора МК:\n'
+            f'| Отправлено пакетов данных:           {self.frames_sent}\n'
+            f'| Отправлено сообщений:                {self.messages_sent}\n'
+            f'| Записано байтов:                     {self.bytes_sent}\n'
+            f'| Принято команд:                      {self.commands_received}\n'
+            f'| Неизвестных команд:                  {self.unknown_commands}\n'
+            f'| Команд с ошибкой CRC:                {self.wrong_commands}\n'
+            f'| Вставлено байтов мусора:             {self.noise_bytes}\n'
+            f'| Инвертировано битов:                 {self.flipped_bits}\n'
+            f'| Потеряно байтов:                     {self.dropped_bytes}\n'
+            f'| -----------------------------------------------\n'
+        )
+
+# ------------------------------------------
+
+class TelegaDeviceEmulator:
+    """Эмулятор прошивки МК на псевдотерминале.
+
+    Псевдотерминал открывается в __aenter__, путь подчинённой стороны
+    доступен через port_name. Команды ПК читаются из ведущей стороны
+    в _command_loop, стадии прошивки выполняются отдельной задачей,
+    которая отменяется при смене стадии.
+
+    Запись идёт через asyncio write pipe: если программа на другой стороне
+    не успевает читать, drain() приостанавливает выдачу, а отставание от
+    заданной частоты выдаётся пачками до _MAX_BATCH пакетов.
+
+    Пример использования:
+        async with TelegaDeviceEmulator(rate=1000) as emulator:
+            com_port = ComPortTelega(emulator.port_name, 921600, bus, mc_logger)
+            ...
+    """
+
+    # Ответы на текстовые команды
+    _text_replies: dict[bytes, str] = {
+        TELEGA_HOST_SCHEMA.commands['handshake_req']:                DecoderTelega._handshake_ack,
+        TELEGA_HOST_SCHEMA.commands['heartbeat_req']:                DecoderTelega._heartbeat_ack,
+        PacketBuilderTelegaText.build_text_command('CONFIRM'):       DecoderTelega._command_ack,
+    }
+
+    # Команды смены стадии
+    _stage_commands: dict[bytes, EmulatorStage] = {
+        TELEGA_HOST_SCHEMA.commands['set_foo_stage']:           EmulatorStage.FOO,
+        TELEGA_HOST_SCHEMA.commands['set_calibration_stage']:   EmulatorStage.CALIBRATION,
+        TELEGA_HOST_SCHEMA.commands['set_measure_stage']:       EmulatorStage.MEASURING,
+        TELEGA_HOST_SCHEMA.commands['set_static_init_stage']:   EmulatorStage.STATIC_INIT,
+    }
+
+    _restart_command: bytes = TELEGA_HOST_SCHEMA.commands['restart']
+
+    def __init__(self,
+                 rate: float = _SENSOR_RATE,
+                 static_init_frames: int = _STATIC_INIT_FRAMES,
+                 stage_delay: float = _STAGE_DELAY,
+                 end_message_delay: float = _END_MESSAGE_DELAY,
+                 faults: FaultInjection = FaultInjection(),
+                 logger: LoggerProtocol = FooLogger()):
+        """
+        Args:
+            rate:               Частота выдачи пакетов данных (Гц).
+            static_init_frames: Количество пакетов в стадии набора статического буфера.
+            stage_delay:        Пауза в начале калибровки и выставки (сек).
+            end_message_delay:  Пауза перед END_OF_CALIBRATION / END_OF_STATIC_INIT (сек).
+            faults:             Параметры искажения пакетов данных.
+            logger:             Логгер.
+
+        Raises:
+            ValueError: Если rate неположительная.
+        """
+        if rate <= 0:
+            raise ValueError(f'rate должна быть положительной, получено {rate}')
+
+        self._rate: float = rate
+        self._static_init_frames: int = static_init_frames
+        self._stage_delay: float = stage_delay
+        self._end_message_delay: float = end_message_delay
+        self._faults: FaultInjection = faults
+        self._random: random.Random = random.Random(faults.seed)
+        self._logger: LoggerProtocol = logger
+
+        self._master_fd: Optional[int] = None
+        self._slave_fd: Optional[int] = None
+        self._port_name: Optional[str] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+        self._input_buffer: bytearray = bytearray()
+        self._command_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._command_task: Optional[asyncio.Task] = None
+        self._stage_task: Optional[asyncio.Task] = None
+        self._stage: EmulatorStage = EmulatorStage.FOO
+
+        self._package_num: int = 0
+        self.stats: EmulatorStats = EmulatorStats()
+
+    @property
+    def port_name(self) -> str:
+        """Путь подчинённой стороны псевдотерминала."""
+        if self._port_name is None:
+            raise RuntimeError('Псевдотерминал ещё не открыт')
+        return self._port_name
+
+    @property
+    def stage(self) -> EmulatorStage:
+        """Текущая стадия прошивки."""
+        return self._stage
+
+    # =============================================================
+    # ======= Методы для работы в контекстном менеджере ===========
+    # =============================================================
+
+    async def __aenter__(self) -> 'TelegaDeviceEmulator':
+        """Открытие псевдотерминала и запуск обработки команд.
+
+        Raises:
+            RuntimeError: Если платформа не поддерживает псевдотерминалы.
+        """
+        if not hasattr(os, 'openpty'):
+            raise RuntimeError('Эмулятор МК требует поддержки псевдотерминалов (Linux)')
+        import tty
+
+        self._master_fd, self._slave_fd = os.openpty()
+        tty.setraw(self._slave_fd)      # Без эха и преобразования символов
+        os.set_blocking(self._master_fd, False)
+        self._port_name = os.ttyname(self._slave_fd)
+
+        loop = asyncio.get_running_loop()
+        write_pipe = os.fdopen(os.dup(self._master_fd), 'wb', buffering=0)
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.streams.FlowControlMixin(loop=loop), write_pipe
+        )
+        self._writer = asyncio.StreamWriter(transport, protocol, None, loop)
+        loop.add_reader(self._master_fd, self._on_readable)
+
+        self._command_task = asyncio.create_task(self._command_loop())
+        self._logger.info(f'Эмулятор МК слушает {self._port_name} (частота данных {self._rate} Гц)')
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Остановка задач и закрытие псевдотерминала."""
+        await self._cancel_task(self._stage_task)
+        await self._cancel_task(self._command_task)
+        self._stage_task = None
+        self._command_task = None
+
+        if self._master_fd is not None:
+            asyncio.get_running_loop().remove_reader(self._master_fd)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for fd in (self._master_fd, self._slave_fd):
+            if fd is not None:
+                os.close(fd)
+        self._master_fd = self._slave_fd = None
+
+        self._logger.info(f'Эмулятор МК остановлен\n{self.stats}')
+        return False
+
+    # =============================================================
+    # ================= Приём и обработка команд ==================
+    # =============================================================
+
+    def _on_readable(self) -> None:
+        """Чтение байтов от ПК и выделение из них пакетов команд."""
+        try:
+            data = os.read(self._master_fd, 4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            # Подчинённая сторона закрыта — ждём нового подключения
+            return
+
+        self._input_buffer += data
+        buffer = self._input_buffer
+        while True:
+            start = buffer.find(_COMMAND_HEADER)
+            if start < 0:
+                del buffer[:max(0, len(buffer) - len(_COMMAND_HEADER) + 1)]
+                return
+            if len(buffer) - start < _COMMAND_PREFIX_SIZE:
+                del buffer[:start]
+                return
+            end = start + _COMMAND_PREFIX_SIZE + buffer[start + _COMMAND_PREFIX_SIZE - 1] + 1
+            if end > len(buffer):
+                del buffer[:start]
+                return
+
+            packet = bytes(buffer[start:end])
+            del buffer[:end]
+            if compute_checksum(packet[:-1], TELEGA_HOST_SCHEMA.checksum) == packet[-1]:
+                self._command_queue.put_nowait(packet)
+            else:
+                self.stats.wrong_commands += 1
+                self._logger.warning(f'Ошибка контрольной суммы команды: {packet.hex(" ")}')
+
+    async def _command_loop(self) -> None:
+        """Последовательная обработка принятых команд."""
+        try:
+            while True:
+                packet = await self._command_queue.get()
+                await self._handle_command(packet)
+        except asyncio.CancelledError:
+            self._logger.debug('Цикл обработки команд эмулятора остановлен')
+
+    async def _handle_command(self, packet: bytes) -> None:
+        """Ответ на команду ПК, при необходимости со сменой стадии."""
+        self.stats.commands_received += 1
+
+        if packet in self._text_replies:
+            await self._send_message(self._text_replies[packet])
+
+        elif packet in self._stage_commands:
+            await self._send_message(DecoderTelega._command_ack)
+            await self._set_stage(self._stage_commands[packet])
+
+        elif packet == self._restart_command:
+            await self._send_message(DecoderTelega._command_ack)
+            await self._set_stage(EmulatorStage.FOO)
+            self._package_num = 0
+            self._logger.info('Эмулятор МК перезапущен')
+
+        else:
+            self.stats.unknown_commands += 1
+            self._logger.warning(f'Неизвестная команда: {packet.hex(" ")}')
+            await self._send_message(DecoderTelega._command_rejected_msg)
+
+    async def _set_stage(self, stage: EmulatorStage) -> None:
+        """Смена стадии прошивки: отмена текущей и запуск новой."""
+        await self._cancel_task(self._stage_task)
+        self._stage_task = None
+        self._stage = stage
+        self._logger.debug(f'Стадия эмулятора: {stage.name}')
+
+        # StaticStage_init и MeasuringStage_init прошивки обнуляют tick_counter
+        if stage in (EmulatorStage.STATIC_INIT, EmulatorStage.MEASURING):
+            self._package_num = 0
+
+        match stage:
+            case EmulatorStage.CALIBRATION:
+                self._stage_task = asyncio.create_task(self._calibration_stage())
+            case EmulatorStage.STATIC_INIT:
+                self._stage_task = asyncio.create_task(self._static_init_stage())
+            case EmulatorStage.MEASURING:
+                self._stage_task = asyncio.create_task(self._stream_frames())
+
+    # =============================================================
+    # ===================== Стадии прошивки =======================
+    # =============================================================
+
+    async def _calibration_stage(self) -> None:
+        """Калибровка: пауза и сообщение END_OF_CALIBRATION."""
+        await asyncio.sleep(self._stage_delay + self._end_message_delay)
+        await self._send_message(DecoderTelega._end_of_calibration_msg)
+        self._stage = EmulatorStage.FOO
+
+    async def _static_init_stage(self) -> None:
+        """Набор статического буфера: пакеты данных и END_OF_STATIC_INIT."""
+        await asyncio.sleep(self._stage_delay)
+        await self._stream_frames(self._static_init_frames)
+        await asyncio.sleep(self._end_message_delay)
+        await self._send_message(DecoderTelega._end_of_static_init_msg)
+        self._stage = EmulatorStage.FOO
+
+    async def _stream_frames(self, count: Optional[int] = None) -> None:
+        """Выдача пакетов данных с частотой self._rate.
+
+        Время отсчитывается от начала выдачи по time.monotonic(): если запись
+        отстала (drain ждал читателя), накопившиеся пакеты уходят пачкой.
+
+        Args:
+            count: Количество пакетов. None — бесконечно (до смены стадии).
+        """
+        started = time.monotonic()
+        sent = 0
+        while count is None or sent < count:
+            due = int((time.monotonic() - started) * self._rate) + 1 - sent
+            if due <= 0:
+                await asyncio.sleep(started + sent / self._rate - time.monotonic())
+                continue
+
+            batch = min(due, _MAX_BATCH) if count is None else min(due, _MAX_BATCH, count - sent)
+            await self._write(b''.join(self._corrupt(self._next_frame()) for _ in range(batch)))
+            self.stats.frames_sent += batch
+            sent += batch
+
+    # =============================================================
+    # =================== Формирование потока =====================
+    # =============================================================
+
+    def _next_frame(self) -> bytes:
+        """Очередной пакет данных с правдоподобными показаниями датчиков.
+
+        В измерении номер увеличивается до отправки (тик таймера предшествует
+        выдаче пакета), при выставке таймер не запущен и номер не меняется.
+        """
+        if self._stage is EmulatorStage.MEASURING:
+            self._package_num = (self._package_num + 1) & 0xFFFFFFFF
+        num = self._package_num
+
+        phase = num / self._rate
+        body = TELEGA_DATA_LAYOUT.pack(
+            num,
+            0.05 * math.sin(phase), 0.05 * math.cos(phase), 9.81,
+            0.01 * math.sin(2 * phase), 0.01 * math.cos(2 * phase), 0.0,
+            25.0 + 0.1 * math.sin(0.01 * phase),
+            num // 4,
+        )
+        return PacketBuilderTelegaData.build_data_packet(body)
+
+    def _corrupt(self, packet: bytes) -> bytes:
+        """Искажение пакета данных согласно self._faults."""
+        faults = self._faults
+        if not faults.enabled:
+            return packet
+
+        rnd = self._random
+        result = bytearray()
+        if faults.noise_rate > 0 and rnd.random() < faults.noise_rate:
+            noise_len = rnd.randint(1, max(1, faults.max_noise_len))
+            result += rnd.randbytes(noise_len)
+            self.stats.noise_bytes += noise_len
+
+        for value in packet:
+            if faults.drop_rate > 0 and rnd.random() < faults.drop_rate:
+                self.stats.dropped_bytes += 1
+                continue
+            if faults.bit_error_rate > 0 and rnd.random() < faults.bit_error_rate:
+                value ^= 1 << rnd.randrange(8)
+                self.stats.flipped_bits += 1
+            result.append(value)
+        return bytes(result)
+
+    async def _send_message(self, text: str) -> None:
+        """Отправка текстового сообщения МК (без искажений)."""
+        await self._write(PacketBuilderTelegaMessage.build_message(text))
+        self.stats.messages_sent += 1
+        self._logger.debug(f'Эмулятор МК отправил {text}')
+
+    async def _write(self, data: bytes) -> None:
+        """Запись в pty с ожиданием освобождения буфера."""
+        self._writer.write(data)
+        self.stats.bytes_sent += len(data)
+        await self._writer.drain()
+
+    @staticmethod
+    async def _cancel_task(task: Optional[asyncio.Task]) -> None:
+        """Отмена задачи и ожидание её завершения."""
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+# =============================================================
+# ======================= CLI =================================
+# =============================================================
+
+async def _run(args: argparse.Namespace) -> None:
+    faults = FaultInjection(noise_rate=args.noise, max_noise_len=args.noise_len,
+                            bit_error_rate=args.bit_errors, drop_rate=args.drop, seed=args.seed)
+    emulator = TelegaDeviceEmulator(rate=args.rate,
+                                    static_init_frames=args.static_init_frames,
+                                    stage_delay=args.stage_delay,
+                                    faults=faults)
+    async with emulator:
+        print(f'Эмулятор МК: {emulator.port_name} ({args.rate} Гц). Ctrl+C для остановки.', flush=True)
+        previous_frames, previous_time = 0, time.monotonic()
+        while True:
+            await asyncio.sleep(args.stats_period)
+            now = time.monotonic()
+            frames = emulator.stats.frames_sent
+            print(f'[{emulator.stage.name}] пакетов: {frames} '
+                  f'({(frames - previous_frames) / (now - previous_time):.0f} Гц), '
+                  f'байтов: {emulator.stats.bytes_sent}, команд: {emulator.stats.commands_received}',
+                  flush=True)
+            previous_frames, previous_time = frames, now
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Эмулятор МК путеизмерительной тележки на pty.')
+    parser.add_argument('--rate', type=float, default=_SENSOR_RATE,
+                        help=f'Частота пакетов данных, Гц. По умолчанию {_SENSOR_RATE}')
+    parser.add_argument('--static-init-frames', type=int, default=_STATIC_INIT_FRAMES,
+                        help=f'Пакетов в наборе статического буфера. По умолчанию {_STATIC_INIT_FRAMES}')
+    parser.add_argument('--stage-delay', type=float, default=_STAGE_DELAY,
+                        help=f'Пауза в начале калибровки и выставки, с. По умолчанию {_STAGE_DELAY}')
+    parser.add_argument('--noise', type=float, default=0.0,
+                        help='Вероятность вставки мусора перед пакетом данных')
+    parser.add_argument('--noise-len', type=int, default=8,
+                        help='Максимальная длина вставляемого мусора')
+    parser.add_argument('--bit-errors', type=float, default=0.0,
+                        help='Вероятность инверсии бита в байте пакета данных')
+    parser.add_argument('--drop', type=float, default=0.0,
+                        help='Вероятность потери байта пакета данных')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Зерно генератора искажений')
+    parser.add_argument('--stats-period', type=float, default=1.0,
+                        help='Период вывода статистики, с')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+# =============================================================
+
+if __name__ == '__main__':
+    sys.exit(main())
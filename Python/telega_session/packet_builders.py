@@ -7,6 +7,16 @@
                                методом _packet_format().
     PacketBuilderImuText     — построитель пакетов с текстовой командой (формат 0xAB).
     PacketBuilderImuBytes    — построитель пакетов с байтовой командой (формат 0xAB).
+    PacketBuilderTelegaDevice  — абстрактный построитель пакетов в обратном
+                                 направлении (МК → ПК, заголовок 0x7E 0xE7).
+    PacketBuilderTelegaMessage — текстовое сообщение от МК (формат 0xCD).
+    PacketBuilderTelegaData    — пакет с данными от МК (формат 0xC8).
+
+Пакеты МК → ПК нужны эмулятору устройства и тестовым генераторам потока.
+
+Заголовки, байты форматов и вид контрольной суммы берутся из схем
+протокола telega_protocol: TELEGA_HOST_SCHEMA (ПК → МК) и
+TELEGA_DEVICE_SCHEMA (МК → ПК).
 
 Контрольная сумма во всех пакетах — сумма всех байтов посылки
 (включая заголовок, формат, длину и тело) по модулю 256.
@@ -18,6 +28,8 @@ from abc import ABC, abstractmethod
 # External imports
 
 # User imports
+from async_mc_controller.decoding import ChecksumKind, compute_checksum
+from .telega_protocol import TELEGA_DEVICE_SCHEMA, TELEGA_HOST_SCHEMA
 
 #########################
 
@@ -44,6 +56,7 @@ class BasePacketBuilder(ABC):
     """
 
     _HEADER: bytes   # Заголовок пакета — определяется в наследнике
+    _CHECKSUM: ChecksumKind = ChecksumKind.SUM8     # Вид контрольной суммы
 
     @classmethod
     def _build(cls, fmt: bytes, body: bytes) -> bytes:
@@ -69,11 +82,12 @@ class BasePacketBuilder(ABC):
         crc = cls._compute_crc(packet_without_crc)
         return packet_without_crc + crc
 
-    @staticmethod
-    def _compute_crc(data: bytes) -> bytes:
+    @classmethod
+    def _compute_crc(cls, data: bytes) -> bytes:
         """Вычисляет контрольную сумму пакета.
 
-        Контрольная сумма — сумма всех байтов посылки по модулю 256.
+        Вид контрольной суммы задаётся _CHECKSUM (по умолчанию сумма всех
+        байтов посылки по модулю 256).
 
         Args:
             data (bytes): Байты посылки без контрольной суммы.
@@ -81,7 +95,7 @@ class BasePacketBuilder(ABC):
         Returns:
             bytes: Один байт контрольной суммы.
         """
-        return bytes([sum(data) & 0xFF])
+        return bytes([compute_checksum(data, cls._CHECKSUM)])
 
 
 # ------------------------------------------
@@ -109,7 +123,8 @@ class PacketBuilderTelega(BasePacketBuilder):
     """
 
     # Заголовок протокола (общий для всех наследников)
-    _HEADER: bytes = bytes([0xE7, 0x7E])
+    _HEADER: bytes = TELEGA_HOST_SCHEMA.header
+    _CHECKSUM: ChecksumKind = TELEGA_HOST_SCHEMA.checksum
 
     @classmethod
     @abstractmethod
@@ -144,7 +159,7 @@ class PacketBuilderTelegaText(PacketBuilderTelega):
     @classmethod
     def _packet_format(cls) -> bytes:
         """Возвращает байт формата текстовой команды (CommandFormat = 0xAB)."""
-        return bytes([0xAB])
+        return TELEGA_HOST_SCHEMA.format_byte('command')
 
     @classmethod
     def build_text_command(cls, text: str, encoding: str = 'ascii') -> bytes:
@@ -185,7 +200,7 @@ class PacketBuilderTelegaBytes(PacketBuilderTelega):
     @classmethod
     def _packet_format(cls) -> bytes:
         """Возвращает байт формата байтовой команды (CommandFormat = 0xAB)."""
-        return bytes([0xAB])
+        return TELEGA_HOST_SCHEMA.format_byte('command')
 
     @classmethod
     def build_byte_command(cls, body: bytes) -> bytes:
@@ -201,3 +216,84 @@ class PacketBuilderTelegaBytes(PacketBuilderTelega):
             ValueError: Если длина тела превышает 255 байт.
         """
         return cls._build(cls._packet_format(), body)
+
+
+# ------------------------------------------
+
+
+class PacketBuilderTelegaDevice(BasePacketBuilder):
+    """Абстрактный построитель пакетов, которые МК отправляет на ПК.
+
+    Заголовок обратного направления — байты заголовка ПК → МК в обратном
+    порядке. Используется эмулятором МК (telega_session.device_emulator).
+    """
+
+    # Заголовок посылок МК → ПК (совпадает с DecoderTelega._header)
+    _HEADER: bytes = TELEGA_DEVICE_SCHEMA.header
+    _CHECKSUM: ChecksumKind = TELEGA_DEVICE_SCHEMA.checksum
+
+    @classmethod
+    @abstractmethod
+    def _packet_format(cls) -> bytes:
+        """Возвращает байт формата пакета."""
+        ...
+
+
+# ------------------------------------------
+
+
+class PacketBuilderTelegaMessage(PacketBuilderTelegaDevice):
+    """Создатель текстовых сообщений МК (MessageFormat = 0xCD).
+
+    Пример использования:
+        packet = PacketBuilderTelegaMessage.build_message('TELEGA_STM32_ACK')
+    """
+
+    @classmethod
+    def _packet_format(cls) -> bytes:
+        """Возвращает байт формата текстового сообщения (0xCD)."""
+        return TELEGA_DEVICE_SCHEMA.format_byte('message')
+
+    @classmethod
+    def build_message(cls, text: str, encoding: str = 'ascii') -> bytes:
+        """Формирует пакет с текстовым сообщением МК.
+
+        Args:
+            text (str):      Текст сообщения.
+            encoding (str):  Кодировка текста. По умолчанию 'ascii'.
+
+        Returns:
+            bytes: Готовый пакет в бинарном формате протокола.
+        """
+        return cls._build(cls._packet_format(), text.encode(encoding))
+
+
+# ------------------------------------------
+
+
+class PacketBuilderTelegaData(PacketBuilderTelegaDevice):
+    """Создатель пакетов с данными МК (DataFormat = 0xC8).
+
+    Тело — уже упакованные поля TelegaData (см. TELEGA_DATA_LAYOUT.pack).
+
+    Пример использования:
+        body = TELEGA_DATA_LAYOUT.pack(num, ax, ay, az, gx, gy, gz, temp, dpp)
+        packet = PacketBuilderTelegaData.build_data_packet(body)
+    """
+
+    @classmethod
+    def _packet_format(cls) -> bytes:
+        """Возвращает байт формата пакета с данными (0xC8)."""
+        return TELEGA_DEVICE_SCHEMA.format_byte('data')
+
+    @classmethod
+    def build_data_packet(cls, body: bytes) -> bytes:
+        """Формирует пакет с данными.
+
+        Args:
+            body (bytes): Упакованные поля пакета данных.
+
+        Returns:
+            bytes: Готовый пакет в бинарном формате протокола.
+        """
+        return cls._build(cls._packet_format(), body)
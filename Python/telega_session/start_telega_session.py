@@ -9,6 +9,7 @@ import asyncio
 import logging
 from multiprocessing import Queue
 from pathlib import Path
+from typing import Coroutine, Optional
 
 # External imports
 
@@ -17,10 +18,20 @@ from async_mc_controller.config import McConfig, ComPortConfig, LoggerConfig
 from async_mc_controller.logger import McLogger
 from async_mc_controller.signal_bus import McBus
 from async_mc_controller.async_mc_session import McSession
+from async_mc_controller.byte_source import AsyncBytesSource
+from async_mc_controller.byte_source.com_port import ComPortTransport
+from async_mc_controller.decoding import DecoderEngine, DecoderPipeline, OverflowPolicy, QueueLimit, DEFAULT_PACKAGE_QUEUE_LIMIT
+from async_mc_controller.byte_source.file import AsyncFileBytesSourceSetting, ReplayMode
 from telega_session import ComPortTelega, DecoderTelega, ControllerTelega
+from telega_session.decoder_telega import TELEGA_DATA_FRAME_SIZE
 
 #########################
 
+# Последние пакеты, хранимые декодером живой сессии (~80 МБ при 40 байтах на пакет)
+_LIVE_STORE_LIMIT: QueueLimit = QueueLimit(1 << 21, OverflowPolicy.DROP_OLDEST)
+
+# -------------------------------------------------------------
+
 async def _send_response_msg(response_queue: Queue, msg: str) -> None:
     """Отправляет сообщение родительскому процессу через response_queue."""
     try:
@@ -30,12 +41,54 @@ async def _send_response_msg(response_queue: Queue, msg: str) -> None:
 
 # -------------------------------------------------------------
 
+def _make_mc_config(logger_config: LoggerConfig,
+                    com_port_config: Optional[ComPortConfig] = None) -> McConfig:
+    """Конфигурация пакета для сессии в отдельном процессе."""
+    mc_config = McConfig()
+    mc_config.logger_config = logger_config
+    if com_port_config is not None:
+        mc_config.com_port = com_port_config
+    mc_config.logger_config.log_level = logging.DEBUG
+    mc_config.logger_config.log_filename = 'telega_mc_logger.log'
+    mc_config.logger_config.use_console = False
+    return mc_config
+
+
+async def _run_session(mc_logger: McLogger,
+                       decoder: DecoderTelega,
+                       byte_source: AsyncBytesSource,
+                       controller: ControllerTelega,
+                       response_queue: Queue) -> None:
+    """Работа McSession до остановки контроллера."""
+
+    # ------------------------------------------
+    # Запуск сессии.
+    # Порядок вызова __aenter__ и __aexit__ важен,
+    # поэтому стоит использовать McSession!
+    # ------------------------------------------
+    try:
+        async with McSession(decoder, byte_source, controller):
+            await controller.running()
+
+    except Exception as err:
+        mc_logger.error(f"Получено следующее исключение вне контекстного менеджера: {err}")
+        await _send_response_msg(response_queue, f"CONNECTION_FAILED: {err}")
+
+    finally:
+        mc_logger.debug(str(decoder))
+
+    # Задержка для завершения всех фоновых операций
+    await asyncio.sleep(1)
+
+# -------------------------------------------------------------
+
 async def _run_telega_session(logger_config: LoggerConfig,
                               com_port_config: ComPortConfig,
                               bin_file: Path,
                               command_queue: Queue,
                               response_queue: Queue,
-                              data_queue: Queue) -> None:
+                              data_queue: Queue,
+                              bus_metrics_period: Optional[float] = None) -> None:
 
     """Запуск асинхронной сессии управления путеизмерительной тележкой.
 
@@ -44,65 +97,112 @@ async def _run_telega_session(logger_config: LoggerConfig,
        com_port_config: Конфигурация COM-порта (имя, скорость).
        command_queue:   Очередь для получения команд от родителя.
        response_queue:  Очередь для отправки ответов (HANDSHAKE_DONE, STOP_CALIBRATION...).
-       data_queue:      Очередь для отправки пакетов TelegaData.
+       data_queue:      Очередь для отправки пакетов TelegaDataView.
+       bus_metrics_period: Период отправки метрик шины (BUS_METRICS) в response_queue, сек.
+                           None — метрики не собираются.
     """
 
     # Настроим конфигурацию
-    mc_config = McConfig()
-    mc_config.logger_config = logger_config
-    mc_config.com_port = com_port_config
-    mc_config.logger_config.log_level = logging.DEBUG
-    mc_config.logger_config.log_filename = 'telega_mc_logger.log'
-    mc_config.logger_config.use_console = False
+    mc_config = _make_mc_config(logger_config, com_port_config)
 
     # Создадим необходимые экземпляры
     mc_logger: McLogger = McLogger(mc_config)
     bus = McBus(mc_logger)
 
     com_port: ComPortTelega = ComPortTelega(mc_config.com_port.name, mc_config.com_port.baudrate,
-                                            bus, mc_logger)
-
-    decoder: DecoderTelega = DecoderTelega(bus, mc_logger)
+                                            bus, mc_logger, transport=ComPortTransport.PROTOCOL)
+
+    # Сырой поток целиком пишется в bin_file, поэтому декодер держит в памяти только последние пакеты
+    decoder: DecoderTelega = DecoderTelega(
+        bus, mc_logger,
+        # ACK распознаётся по заголовку и формату в любой момент потока,
+        # поэтому heartbeat и команды не прерывают разбор пакетов данных
+        engine=DecoderEngine.BUFFER,
+        # Если получатель не успевает, старые пакеты выбрасываются с учётом в статистике декодера
+        package_queue_limit=QueueLimit(DEFAULT_PACKAGE_QUEUE_LIMIT.maxsize, OverflowPolicy.DROP_OLDEST),
+        # Кольцевой буфер последних пакетов вместо накопления всего сеанса
+        store_limit=_LIVE_STORE_LIMIT,
+        # TelegaDataView над снимком буфера: поля распаковываются только у получателя
+        lazy_data=True
+    )
     decoder.setup_bin_file(bin_file)
 
     controller: ControllerTelega = ControllerTelega(bus, mc_logger, command_queue,
-                                                    response_queue, data_queue)
+                                                    response_queue, data_queue,
+                                                    bus_metrics_period=bus_metrics_period)
 
-    # ------------------------------------------
-    # Запуск сессии.
-    # Порядок вызова __aenter__ и __aexit__ важен,
-    # поэтому стоит использовать McSession!
-    # ------------------------------------------
-    try:
-        async with McSession(decoder, com_port, controller):
-            await controller.running()
+    await _run_session(mc_logger, decoder, com_port, controller, response_queue)
 
-    except Exception as err:
-        mc_logger.error(f"Получено следующее исключение вне контекстного менеджера: {err}")
+
+async def _run_telega_replay(logger_config: LoggerConfig,
+                             replay_file: Path,
+                             command_queue: Queue,
+                             response_queue: Queue,
+                             data_queue: Queue,
+                             mode: ReplayMode,
+                             speed: float,
+                             sample_period: Optional[float],
+                             bus_metrics_period: Optional[float] = None) -> None:
+    """Воспроизведение записанного бинарного файла через ту же McSession.
+
+    Вместо ComPortTelega источником служит AsyncFileBytesSource, команды
+    контроллера на МК никуда не отправляются. По концу файла, когда
+    декодер отправил все пакеты, источник эмиттит READ_ERROR с
+    EndOfFileError: контроллер отправляет REPLAY_FINISHED и завершает
+    сессию с кодом SUCCESS.
+
+    Args:
+       logger_config:   Конфигурация логирования.
+       replay_file:     Бинарный файл, записанный DecoderTelega.setup_bin_file.
+       command_queue:   Очередь для получения команд от родителя.
+       response_queue:  Очередь для отправки ответов.
+       data_queue:      Очередь для отправки пакетов TelegaDataView.
+       mode:            Режим воспроизведения.
+       speed:           Множитель скорости для ReplayMode.SCALED.
+       sample_period:   Период следования пакетов данных (сек) для REALTIME и SCALED.
+       bus_metrics_period: Период отправки метрик шины (BUS_METRICS) в response_queue, сек.
+                           None — метрики не собираются.
+    """
+    mc_config = _make_mc_config(logger_config)
+
+    mc_logger: McLogger = McLogger(mc_config)
+    bus = McBus(mc_logger)
+
+    # Файл читается быстрее реального потока, поэтому порции разбираются сразу
+    # в обработчике NEW_BYTES, а пакеты уходят в data_queue пачками
+    decoder: DecoderTelega = DecoderTelega(bus, mc_logger, engine=DecoderEngine.BUFFER,
+                                           pipeline=DecoderPipeline.DIRECT, lazy_data=True)
+
+    # Конец файла сообщается только после того, как декодер отправит все пакеты
+    source_setting = AsyncFileBytesSourceSetting(replay_file, bus, mc_logger,
+                                                 mode=mode,
+                                                 speed=speed,
+                                                 sample_period=sample_period,
+                                                 sample_size=TELEGA_DATA_FRAME_SIZE,
+                                                 drain_callback=decoder.wait_idle,
+                                                 logger=mc_logger)
+    try:
+        file_source = source_setting.get_bytes_source()
+    except (FileNotFoundError, ValueError) as err:
+        mc_logger.error(f"Не удалось настроить воспроизведение файла: {err}")
         await _send_response_msg(response_queue, f"CONNECTION_FAILED: {err}")
+        return
 
-    finally:
-        mc_logger.debug(str(decoder))
+    controller: ControllerTelega = ControllerTelega(bus, mc_logger, command_queue,
+                                                    response_queue, data_queue,
+                                                    bus_metrics_period=bus_metrics_period)
 
-    # Задержка для завершения всех фоновых операций
-    await asyncio.sleep(1)
+    await _run_session(mc_logger, decoder, file_source, controller, response_queue)
+    mc_logger.debug(str(file_source))
 
 # =============================================================
 
-def start_telega_session(logger_config: LoggerConfig,
-                         com_port_config: ComPortConfig,
-                         bin_file: Path,
-                         command_queue: Queue,
-                         response_queue: Queue,
-                         data_queue: Queue):
-    """Функция, запускаемая в отдельном процессе
-    (точка входа для мультипроцессорной реализации)."""
-
+def _run_in_new_loop(coro: Coroutine) -> None:
+    """Выполнение сессии в новом event loop с отменой незавершённых задач."""
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     try:
-        loop.run_until_complete(_run_telega_session(logger_config, com_port_config, bin_file,
-                                                    command_queue, response_queue, data_queue))
+        loop.run_until_complete(coro)
     except Exception as err:
         print(err)
     finally:
@@ -114,4 +214,36 @@ def start_telega_session(logger_config: LoggerConfig,
             loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
         loop.close()
 
+
+def start_telega_session(logger_config: LoggerConfig,
+                         com_port_config: ComPortConfig,
+                         bin_file: Path,
+                         command_queue: Queue,
+                         response_queue: Queue,
+                         data_queue: Queue,
+                         bus_metrics_period: Optional[float] = None):
+    """Функция, запускаемая в отдельном процессе
+    (точка входа для мультипроцессорной реализации)."""
+
+    _run_in_new_loop(_run_telega_session(logger_config, com_port_config, bin_file,
+                                         command_queue, response_queue, data_queue,
+                                         bus_metrics_period))
+
+
+def start_telega_replay(logger_config: LoggerConfig,
+                        replay_file: Path,
+                        command_queue: Queue,
+                        response_queue: Queue,
+                        data_queue: Queue,
+                        mode: ReplayMode = ReplayMode.FAST,
+                        speed: float = 1.0,
+                        sample_period: Optional[float] = None,
+                        bus_metrics_period: Optional[float] = None):
+    """Функция, запускаемая в отдельном процессе вместо start_telega_session
+    для воспроизведения записанного бинарного файла без МК."""
+
+    _run_in_new_loop(_run_telega_replay(logger_config, replay_file, command_queue,
+                                        response_queue, data_queue, mode, speed, sample_period,
+                                        bus_metrics_period))
+
 # =============================================================
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Схема протокола обмена с МК путеизмерительной тележки.
+
+Единственное место, где описаны заголовки, байты форматов, поля пакета
+данных и команды протокола Telega. Декодер (раскладка и dtype пакета
+данных), пакетный декодер .bin файлов, построители пакетов, ComPortTelega
+и эмулятор МК получают все константы отсюда.
+
+Константы:
+    TELEGA_DEVICE_SCHEMA: Посылки МК → ПК (данные и текстовые сообщения).
+    TELEGA_HOST_SCHEMA:   Посылки ПК → МК (команды) и готовые байты команд.
+"""
+
+# System imports
+
+# External imports
+
+# User imports
+from async_mc_controller.decoding import ProtocolSchema, PacketSchema, SchemaField, ChecksumKind
+
+#########################
+
+# Посылки МК → ПК
+TELEGA_DEVICE_SCHEMA = ProtocolSchema(
+    header=bytes([0x7E, 0xE7]),
+    packets=[
+        PacketSchema('data', 0xC8, (
+            SchemaField('package_num', 'I',  'PackageNum'),
+            SchemaField('acc',         '3f', 'Acc'),
+            SchemaField('gyro',        '3f', 'Gyro'),
+            SchemaField('temp',        'f',  'Temp'),
+            SchemaField('dpp_code',    'i',  'DppCode'),
+        )),
+        PacketSchema('message', 0xCD),
+    ],
+    checksum=ChecksumKind.SUM8,
+)
+
+# Посылки ПК → МК: заголовок — байты заголовка МК → ПК в обратном порядке
+TELEGA_HOST_SCHEMA = ProtocolSchema(
+    header=bytes([0xE7, 0x7E]),
+    packets=[
+        PacketSchema('command', 0xAB),
+    ],
+    checksum=ChecksumKind.SUM8,
+    commands={
+        'handshake_req':          ('command', b'HANDSHAKE_ACK'),
+        'heartbeat_req':          ('command', b'HEARTBEAT_ACK'),
+        'restart':                ('command', bytes([0xFF, 0xFF])),
+        'set_foo_stage':          ('command', bytes([0xAA, 0x00])),
+        'set_calibration_stage':  ('command', bytes([0xAA, 0x01])),
+        'set_measure_stage':      ('command', bytes([0xAA, 0x02])),
+        'set_static_init_stage':  ('command', bytes([0xAA, 0x03])),
+    },
+)